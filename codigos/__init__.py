@@ -1 +1 @@
-__all__ = ['bases', 'sistemaslineares', 'interpolacoes', 'ajustecurvas', 'integracoes', 'edos', 'raizes', 'calcnum', 'constants']
\ No newline at end of file
+__all__ = ['bases', 'sistemaslineares', 'interpolacoes', 'ajustecurvas', 'integracoes', 'edos', 'raizes', 'calcnum', 'constants', 'expressoes']
\ No newline at end of file
@@ -46,5 +46,6 @@ METODOS_CONFIG = {
     'max_subintervals': 10000,
     'default_h': 0.01,
     'min_h': 1e-12,
-    'max_h': 1.0
+    'max_h': 1.0,
+    'max_cache_expressoes': 256
 }
\ No newline at end of file
@@ -15,6 +15,7 @@ import sympy as sp
 from sympy import sin, cos, tan, asin, acos, atan, sinh, cosh, tanh, exp, sqrt, log, Abs, pi, E
 import re
 from .constants import SYMPY_LOCALS, SAFE_MATH
+from .expressoes import compilar_lambdify, compilar_eval
 
 def _validate_edo_inputs(func_input, x0, y0, h, xn, ordem=None):
     """Valida entradas para funções de resolução de EDOs.
@@ -222,14 +223,9 @@ def _create_function_from_string(func_str, variables, verbose=False):
     # Corrigir multiplicação implícita (ex.: 2x -> 2*x)
     func_str = re.sub(r'(\d)([a-zA-Z])', r'\1*\2', func_str)
 
-    # Criar símbolos do SymPy
-    symbols = sp.symbols(variables)
-    symbols_dict = dict(zip(variables, symbols))
-
     try:
-        # Tentar primeiro com SymPy (mais robusto)
-        expr = sp.sympify(func_str, locals={**SYMPY_LOCALS, **symbols_dict})
-        func = sp.lambdify(symbols, expr, modules=['numpy'])
+        # Tentar primeiro com SymPy (mais robusto); compilação reaproveitada do cache
+        func = compilar_lambdify(func_str, variables)
 
         # Teste rápido da função
         test_args = [1.0] * len(variables)
@@ -248,16 +244,11 @@ def _create_function_from_string(func_str, variables, verbose=False):
 
         # Fallback: usar eval com ambiente restrito
         try:
-            def func(*args):
-                if len(args) != len(variables):
-                    raise ValueError(f"Número incorreto de argumentos. Esperado: {len(variables)}, "
-                                   f"recebido: {len(args)}")
-
-                local_vars = dict(zip(variables, args))
-                local_vars.update({'np': np, 'math': math, **SAFE_MATH})
+            func_eval = compilar_eval(func_str, variables)
 
+            def func(*args):
                 try:
-                    return eval(func_str, {"__builtins__": None}, local_vars)
+                    return func_eval(*args)
                 except Exception as eval_error:
                     raise ValueError(f"Erro na avaliação da função: {eval_error}")
 
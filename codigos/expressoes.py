@@ -0,0 +1,401 @@
+"""
+Compilação e cache de expressões matemáticas fornecidas como string.
+
+Os módulos de raízes, integrações e EDOs recebem funções como texto
+(ex.: ``'x**2 - 4'``). Converter esse texto em uma função Python
+(``sympify`` + ``lambdify`` ou ``compile`` para ``eval``) custa alguns
+milissegundos; este módulo mantém um cache LRU compartilhado por todo o
+processo, de modo que cada expressão seja compilada apenas uma vez.
+
+A chave do cache é formada pelo tipo de compilação, pelo texto normalizado
+da expressão, pela tupla de variáveis e pelo backend do ``lambdify``.
+
+Author: Pedro Henrique Rocha de Andrade
+Date: Dezembro 2025
+"""
+
+from collections import OrderedDict
+import math
+import threading
+
+import numpy as np
+import sympy as sp
+from sympy.core.function import AppliedUndef
+from sympy.parsing.sympy_parser import parse_expr, standard_transformations, convert_xor
+
+from .constants import SYMPY_LOCALS, SAFE_MATH, METODOS_CONFIG
+
+# Namespace do parser do SymPy sem ``__builtins__``: ao contrário de
+# ``sympify``, o texto não consegue chamar ``__import__``, ``open``, etc.
+_GLOBAIS_SYMPY = {k: v for k, v in vars(sp).items() if not k.startswith('_')}
+_GLOBAIS_SYMPY['__builtins__'] = {}
+_TRANSFORMACOES = standard_transformations + (convert_xor,)
+
+
+class CacheExpressoes:
+    """Cache LRU limitado para expressões compiladas.
+
+    Parameters
+    ----------
+    capacidade : int
+        Número máximo de entradas mantidas; ao exceder, a entrada usada
+        há mais tempo é descartada.
+    """
+
+    def __init__(self, capacidade):
+        capacidade = int(capacidade)
+        if capacidade < 1:
+            raise ValueError("A capacidade do cache deve ser um inteiro positivo.")
+        self.capacidade = capacidade
+        self._dados = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._dados)
+
+    def obter(self, chave, construtor):
+        """Retorna o valor associado a ``chave``, construindo-o se necessário.
+
+        Parameters
+        ----------
+        chave : hashable
+            Chave da entrada.
+        construtor : callable
+            Função sem argumentos chamada em caso de *miss*. Exceções
+            levantadas por ela são propagadas e nada é armazenado.
+        """
+        with self._lock:
+            if chave in self._dados:
+                self._dados.move_to_end(chave)
+                self.hits += 1
+                return self._dados[chave]
+            self.misses += 1
+
+        # constrói fora do lock: sympify/lambdify podem ser lentos
+        valor = construtor()
+
+        with self._lock:
+            self._dados[chave] = valor
+            self._dados.move_to_end(chave)
+            while len(self._dados) > self.capacidade:
+                self._dados.popitem(last=False)
+                self.evictions += 1
+        return valor
+
+    def info(self):
+        """Retorna um dicionário com as estatísticas do cache."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'tamanho': len(self._dados),
+                'capacidade': self.capacidade,
+            }
+
+    def limpar(self):
+        """Remove todas as entradas e zera as estatísticas."""
+        with self._lock:
+            self._dados.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def redimensionar(self, capacidade):
+        """Altera a capacidade, descartando as entradas mais antigas se preciso."""
+        capacidade = int(capacidade)
+        if capacidade < 1:
+            raise ValueError("A capacidade do cache deve ser um inteiro positivo.")
+        with self._lock:
+            self.capacidade = capacidade
+            while len(self._dados) > self.capacidade:
+                self._dados.popitem(last=False)
+                self.evictions += 1
+
+
+# Cache global compartilhado por todos os módulos
+_CACHE = CacheExpressoes(METODOS_CONFIG['max_cache_expressoes'])
+
+
+def info_cache():
+    """Estatísticas do cache global de expressões (hits, misses, evictions...)."""
+    return _CACHE.info()
+
+
+def limpar_cache():
+    """Esvazia o cache global de expressões."""
+    _CACHE.limpar()
+
+
+def normalizar_expressao(expr):
+    """Normaliza o texto de uma expressão para uso como chave de cache.
+
+    Remove espaços nas extremidades e colapsa sequências de espaços internos.
+
+    Parameters
+    ----------
+    expr : str
+        Expressão matemática.
+
+    Returns
+    -------
+    str
+        Texto normalizado.
+    """
+    if not isinstance(expr, str):
+        raise TypeError("A expressão deve ser uma string.")
+    return ' '.join(expr.split())
+
+
+def _rejeitar_dunder(texto, expr):
+    # nomes como __class__ ou __import__ permitiriam escapar do ambiente restrito
+    if '__' in texto:
+        raise ValueError(f"Expressão inválida '{expr}': nomes com '__' não são permitidos.")
+
+def _modulos_lambdify(modulos):
+    # o printer de alguns nomes (log10, hypot, expm1...) gera ``math.<f>``
+    return [{'math': math}, modulos]
+
+def _lambdify_derivadas(simbolos, termos, modulos, expr):
+    """``lambdify`` de derivadas; falhas viram ``ValueError`` (permitindo o fallback numérico)."""
+    # funções sem regra de derivação (hypot, log10...) deixam Derivative não avaliada
+    if any(t.has(sp.Derivative) for t in sp.flatten(termos)):
+        raise ValueError(f"'{expr}' contém funções sem derivada simbólica conhecida.")
+    try:
+        return sp.lambdify(simbolos, termos, modules=_modulos_lambdify(modulos), cse=True)
+    except Exception as e:
+        raise ValueError(f"Não foi possível compilar as derivadas de '{expr}': {e}")
+
+def _normalizar_variaveis(variaveis):
+    if isinstance(variaveis, str):
+        return (variaveis,)
+    return tuple(str(v) for v in variaveis)
+
+
+def expressao_sympy(expr, variaveis=('x',)):
+    """Converte ``expr`` em expressão SymPy (com cache).
+
+    O prefixo ``math.`` é removido e os nomes de :data:`SYMPY_LOCALS`
+    são reconhecidos. O texto é interpretado sem acesso a ``__builtins__``
+    (diferente de ``sympify``) e nomes com ``__`` são recusados. Símbolos
+    livres que não estejam em ``variaveis`` são rejeitados, pois o
+    ``lambdify`` resultante falharia na chamada.
+
+    Parameters
+    ----------
+    expr : str
+        Expressão matemática (ex.: ``'sin(x) + x**2'``).
+    variaveis : sequence of str, optional
+        Nomes das variáveis independentes (padrão: ``('x',)``).
+
+    Returns
+    -------
+    sympy.Expr
+        Expressão simbólica.
+
+    Raises
+    ------
+    ValueError
+        Se a expressão não puder ser interpretada pelo SymPy.
+    """
+    texto = normalizar_expressao(expr).replace('math.', '')
+    _rejeitar_dunder(texto, expr)
+    variaveis = _normalizar_variaveis(variaveis)
+
+    def construir():
+        simbolos = sp.symbols(variaveis)
+        locais = {**SYMPY_LOCALS, **dict(zip(variaveis, simbolos))}
+        try:
+            fexpr = parse_expr(texto, local_dict=locais, global_dict=dict(_GLOBAIS_SYMPY),
+                               transformations=_TRANSFORMACOES)
+        except Exception as e:
+            raise ValueError(f"Não foi possível interpretar '{expr}' com SymPy: {e}")
+        if not isinstance(fexpr, sp.Basic):
+            raise ValueError(f"'{expr}' não é uma expressão matemática válida.")
+        # funções não definidas no SymPy só são aceitas se existirem em ``math``;
+        # outros nomes (open, exec...) seriam resolvidos como builtins pelo lambdify
+        desconhecidas = {type(g).__name__ for g in fexpr.atoms(AppliedUndef)} - set(SAFE_MATH)
+        if desconhecidas:
+            raise ValueError(f"Funções desconhecidas em '{expr}': {sorted(desconhecidas)}")
+        livres = {str(s) for s in fexpr.free_symbols} - set(variaveis)
+        if livres:
+            raise ValueError(f"Símbolos desconhecidos em '{expr}': {sorted(livres)}")
+        return fexpr
+
+    return _CACHE.obter(('sympy', texto, variaveis), construir)
+
+
+def compilar_lambdify(expr, variaveis=('x',), modulos='numpy'):
+    """Compila ``expr`` com ``sympify`` + ``lambdify`` (com cache).
+
+    Parameters
+    ----------
+    expr : str
+        Expressão matemática.
+    variaveis : sequence of str, optional
+        Nomes dos argumentos da função gerada, na ordem (padrão: ``('x',)``).
+    modulos : str, optional
+        Backend do ``lambdify``: ``'numpy'`` (vetorizado) ou ``'math'``
+        (escalar, mais rápido para chamadas ponto a ponto).
+
+    Returns
+    -------
+    callable
+        Função ``f(*variaveis)``.
+
+    Raises
+    ------
+    ValueError
+        Se a expressão não puder ser compilada.
+    """
+    texto = normalizar_expressao(expr).replace('math.', '')
+    variaveis = _normalizar_variaveis(variaveis)
+
+    def construir():
+        fexpr = expressao_sympy(texto, variaveis)
+        simbolos = sp.symbols(variaveis)
+        return sp.lambdify(simbolos, fexpr, modules=_modulos_lambdify(modulos))
+
+    return _CACHE.obter(('lambdify', texto, variaveis, modulos), construir)
+
+
+def compilar_eval(expr, variaveis=('x',)):
+    """Compila ``expr`` para avaliação com ``eval`` restrito (com cache).
+
+    O texto é compilado uma única vez para *bytecode*; a função retornada
+    apenas executa esse código em um ambiente sem ``__builtins__``,
+    contendo ``math``, ``np`` e as funções de :data:`SAFE_MATH`; nomes
+    com ``__`` são recusados.
+
+    Parameters
+    ----------
+    expr : str
+        Expressão Python (ex.: ``'math.exp(x) - 2'``).
+    variaveis : sequence of str, optional
+        Nomes dos argumentos posicionais da função gerada.
+
+    Returns
+    -------
+    callable
+        Função ``f(*variaveis)``.
+
+    Raises
+    ------
+    ValueError
+        Se o texto não for uma expressão Python válida.
+    """
+    texto = normalizar_expressao(expr)
+    _rejeitar_dunder(texto, expr)
+    variaveis = _normalizar_variaveis(variaveis)
+
+    def construir():
+        try:
+            codigo = compile(texto, '<expressao>', 'eval')
+        except SyntaxError as e:
+            raise ValueError(f"Expressão inválida '{expr}': {e}")
+        ambiente = {"__builtins__": None}
+        base = {"math": math, "np": np, **SAFE_MATH}
+
+        def func(*args):
+            if len(args) != len(variaveis):
+                raise ValueError(f"Número incorreto de argumentos. Esperado: {len(variaveis)}, "
+                                 f"recebido: {len(args)}")
+            return eval(codigo, ambiente, {**base, **dict(zip(variaveis, args))})
+
+        return func
+
+    return _CACHE.obter(('eval', texto, variaveis), construir)
+
+
+def compilar_derivadas(expr, ordem=1, variavel='x', modulos='math'):
+    """Compila ``f`` e suas derivadas até ``ordem`` em uma função fundida (com cache).
+
+    As derivadas são obtidas simbolicamente uma única vez; o ``lambdify``
+    usa eliminação de subexpressões comuns (``cse``), de forma que termos
+    compartilhados entre ``f``, ``f'``, ... sejam calculados uma só vez.
+
+    Parameters
+    ----------
+    expr : str
+        Expressão de uma variável.
+    ordem : int, optional
+        Maior ordem de derivada incluída (padrão: 1).
+    variavel : str or sequence of str, optional
+        Nome da variável independente (padrão: ``'x'``). Se for uma
+        sequência, as derivadas são tomadas em relação ao primeiro nome e os
+        demais são parâmetros, passados como argumentos adicionais.
+    modulos : str, optional
+        Backend do ``lambdify`` (``'math'`` ou ``'numpy'``).
+
+    Returns
+    -------
+    callable
+        Função ``g(x, *parametros)`` que retorna a tupla
+        ``(f(x), f'(x), ..., f^(ordem)(x))``.
+
+    Raises
+    ------
+    ValueError
+        Se a expressão não puder ser interpretada pelo SymPy ou contiver
+        funções sem derivada simbólica (ex.: ``hypot``); o chamador pode
+        então recorrer a diferenças finitas.
+    """
+    texto = normalizar_expressao(expr).replace('math.', '')
+    ordem = int(ordem)
+    if ordem < 0:
+        raise ValueError("A ordem da derivada deve ser não negativa.")
+    variaveis = _normalizar_variaveis(variavel)
+    if not variaveis:
+        raise ValueError("É necessário informar ao menos uma variável.")
+
+    def construir():
+        fexpr = expressao_sympy(texto, variaveis)
+        simbolos = sp.symbols(variaveis)
+        termos = [fexpr]
+        for _ in range(ordem):
+            termos.append(sp.diff(termos[-1], simbolos[0]))
+        return _lambdify_derivadas(simbolos, tuple(termos), modulos, expr)
+
+    return _CACHE.obter(('derivadas', texto, variaveis, ordem, modulos), construir)
+
+
+def compilar_sistema(exprs, variaveis, jacobiano=False, modulos='math'):
+    """Compila um sistema de expressões ``F = (f_1, ..., f_n)`` (com cache).
+
+    Parameters
+    ----------
+    exprs : sequence of str
+        Componentes do sistema.
+    variaveis : sequence of str
+        Nomes das incógnitas, na ordem dos argumentos.
+    jacobiano : bool, optional
+        Se True, retorna a função da matriz jacobiana ``dF_i/dx_j``
+        (obtida simbolicamente) em vez de ``F``.
+    modulos : str, optional
+        Backend do ``lambdify`` (padrão: ``'math'``).
+
+    Returns
+    -------
+    callable
+        Função ``g(*variaveis)`` que retorna a lista ``F`` ou a lista de
+        listas do jacobiano.
+
+    Raises
+    ------
+    ValueError
+        Se alguma componente não puder ser interpretada pelo SymPy ou, com
+        ``jacobiano=True``, não tiver derivadas simbólicas.
+    """
+    textos = tuple(normalizar_expressao(e).replace('math.', '') for e in exprs)
+    variaveis = _normalizar_variaveis(variaveis)
+
+    def construir():
+        simbolos = sp.symbols(variaveis)
+        componentes = sp.Matrix([expressao_sympy(t, variaveis) for t in textos])
+        alvo = componentes.jacobian(list(simbolos)).tolist() if jacobiano else list(componentes)
+        return _lambdify_derivadas(simbolos, alvo, modulos, ', '.join(exprs))
+
+    return _CACHE.obter(('sistema', textos, variaveis, bool(jacobiano), modulos), construir)
@@ -8,12 +8,12 @@ Author: Pedro Henrique Rocha de Andrade
 Date: Dezembro 2025
 """
 
-import math
 import numpy as np
 from sympy import symbols, integrate, sympify, diff, lambdify
 from sympy import sin, cos, tan, asin, acos, atan, sinh, cosh, tanh, exp, sqrt, log, Abs, pi, E
 import matplotlib.pyplot as plt
 from .constants import SYMPY_LOCALS
+from .expressoes import compilar_lambdify, compilar_eval, expressao_sympy
 
 
 def plotar_funcoes(funcs, a, b, pontos=400):
@@ -80,22 +80,22 @@ def plotar_funcao_e_aproximacao(func, a, b, m, metodo=None, pontos=400):
         print("matplotlib não está disponível. Instale com 'pip install matplotlib'.")
         return
 
-    x = symbols('x')
-    func_clean = func.replace('math.', '')
     xs = np.linspace(a, b, pontos)
 
     # tenta criar função vetorizada via sympy
     try:
-        fexpr = sympify(func_clean, locals=SYMPY_LOCALS)
-        ffunc = lambdify(x, fexpr, modules=['numpy'])
+        ffunc = compilar_lambdify(func)
         ys = ffunc(xs)
     except Exception:
-        # fallback para eval ponto-a-ponto
+        # fallback para eval ponto-a-ponto (compilado uma única vez)
+        try:
+            feval = compilar_eval(func)
+        except Exception:
+            feval = lambda xv: float('nan')
         ys = []
-        safe_math = {k: getattr(math, k) for k in dir(math) if not k.startswith("_")}
         for xv in xs:
             try:
-                yv = eval(func, {"__builtins__": None}, {"x": xv, "math": math, **safe_math})
+                yv = feval(xv)
             except Exception:
                 yv = float('nan')
             ys.append(yv)
@@ -120,11 +120,15 @@ def plotar_funcao_e_aproximacao(func, a, b, m, metodo=None, pontos=400):
         else:
             raise Exception()
     except Exception:
+        if 'feval' not in locals():
+            try:
+                feval = compilar_eval(func)
+            except Exception:
+                feval = lambda xv: float('nan')
         yi = []
-        safe_math = {k: getattr(math, k) for k in dir(math) if not k.startswith("_")}
         for xv in xi:
             try:
-                yv = eval(func, {"__builtins__": None}, {"x": xv, "math": math, **safe_math})
+                yv = feval(xv)
             except Exception:
                 yv = float('nan')
             yi.append(yv)
@@ -480,21 +484,23 @@ def newton_cotes(func, a, b, ordem, verbose=False, grafico=None):
     h = (b - a) / ordem
 
     # Tentar avaliação vetorizada com SymPy/lambdify
-    x_sym = symbols('x')
-    func_clean = func.replace('math.', '')
     try:
-        fexpr = sympify(func_clean, locals=SYMPY_LOCALS)
-        fvec = lambdify(x_sym, fexpr, modules=['numpy'])
+        fvec = compilar_lambdify(func)
         x = np.linspace(a, b, ordem + 1)
         y = np.asarray(fvec(x), dtype=float)
     except Exception:
         # Fallback ponto a ponto
         x = [a + i * h for i in range(ordem + 1)]
+        try:
+            feval = compilar_eval(func)
+        except Exception as e:
+            if verbose:
+                print(f"Erro ao compilar a função: {e}")
+            return None
         y = []
-        safe_math = {k: getattr(math, k) for k in dir(math) if not k.startswith("_")}
         for xi in x:
             try:
-                yi = eval(func, {"__builtins__": None}, {"x": xi, "math": math, **safe_math})
+                yi = feval(xi)
             except Exception as e:
                 if verbose:
                     print(f"Erro na avaliação da função em x={xi}: {e}")
@@ -554,20 +560,22 @@ def trapezio_composta(func, a, b, verbose=False, grafico=None):
         grafico = bool(verbose)
 
     # Tentar vetorizar avaliação via sympy
-    x_sym = symbols('x')
-    func_clean = func.replace('math.', '')
     try:
-        fexpr = sympify(func_clean, locals=SYMPY_LOCALS)
-        fvec = lambdify(x_sym, fexpr, modules=['numpy'])
+        fvec = compilar_lambdify(func)
         xi = np.linspace(a, b, m + 1)
         yi = np.asarray(fvec(xi), dtype=float)
     except Exception:
         xi = np.array([a + i * h for i in range(m + 1)], dtype=float)
+        try:
+            feval = compilar_eval(func)
+        except Exception as e:
+            if verbose:
+                print(f"Erro ao compilar a função: {e}")
+            return None
         yi = []
-        safe_math = {k: getattr(math, k) for k in dir(math) if not k.startswith("_")}
         for xv in xi:
             try:
-                yv = eval(func, {"__builtins__": None}, {"x": xv, "math": math, **safe_math})
+                yv = feval(xv)
             except Exception as e:
                 if verbose:
                     print(f"Erro na avaliação da função em x={xv}: {e}")
@@ -593,7 +601,7 @@ def trapezio_composta(func, a, b, verbose=False, grafico=None):
     if verbose:
         try:
             x = symbols('x')
-            func_expr = sympify(func_clean, locals=SYMPY_LOCALS)
+            func_expr = expressao_sympy(func)
             deriv2 = diff(func_expr, x, 2)
             deriv2_func = lambdify(x, deriv2, modules=["numpy"])  # vetoriza com numpy
             xs = np.linspace(a, b, 1000)
@@ -620,7 +628,7 @@ def trapezio_composta(func, a, b, verbose=False, grafico=None):
             if input("Deseja estimar o erro de truncamento? (s/n): ").strip().lower() == 's':
                 try:
                     x = symbols('x')
-                    func_expr = sympify(func_clean, locals=SYMPY_LOCALS)
+                    func_expr = expressao_sympy(func)
                     deriv2 = diff(func_expr, x, 2)
                     deriv2_func = lambdify(x, deriv2, modules=["numpy"])
                     xs = np.linspace(a, b, 1000)
@@ -662,20 +670,22 @@ def simpson_1_3_composta(func, a, b, verbose=False, grafico=None):
         grafico = bool(verbose)
 
     # Tentar vetorizar avaliação
-    x_sym = symbols('x')
-    func_clean = func.replace('math.', '')
     try:
-        fexpr = sympify(func_clean, locals=SYMPY_LOCALS)
-        fvec = lambdify(x_sym, fexpr, modules=['numpy'])
+        fvec = compilar_lambdify(func)
         xi = np.linspace(a, b, m + 1)
         yi = np.asarray(fvec(xi), dtype=float)
     except Exception:
         xi = np.array([a + i * h for i in range(m + 1)], dtype=float)
+        try:
+            feval = compilar_eval(func)
+        except Exception as e:
+            if verbose:
+                print(f"Erro ao compilar a função: {e}")
+            return None
         yi = []
-        safe_math = {k: getattr(math, k) for k in dir(math) if not k.startswith("_")}
         for xv in xi:
             try:
-                yv = eval(func, {"__builtins__": None}, {"x": xv, "math": math, **safe_math})
+                yv = feval(xv)
             except Exception as e:
                 if verbose:
                     print(f"Erro na avaliação da função em x={xv}: {e}")
@@ -699,7 +709,7 @@ def simpson_1_3_composta(func, a, b, verbose=False, grafico=None):
     if verbose:
         try:
             x = symbols('x')
-            func_expr = sympify(func_clean, locals=SYMPY_LOCALS)
+            func_expr = expressao_sympy(func)
             deriv4 = diff(func_expr, x, 4)
             deriv4_func = lambdify(x, deriv4, modules=["numpy"])
             xs = np.linspace(a, b, 1000)
@@ -724,7 +734,7 @@ def simpson_1_3_composta(func, a, b, verbose=False, grafico=None):
             if input("Deseja estimar o erro de truncamento? (s/n): ").strip().lower() == 's':
                 try:
                     x = symbols('x')
-                    func_expr = sympify(func_clean, locals=SYMPY_LOCALS)
+                    func_expr = expressao_sympy(func)
                     deriv4 = diff(func_expr, x, 4)
                     deriv4_func = lambdify(x, deriv4, modules=["numpy"])
                     xs = np.linspace(a, b, 1000)
@@ -763,20 +773,22 @@ def simpson_3_8_composta(func, a, b, verbose=False, grafico=None):
         grafico = bool(verbose)
 
     # Tentar vetorizar avaliação
-    x_sym = symbols('x')
-    func_clean = func.replace('math.', '')
     try:
-        fexpr = sympify(func_clean, locals=SYMPY_LOCALS)
-        fvec = lambdify(x_sym, fexpr, modules=['numpy'])
+        fvec = compilar_lambdify(func)
         xi = np.linspace(a, b, m + 1)
         yi = np.asarray(fvec(xi), dtype=float)
     except Exception:
         xi = np.array([a + i * h for i in range(m + 1)], dtype=float)
+        try:
+            feval = compilar_eval(func)
+        except Exception as e:
+            if verbose:
+                print(f"Erro ao compilar a função: {e}")
+            return None
         yi = []
-        safe_math = {k: getattr(math, k) for k in dir(math) if not k.startswith("_")}
         for xv in xi:
             try:
-                yv = eval(func, {"__builtins__": None}, {"x": xv, "math": math, **safe_math})
+                yv = feval(xv)
             except Exception as e:
                 if verbose:
                     print(f"Erro na avaliação da função em x={xv}: {e}")
@@ -808,7 +820,7 @@ def simpson_3_8_composta(func, a, b, verbose=False, grafico=None):
     if verbose:
         try:
             x = symbols('x')
-            func_expr = sympify(func_clean, locals=SYMPY_LOCALS)
+            func_expr = expressao_sympy(func)
             deriv4 = diff(func_expr, x, 4)
             deriv4_func = lambdify(x, deriv4, modules=["numpy"])
             xs = np.linspace(a, b, 1000)
@@ -833,7 +845,7 @@ def simpson_3_8_composta(func, a, b, verbose=False, grafico=None):
             if input("Deseja estimar o erro de truncamento? (s/n): ").strip().lower() == 's':
                 try:
                     x = symbols('x')
-                    func_expr = sympify(func_clean, locals=SYMPY_LOCALS)
+                    func_expr = expressao_sympy(func)
                     deriv4 = diff(func_expr, x, 4)
                     deriv4_func = lambdify(x, deriv4, modules=["numpy"])
                     xs = np.linspace(a, b, 1000)
@@ -280,6 +280,39 @@ def tabela_diferencas_divididas(x, y):
         tabela.append(coluna)
     return tabela
 
+def tabela_diferencas_divididas_vetorizada(x, y, max_ordem=None):
+    """Calcula a tabela de diferenças divididas com operações vetorizadas.
+
+    Mesmo layout de :func:`tabela_diferencas_divididas` (``tabela[j][i]`` é
+    ``f[x_i, ..., x_{i+j}]``), mas cada coluna é obtida de uma vez com NumPy
+    e a tabela pode ser truncada em ``max_ordem``. Útil para interpolação
+    local em tabelas grandes, em que só as ordens baixas são necessárias.
+
+    Parameters
+    ----------
+    x, y : sequence of float
+        Nós e valores correspondentes.
+    max_ordem : int, optional
+        Maior ordem calculada (padrão: ``len(x) - 1``).
+
+    Returns
+    -------
+    list of np.ndarray
+        Colunas da tabela; a coluna ``j`` tem ``len(x) - j`` elementos.
+    """
+    x, y = _validate_interpolation_inputs(x, y)
+    n = len(x)
+    if max_ordem is None:
+        max_ordem = n - 1
+    max_ordem = int(max_ordem)
+    if not 0 <= max_ordem <= n - 1:
+        raise ValueError(f"max_ordem deve estar entre 0 e {n - 1}. Recebido: {max_ordem}")
+    tabela = [y.copy()]
+    for j in range(1, max_ordem + 1):
+        anterior = tabela[-1]
+        tabela.append((anterior[1:] - anterior[:-1]) / (x[j:] - x[:-j]))
+    return tabela
+
 # impressao de tabela 
 def imprimir_tabela_diferencas_divididas(tabela, verbose=True):
     if not verbose:
@@ -9,8 +9,21 @@ Date: Dezembro 2025
 """
 
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 import math
+import cmath
+import contextlib
+import io
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+import sympy as sp
+from .expressoes import (compilar_eval, compilar_lambdify, compilar_derivadas, compilar_sistema,
+                         expressao_sympy)
+from .sistemaslineares import lu_com_pivot, forward_solve, backward_solve
+from .interpolacoes import tabela_diferencas_divididas_vetorizada
 
 # Função para converter a string em função executável (avaliação segura, restrita)
 def f(x, func_str):
@@ -20,8 +33,8 @@ def f(x, func_str):
     ----------
     x : float
         Valor de avaliação.
-    func_str : str
-        Expressão Python da função em x (ex.: 'x**2 - 4').
+    func_str : str or callable
+        Expressão Python da função em x (ex.: 'x**2 - 4') ou função já compilada.
 
     Returns
     -------
@@ -33,21 +46,223 @@ def f(x, func_str):
     ValueError
         Em caso de erro na avaliação.
     """
-    # Funções matemáticas permitidas (do módulo math)
-    safe_math = {k: getattr(math, k) for k in dir(math) if not k.startswith("_")}
+    if callable(func_str):
+        try:
+            return func_str(x)
+        except Exception as e:
+            raise ValueError(f"Erro ao avaliar função em x={x}: {e}")
+    # Expressão compilada uma única vez e reaproveitada pelo cache global
     try:
-        return eval(func_str, {"__builtins__": None}, {"x": x, "math": math, **safe_math})
+        return compilar_eval(func_str)(x)
     except Exception as e:
         raise ValueError(f"Erro ao avaliar função em x={x}: {e}")
 
+def _validar_potencia(func_str):
+    """Recusa ``^``: em :func:`f` (``eval``) ele não é potência, e os métodos devem concordar."""
+    if isinstance(func_str, str) and '^' in func_str:
+        raise ValueError(f"Expressão inválida '{func_str}': use '**' para potência ('^' não é aceito).")
+
+def compilar_funcao(func_str, vetorizada=False):
+    """Compila `func_str` uma única vez em uma função Python de ``x``.
+
+    Os métodos deste módulo chamam esta função no início de cada resolução,
+    de modo que as iterações avaliam um callable nativo em vez de
+    reinterpretar a string a cada passo.
+
+    Parameters
+    ----------
+    func_str : str or callable
+        Expressão de ``f(x)`` ou função já pronta (retornada sem alterações).
+    vetorizada : bool, optional
+        Se True, retorna uma função que aceita arrays NumPy (backend ``numpy``
+        do ``lambdify``); se False (padrão), uma função escalar baseada em
+        ``math``, que preserva os erros de domínio (ex.: ``log`` de negativo).
+
+    Returns
+    -------
+    callable
+        Função ``f(x)``.
+
+    Raises
+    ------
+    TypeError
+        Se ``func_str`` não for string nem callable.
+    ValueError
+        Se a expressão não puder ser compilada ou usar ``^`` (como em
+        :func:`f`, a potência é ``**``).
+    """
+    if callable(func_str):
+        return func_str
+    if not isinstance(func_str, str):
+        raise TypeError("func_str deve ser uma string ou um callable.")
+    _validar_potencia(func_str)
+
+    try:
+        fun = compilar_lambdify(func_str, modulos='numpy' if vetorizada else 'math')
+    except ValueError:
+        # Expressões que o SymPy não entende: bytecode do eval restrito
+        fun = compilar_eval(func_str)
+        if vetorizada:
+            return np.vectorize(fun, otypes=[float])
+        return fun
+
+    if not vetorizada:
+        return fun
+
+    def fun_vet(x):
+        x = np.asarray(x, dtype=float)
+        # expressões constantes devolvem escalar; expande para o formato de x
+        return np.broadcast_to(np.asarray(fun(x), dtype=float), x.shape)
+
+    return fun_vet
+
+# Histórico de convergência
+class HistoricoConvergencia:
+    """Registro opcional das iterações de um método de raízes.
+
+    Passe uma instância no argumento ``historico`` de :func:`bissecao`,
+    :func:`newton` ou :func:`secante`. O método pré-aloca arrays NumPy com
+    ``max_iter`` posições e, a cada iteração, apenas grava ``x_k``,
+    ``f(x_k)`` e o passo — sem formatar strings dentro do laço. A análise
+    (ordem empírica, tabela, gráfico) é feita depois.
+
+    Attributes
+    ----------
+    metodo : str
+        Nome do método que preencheu o histórico.
+    n : int
+        Número de iterações registradas.
+    """
+
+    def __init__(self):
+        self.metodo = ''
+        self.n = 0
+        self._x = np.empty(0)
+        self._fx = np.empty(0)
+        self._passo = np.empty(0)
+
+    def iniciar(self, capacidade, metodo=''):
+        """Pré-aloca espaço para ``capacidade`` iterações e descarta registros anteriores."""
+        capacidade = max(int(capacidade), 0)
+        self.metodo = metodo
+        self.n = 0
+        self._x = np.empty(capacidade)
+        self._fx = np.empty(capacidade)
+        self._passo = np.empty(capacidade)
+
+    def registrar(self, x, fx, passo):
+        """Grava uma iteração (ignorada se a capacidade já foi atingida)."""
+        if self.n < self._x.size:
+            self._x[self.n] = x
+            self._fx[self.n] = fx
+            self._passo[self.n] = passo
+            self.n += 1
+
+    @property
+    def x(self):
+        """Iterados ``x_k`` registrados."""
+        return self._x[:self.n]
+
+    @property
+    def fx(self):
+        """Valores ``f(x_k)`` registrados."""
+        return self._fx[:self.n]
+
+    @property
+    def passo(self):
+        """Passos (ou semiamplitude do intervalo, na bisseção) registrados."""
+        return self._passo[:self.n]
+
+    def ordens_convergencia(self):
+        """Estimativas empíricas da ordem ``q`` a cada iteração.
+
+        Usa os passos como estimativa do erro:
+        ``q_k = log(|s_{k+1}| / |s_k|) / log(|s_k| / |s_{k-1}|)``.
+        Passos no nível do arredondamento (``~eps * |x_k|``) não carregam
+        informação sobre a ordem; estimativas que os envolvem, assim como
+        as impossíveis (passos nulos), ficam com ``nan``.
+        """
+        s = np.abs(self.passo)
+        s[s <= 100 * np.finfo(float).eps * np.maximum(np.abs(self.x), 1.0)] = np.nan
+        if s.size < 3:
+            return np.array([])
+        with np.errstate(all='ignore'):
+            q = np.log(s[2:] / s[1:-1]) / np.log(s[1:-1] / s[:-2])
+        q[~np.isfinite(q)] = np.nan
+        return q
+
+    def ordem_convergencia(self):
+        """Ordem empírica de convergência (última estimativa válida) ou ``nan``."""
+        q = self.ordens_convergencia()
+        validas = q[np.isfinite(q)]
+        return float(validas[-1]) if validas.size else float('nan')
+
+    def tabela(self):
+        """Texto com uma linha por iteração (``k``, ``x_k``, ``f(x_k)``, passo)."""
+        linhas = [f"{'k':>4} {'x_k':>22} {'f(x_k)':>14} {'passo':>14}"]
+        for k in range(self.n):
+            linhas.append(f"{k + 1:>4} {self._x[k]:>22.15g} {self._fx[k]:>14.6e} {self._passo[k]:>14.6e}")
+        return "\n".join(linhas)
+
+    def __str__(self):
+        titulo = f"Histórico de convergência ({self.metodo})" if self.metodo else "Histórico de convergência"
+        return f"{titulo}\n{self.tabela()}\nOrdem empírica: {self.ordem_convergencia():.4f}"
+
+    def plotar(self, arquivo=None):
+        """Plota ``|f(x_k)|`` e ``|passo|`` em escala logarítmica.
+
+        Se ``arquivo`` for informado, a figura é renderizada com o backend
+        Agg e salva em vez de exibida.
+        """
+        k = np.arange(1, self.n + 1)
+        if arquivo is not None:
+            fig = _nova_figura_agg()
+            ax = fig.add_subplot()
+        else:
+            plt.figure()
+            ax = plt.gca()
+        ax.semilogy(k, np.abs(self.fx), 'o-', label='|f(x_k)|')
+        ax.semilogy(k, np.abs(self.passo), 's--', label='|passo|')
+        ax.set_xlabel('iteração')
+        ax.set_title(self.metodo or 'Convergência')
+        ax.legend()
+        ax.grid(True)
+        if arquivo is not None:
+            fig.savefig(arquivo)
+        else:
+            plt.show()
+
 # Função para plotar gráfico
-def plotar_funcao(func_str, a=None, b=None, raiz=None, grafico=None, verbose=False):
+def _nova_figura_agg():
+    """Cria figura desenhada pelo backend Agg, independente do backend do pyplot."""
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig
+
+def _desenhar_funcao(ax, x_vals, y_vals, rotulo, raiz=None, y_raiz=None):
+    """Desenha f(x), os eixos e (opcionalmente) a raiz em ``ax``."""
+    ax.axhline(0, color="black", linewidth=1)
+    ax.axvline(0, color="black", linewidth=1)
+    ax.plot(x_vals, y_vals, label=f"f(x) = {rotulo}")
+    if raiz is not None and y_raiz is not None and np.isfinite(y_raiz):
+        ax.scatter(raiz, y_raiz, color="red", zorder=5, label=f"Raiz ≈ {raiz:.6f}")
+    ax.set_xlabel("x")
+    ax.set_ylabel("f(x)")
+    ax.legend()
+    ax.grid(True)
+
+def plotar_funcao(func_str, a=None, b=None, raiz=None, grafico=None, verbose=False,
+                  arquivo=None, pontos=400):
     """Plota a função `f(x)` opcionalmente mostrando a raiz.
 
+    A função é compilada uma vez e avaliada de forma vetorizada sobre todo
+    o ``linspace``; pontos fora do domínio (``log`` de negativo, divisão
+    por zero, ...) viram ``nan`` e aparecem como lacunas na curva.
+
     Parameters
     ----------
-    func_str : str
-        Expressão Python de ``f(x)``.
+    func_str : str or callable
+        Expressão Python de ``f(x)`` ou função já compilada.
     a, b : float, optional
         Intervalo de plotagem (padrão: [-10, 10] se None).
     raiz : float, optional
@@ -56,6 +271,11 @@ def plotar_funcao(func_str, a=None, b=None, raiz=None, grafico=None, verbose=Fal
         Controla se o gráfico será exibido. Se None, segue ``verbose`` (True mostra o gráfico).
     verbose : bool, optional
         Habilita saídas e, por padrão, ativa o gráfico.
+    arquivo : str or path-like, optional
+        Se informado, a figura é renderizada com o backend Agg e salva nesse
+        arquivo (sem abrir janelas), independentemente de ``grafico``.
+    pontos : int, optional
+        Número de pontos de avaliação (padrão: 400).
     """
     if grafico is None:
         grafico = bool(verbose)
@@ -64,34 +284,36 @@ def plotar_funcao(func_str, a=None, b=None, raiz=None, grafico=None, verbose=Fal
         a, b = -10, 10
 
     # Se grafico for False, não tenta abrir janelas em ambientes não interativos
-    if not grafico:
+    if not grafico and arquivo is None:
         return
 
-    x_vals = np.linspace(a, b, 400)
-    # avalia ponto-a-ponto usando nossa função segura
-    y_vals = []
-    for xv in x_vals:
-        try:
-            y_vals.append(f(xv, func_str))
-        except Exception:
-            y_vals.append(float('nan'))
+    x_vals = np.linspace(a, b, int(pontos))
+    try:
+        fun = compilar_funcao(func_str, vetorizada=True)
+        y_vals = _avaliar_malha(fun, x_vals)
+    except Exception as e:
+        if verbose:
+            print(f"Aviso: não foi possível avaliar a função: {e}")
+        fun = None
+        y_vals = np.full(x_vals.shape, np.nan)
 
-    plt.figure()
-    plt.axhline(0, color="black", linewidth=1)
-    plt.axvline(0, color="black", linewidth=1)
-    plt.plot(x_vals, y_vals, label=f"f(x) = {func_str}")
+    y_raiz = None
+    if raiz is not None and fun is not None:
+        y_raiz = _avaliar_malha(fun, np.array([float(raiz)]))[0]
 
-    if raiz is not None:
-        try:
-            plt.scatter(raiz, f(raiz, func_str), color="red", zorder=5, label=f"Raiz ≈ {raiz:.6f}")
-        except Exception:
-            # ignora erro em ponto de plotagem
-            pass
+    rotulo = func_str if isinstance(func_str, str) else getattr(func_str, '__name__', 'f')
+
+    if arquivo is not None:
+        fig = _nova_figura_agg()
+        _desenhar_funcao(fig.add_subplot(), x_vals, y_vals, rotulo, raiz, y_raiz)
+        fig.savefig(arquivo)
+        if verbose:
+            print(f"Gráfico salvo em {arquivo}")
+        if not grafico:
+            return
 
-    plt.xlabel("x")
-    plt.ylabel("f(x)")
-    plt.legend()
-    plt.grid(True)
+    plt.figure()
+    _desenhar_funcao(plt.gca(), x_vals, y_vals, rotulo, raiz, y_raiz)
     try:
         plt.show()
     except Exception:
@@ -100,13 +322,13 @@ def plotar_funcao(func_str, a=None, b=None, raiz=None, grafico=None, verbose=Fal
             print("Aviso: matplotlib não conseguiu exibir o gráfico.")
 
 # Método da Bisseção
-def bissecao(func_str, a, b, tol, max_iter, verbose=False, grafico=None):
+def bissecao(func_str, a, b, tol, max_iter, verbose=False, grafico=None, historico=None):
     """Método da bisseção para encontrar raiz de uma função dada por string.
 
     Parameters
     ----------
-    func_str : str
-        Expressão Python de ``f(x)`` (ex.: ``'x**2 - 4'``).
+    func_str : str or callable
+        Expressão Python de ``f(x)`` (ex.: ``'x**2 - 4'``) ou função já compilada.
     a, b : float
         Intervalo inicial [a, b] com sinais opostos.
     tol : float
@@ -117,6 +339,8 @@ def bissecao(func_str, a, b, tol, max_iter, verbose=False, grafico=None):
         Se ``True``, imprime detalhes de cada iteração e ativa o gráfico por padrão.
     grafico : bool or None, optional
         Controla plotagem: se ``None`` e ``verbose`` for True, o gráfico é mostrado.
+    historico : HistoricoConvergencia, optional
+        Se informado, recebe o registro das iterações (ver :class:`HistoricoConvergencia`).
 
     Returns
     -------
@@ -133,8 +357,9 @@ def bissecao(func_str, a, b, tol, max_iter, verbose=False, grafico=None):
         grafico = bool(verbose)
 
     try:
-        fa = f(a, func_str)
-        fb = f(b, func_str)
+        fun = compilar_funcao(func_str)
+        fa = fun(a)
+        fb = fun(b)
     except Exception as e:
         print(f"Erro na avaliação nos extremos: {e}")
         return None, 0
@@ -143,13 +368,17 @@ def bissecao(func_str, a, b, tol, max_iter, verbose=False, grafico=None):
         print("Erro: f(a) e f(b) devem ter sinais opostos.")
         return None, 0
 
+    if historico is not None:
+        historico.iniciar(max_iter, 'Bisseção')
     for i in range(1, max_iter + 1):
         c = (a + b) / 2
         try:
-            fc = f(c, func_str)
+            fc = fun(c)
         except Exception as e:
             print(f"Erro ao avaliar f(c): {e}")
             return None, i
+        if historico is not None:
+            historico.registrar(c, fc, (b - a) / 2)
         if verbose:
             print(f"[Bisseção] Iter {i}: x = {c:.6f}, f(x) = {fc:.6f}")
         if abs(fc) < tol or abs(b - a) < tol:
@@ -163,14 +392,483 @@ def bissecao(func_str, a, b, tol, max_iter, verbose=False, grafico=None):
             fa = fc
     return c, max_iter
 
+# Bisseção em lote (vários intervalos simultâneos)
+def bissecao_vetorizada(func_str, a, b, tol, max_iter, fa=None, fb=None):
+    """Método da bisseção aplicado a vários intervalos ``[a_i, b_i]`` de uma vez.
+
+    Todos os intervalos avançam juntos: a cada iteração a função é avaliada
+    uma única vez sobre o array de pontos médios ainda ativos, e máscaras
+    NumPy decidem qual extremidade é substituída. O critério de parada é o
+    mesmo de :func:`bissecao` (``|f(c)| < tol`` ou ``|b - a| < tol``).
+
+    Parameters
+    ----------
+    func_str : str or callable
+        Expressão de ``f(x)`` ou função vetorizada (aceita arrays NumPy).
+    a, b : array_like
+        Extremidades dos intervalos (difundidas para o mesmo formato).
+    tol : float
+        Tolerância para critério de parada.
+    max_iter : int
+        Número máximo de iterações.
+    fa, fb : array_like, optional
+        Valores de ``f`` já conhecidos em ``a`` e ``b`` (ex.: de uma malha
+        avaliada previamente); se omitidos, são calculados.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray, np.ndarray)
+        Tupla ``(raizes, n_iter, convergiu)`` com o formato de ``a``/``b``.
+        Intervalos sem troca de sinal (ou com avaliação inválida) recebem
+        raiz ``nan``, ``n_iter = 0`` e ``convergiu = False``.
+    """
+    try:
+        a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+        tol = float(tol); max_iter = int(max_iter)
+    except Exception:
+        raise TypeError("a, b devem ser arrays numéricos compatíveis, tol numérico e max_iter inteiro")
+
+    formato = a.shape
+    a = a.ravel().copy()
+    b = b.ravel().copy()
+    fun = compilar_funcao(func_str, vetorizada=True)
+
+    with np.errstate(all='ignore'):
+        fa = np.array(fun(a) if fa is None else np.broadcast_to(fa, formato).ravel(), dtype=float)
+        fb = np.array(fun(b) if fb is None else np.broadcast_to(fb, formato).ravel(), dtype=float)
+
+    raizes = np.full(a.shape, np.nan)
+    n_iter = np.zeros(a.shape, dtype=int)
+    convergiu = np.zeros(a.shape, dtype=bool)
+    ativo = fa * fb < 0  # nan resulta em False
+
+    for i in range(1, max_iter + 1):
+        idx = np.flatnonzero(ativo)
+        if idx.size == 0:
+            break
+        c = (a[idx] + b[idx]) / 2
+        with np.errstate(all='ignore'):
+            fc = np.array(fun(c), dtype=float)
+        raizes[idx] = c
+        n_iter[idx] = i
+
+        invalido = ~np.isfinite(fc)
+        parou = ~invalido & ((np.abs(fc) < tol) | (np.abs(b[idx] - a[idx]) < tol))
+        convergiu[idx[parou]] = True
+        ativo[idx[parou | invalido]] = False
+
+        esquerda = fa[idx] * fc < 0
+        direita = ~esquerda
+        b[idx[esquerda]] = c[esquerda]
+        a[idx[direita]] = c[direita]
+        fa[idx[direita]] = fc[direita]
+
+    return raizes.reshape(formato), n_iter.reshape(formato), convergiu.reshape(formato)
+
+# Busca de todas as raízes em um intervalo
+def _avaliar_malha(fun, x):
+    """Avalia ``fun`` vetorizada em ``x``, trocando valores inválidos por ``nan``."""
+    with np.errstate(all='ignore'):
+        try:
+            y = np.array(fun(x), dtype=float)
+        except Exception:
+            y = np.array([_avaliar_ponto(fun, xv) for xv in x], dtype=float)
+    y[~np.isfinite(y)] = np.nan
+    return y
+
+def _avaliar_ponto(fun, x):
+    try:
+        return float(fun(x))
+    except Exception:
+        return float('nan')
+
+def _minimos_sem_troca(y):
+    """Índices internos de mínimos locais de ``|y|`` sem troca de sinal vizinha.
+
+    Amostras exatamente nulas também entram quando as amostras não nulas
+    mais próximas de cada lado têm o mesmo sinal: sem troca de sinal através
+    do zero, há outra raiz (ou uma raiz de multiplicidade par) nas células
+    vizinhas.
+    """
+    if y.size < 3:
+        return np.array([], dtype=int)
+    ay = np.abs(y)
+    centro, esq, dir_ = ay[1:-1], ay[:-2], ay[2:]
+    mesmo_sinal = (y[:-2] * y[1:-1] > 0) & (y[1:-1] * y[2:] > 0)
+    minimos = mesmo_sinal & (centro <= esq) & (centro <= dir_)
+
+    nao_nulos = np.flatnonzero(y != 0)
+    if nao_nulos.size:
+        k = np.searchsorted(nao_nulos, np.arange(1, y.size - 1))
+        interno = (k > 0) & (k < nao_nulos.size)
+        esq_nz = y[nao_nulos[np.clip(k - 1, 0, None)]]
+        dir_nz = y[nao_nulos[np.clip(k, None, nao_nulos.size - 1)]]
+        minimos |= (centro == 0) & interno & (esq_nz * dir_nz > 0)
+    return np.flatnonzero(minimos) + 1
+
+def encontrar_raizes(func_str, a, b, tol, max_iter, n_pontos=400, niveis=3, tol_zero=1e-8):
+    """Encontra todas as raízes de ``f`` em ``[a, b]``.
+
+    1. Avalia ``f`` vetorizada em uma malha uniforme de ``n_pontos`` pontos.
+    2. Refina a malha (``niveis`` vezes) ao redor de mínimos locais de
+       ``|f|`` sem troca de sinal, onde podem se esconder duas raízes
+       próximas ou uma raiz de multiplicidade par. Uma amostra exatamente
+       nula é uma raiz; se não há troca de sinal através dela, as células
+       vizinhas também são refinadas. Só os pontos novos são avaliados.
+    3. Todas as trocas de sinal são refinadas de uma vez com
+       :func:`bissecao_vetorizada`, reaproveitando os valores da malha.
+       Trocas causadas por polos são descartadas: o resíduo ``|f(r)|`` no
+       ponto obtido não pode superar ``|f|`` nos extremos do subintervalo.
+    4. Mínimos restantes são refinados por seção áurea (vetorizada) sobre
+       ``|f|``; são aceitos como raízes de multiplicidade par quando
+       ``|f(x)| <= tol_zero``.
+
+    Parameters
+    ----------
+    func_str : str or callable
+        Expressão de ``f(x)`` ou função vetorizada.
+    a, b : float
+        Intervalo de busca (``a < b``).
+    tol : float
+        Tolerância em ``x`` para o refinamento das raízes.
+    max_iter : int
+        Número máximo de iterações do refinamento.
+    n_pontos : int, optional
+        Pontos da malha inicial (padrão: 400).
+    niveis : int, optional
+        Número de rodadas de refinamento adaptativo da malha (padrão: 3).
+    tol_zero : float, optional
+        Limiar de ``|f|`` para aceitar um mínimo sem troca de sinal como raiz.
+
+    Returns
+    -------
+    np.ndarray
+        Raízes encontradas, em ordem crescente (array vazio se nenhuma).
+
+    Notes
+    -----
+    Raízes separadas por menos que o espaçamento da malha refinada podem
+    não ser detectadas; aumente ``n_pontos`` ou ``niveis`` nesses casos.
+    """
+    try:
+        a = float(a); b = float(b); tol = float(tol); max_iter = int(max_iter)
+        n_pontos = int(n_pontos); niveis = int(niveis); tol_zero = float(tol_zero)
+    except Exception:
+        raise TypeError("a, b, tol, tol_zero devem ser numéricos e max_iter, n_pontos, niveis inteiros")
+    if not a < b:
+        raise ValueError("É necessário a < b.")
+    if n_pontos < 3:
+        raise ValueError("n_pontos deve ser pelo menos 3.")
+
+    fun = compilar_funcao(func_str, vetorizada=True)
+
+    xs = np.linspace(a, b, n_pontos)
+    ys = _avaliar_malha(fun, xs)
+
+    # Refinamento adaptativo ao redor de mínimos de |f| sem troca de sinal
+    for _ in range(niveis):
+        idx = _minimos_sem_troca(ys)
+        if idx.size == 0:
+            break
+        novos = np.unique(np.concatenate([(xs[idx - 1] + xs[idx]) / 2, (xs[idx] + xs[idx + 1]) / 2]))
+        xs = np.concatenate([xs, novos])
+        ys = np.concatenate([ys, _avaliar_malha(fun, novos)])
+        ordem = np.argsort(xs, kind='mergesort')
+        xs, ys = xs[ordem], ys[ordem]
+
+    encontradas = [xs[ys == 0]]
+
+    # Trocas de sinal: bisseção em lote sobre todos os intervalos
+    troca = np.flatnonzero(ys[:-1] * ys[1:] < 0)
+    if troca.size:
+        fa, fb = ys[troca], ys[troca + 1]
+        r, _, ok = bissecao_vetorizada(fun, xs[troca], xs[troca + 1], tol, max_iter, fa=fa, fb=fb)
+        # Polos (tan, 1/x) também trocam de sinal: a bisseção converge para
+        # eles com |f| crescendo. Só aceita se o resíduo não supera os extremos.
+        residuo = np.abs(_avaliar_malha(fun, r))
+        ok &= (residuo <= tol_zero) | (residuo <= np.maximum(np.abs(fa), np.abs(fb)))
+        encontradas.append(r[ok])
+
+    # Mínimos sem troca de sinal: seção áurea vetorizada sobre |f|
+    # (zeros exatos da malha já foram registrados)
+    idx = _minimos_sem_troca(ys)
+    idx = idx[ys[idx] != 0]
+    if idx.size:
+        lo, hi = xs[idx - 1].copy(), xs[idx + 1].copy()
+        razao = (math.sqrt(5) - 1) / 2
+        for _ in range(max_iter):
+            if np.max(hi - lo) < tol:
+                break
+            c = hi - razao * (hi - lo)
+            d = lo + razao * (hi - lo)
+            fc = np.abs(_avaliar_malha(fun, c))
+            fd = np.abs(_avaliar_malha(fun, d))
+            esquerda = ~(fc > fd)  # nan em d também mantém a metade esquerda
+            hi = np.where(esquerda, d, hi)
+            lo = np.where(esquerda, lo, c)
+        xm = (lo + hi) / 2
+        fm = np.abs(_avaliar_malha(fun, xm))
+        encontradas.append(xm[fm <= tol_zero])
+
+    raizes_ = np.sort(np.concatenate(encontradas))
+    if raizes_.size > 1:
+        raizes_ = raizes_[np.concatenate([[True], np.diff(raizes_) > 10 * tol])]
+    return raizes_
+
+def _abrir_sinal(caminho, dtype):
+    """Abre ``caminho`` como array 1D mapeado em memória (``.npy`` ou binário bruto)."""
+    if str(caminho).endswith('.npy'):
+        sinal = np.load(caminho, mmap_mode='r')
+    else:
+        sinal = np.memmap(caminho, dtype=dtype, mode='r')
+    if sinal.ndim != 1:
+        raise ValueError(f"O sinal deve ser 1D. Recebido: shape {sinal.shape}")
+    return sinal
+
+def _cruzamentos_em_blocos(sinal, x0, dx, tamanho_bloco, tol_zero):
+    """Gera, bloco a bloco, as raízes de um sinal amostrado em ``x0 + i*dx``.
+
+    O último valor de cada bloco é levado ao bloco seguinte, para que uma
+    troca de sinal entre blocos vizinhos não se perca.
+    """
+    n = sinal.shape[0]
+    ultimo = None  # valor da última amostra do bloco anterior
+    for inicio in range(0, n, tamanho_bloco):
+        y = np.array(sinal[inicio:inicio + tamanho_bloco], dtype=float)
+        y[np.abs(y) <= tol_zero] = 0.0
+        primeiro = inicio
+        if ultimo is not None:
+            y = np.concatenate([[ultimo], y])
+            primeiro = inicio - 1
+        ultimo = y[-1]
+
+        zeros = np.flatnonzero(y == 0)
+        if primeiro != inicio:
+            zeros = zeros[zeros > 0]  # a amostra levada já foi reportada no bloco anterior
+        troca = np.flatnonzero(y[:-1] * y[1:] < 0)
+        # secante (interpolação linear) entre as amostras que trocam de sinal
+        with np.errstate(all='ignore'):
+            frac = y[troca] / (y[troca] - y[troca + 1])
+        raizes_ = np.concatenate([(primeiro + zeros) * dx + x0,
+                                  (primeiro + troca + frac) * dx + x0])
+        if raizes_.size:
+            yield np.sort(raizes_)
+
+def raizes_sinal_arquivo(caminho, x0=0.0, dx=1.0, dtype='float64', tamanho_bloco=1_000_000,
+                         tol_zero=0.0):
+    """Encontra todos os cruzamentos por zero de um sinal amostrado gravado em disco.
+
+    O arquivo é mapeado em memória (``np.memmap`` / ``np.load(mmap_mode='r')``)
+    e percorrido em blocos de ``tamanho_bloco`` amostras, de modo que sinais
+    maiores que a memória disponível possam ser processados. Em cada bloco as
+    trocas de sinal são localizadas de forma vetorizada e refinadas por
+    interpolação linear (secante) entre as duas amostras vizinhas; trocas que
+    ocorrem entre o fim de um bloco e o início do seguinte também são
+    detectadas.
+
+    Como em :func:`encontrar_raizes`, amostras exatamente nulas são raízes;
+    ``tol_zero`` permite tratar como nulas amostras com ``|y| <= tol_zero``.
+
+    Parameters
+    ----------
+    caminho : str or path-like
+        Arquivo ``.npy`` ou binário bruto de números de ponto flutuante.
+    x0 : float, optional
+        Abscissa da primeira amostra (padrão: 0.0).
+    dx : float, optional
+        Espaçamento entre amostras (padrão: 1.0).
+    dtype : str or np.dtype, optional
+        Tipo das amostras em arquivos brutos (padrão: ``'float64'``);
+        ignorado para ``.npy``, que guarda o próprio tipo.
+    tamanho_bloco : int, optional
+        Número de amostras lidas por bloco (padrão: 1.000.000).
+    tol_zero : float, optional
+        Limiar de ``|y|`` abaixo do qual a amostra é considerada nula
+        (padrão: 0.0).
+
+    Returns
+    -------
+    np.ndarray
+        Abscissas dos cruzamentos, em ordem crescente (array vazio se nenhum).
+
+    Raises
+    ------
+    TypeError
+        Se os parâmetros numéricos forem inválidos.
+    ValueError
+        Se ``dx`` ou ``tamanho_bloco`` não forem positivos ou o arquivo não
+        contiver um sinal 1D.
+    """
+    try:
+        x0 = float(x0); dx = float(dx); tamanho_bloco = int(tamanho_bloco)
+        tol_zero = float(tol_zero)
+    except Exception:
+        raise TypeError("x0, dx, tol_zero devem ser numéricos e tamanho_bloco inteiro")
+    if dx <= 0:
+        raise ValueError("dx deve ser positivo.")
+    if tamanho_bloco < 1:
+        raise ValueError("tamanho_bloco deve ser um inteiro positivo.")
+
+    sinal = _abrir_sinal(caminho, dtype)
+    partes = list(_cruzamentos_em_blocos(sinal, x0, dx, tamanho_bloco, tol_zero))
+    if not partes:
+        return np.array([], dtype=float)
+    return np.concatenate(partes)
+
+# Método do Ponto Fixo
+def _iterar_ponto_fixo(g, x, tol, max_iter, aceleracao, verbose=False):
+    """Itera ``x = g(x)`` sobre um array de pontos, com máscara de pontos ativos."""
+    n_iter = np.zeros(x.shape, dtype=int)
+    convergiu = np.zeros(x.shape, dtype=bool)
+    ativo = np.isfinite(x)
+    for i in range(1, max_iter + 1):
+        idx = np.flatnonzero(ativo)
+        if idx.size == 0:
+            break
+        xa = x[idx]
+        with np.errstate(all='ignore'):
+            x1 = np.array(g(xa), dtype=float)
+            if aceleracao == 'aitken':
+                # Aitken Δ²: x* ≈ x0 - (x1 - x0)² / (x2 - 2 x1 + x0)
+                x2 = np.array(g(x1), dtype=float)
+                den = x2 - 2 * x1 + xa
+                ok = (den != 0) & np.isfinite(den)
+                novo = np.where(ok, xa - (x1 - xa) ** 2 / np.where(ok, den, 1.0), x2)
+            else:
+                novo = x1
+        x[idx] = novo
+        n_iter[idx] = i
+        if verbose and x.size == 1:
+            print(f"[Ponto Fixo] Iter {i}: x = {novo[0]:.6f}")
+        invalido = ~np.isfinite(novo)
+        parou = ~invalido & (np.abs(novo - xa) < tol)
+        convergiu[idx[parou]] = True
+        ativo[idx[parou | invalido]] = False
+    return x, n_iter, convergiu
+
+def _validar_aceleracao(aceleracao):
+    if aceleracao not in (None, 'aitken'):
+        raise ValueError("aceleracao deve ser None ou 'aitken'.")
+
+def ponto_fixo(g_str, x0, tol, max_iter, aceleracao=None, verbose=False):
+    """Método do ponto fixo ``x_{k+1} = g(x_k)``.
+
+    Com ``aceleracao='aitken'`` cada passo aplica o processo Δ² de Aitken
+    a duas iterações de ``g`` (método de Steffensen para ponto fixo), o que
+    torna quadrática uma iteração linearmente convergente.
+
+    Parameters
+    ----------
+    g_str : str or callable
+        Expressão Python de ``g(x)`` (ex.: ``'cos(x)'``) ou função já compilada.
+    x0 : float
+        Chute inicial.
+    tol : float
+        Tolerância para critério de parada (``|x_{k+1} - x_k| < tol``).
+    max_iter : int
+        Número máximo de iterações.
+    aceleracao : {None, 'aitken'}, optional
+        Aceleração da convergência (padrão: nenhuma).
+    verbose : bool, optional
+        Se True imprime detalhes de cada iteração.
+
+    Returns
+    -------
+    (float, int)
+        Tupla (ponto_fixo_aproximado, n_iter) ou (None, n_iter) se a iteração
+        produzir valor inválido (ex.: divergência).
+    """
+    try:
+        x0 = float(x0); tol = float(tol); max_iter = int(max_iter)
+    except Exception:
+        raise TypeError("x0 e tol devem ser numéricos e max_iter deve ser inteiro")
+    _validar_aceleracao(aceleracao)
+
+    try:
+        g = compilar_funcao(g_str, vetorizada=True)
+    except Exception as e:
+        print(f"Erro ao compilar a função: {e}")
+        return None, 0
+
+    x, n_iter, _ = _iterar_ponto_fixo(g, np.array([x0]), tol, max_iter, aceleracao, verbose)
+    if not np.isfinite(x[0]):
+        print("Erro: a iteração de ponto fixo produziu valor inválido (possível divergência).")
+        return None, int(n_iter[0])
+    return float(x[0]), int(n_iter[0])
+
+def ponto_fixo_vetorizado(g_str, x0, tol, max_iter, aceleracao=None):
+    """Método do ponto fixo aplicado a vários chutes iniciais de uma vez.
+
+    A cada iteração ``g`` é avaliada uma única vez (duas com Aitken) sobre o
+    array dos pontos ainda ativos.
+
+    Parameters
+    ----------
+    g_str : str or callable
+        Expressão de ``g(x)`` ou função vetorizada (aceita arrays NumPy).
+    x0 : array_like
+        Chutes iniciais.
+    tol : float
+        Tolerância para critério de parada.
+    max_iter : int
+        Número máximo de iterações.
+    aceleracao : {None, 'aitken'}, optional
+        Aceleração da convergência (padrão: nenhuma).
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray, np.ndarray)
+        Tupla ``(pontos, n_iter, convergiu)`` com o formato de ``x0``.
+        Iterações divergentes terminam com ``nan``.
+    """
+    try:
+        x = np.array(x0, dtype=float)
+        tol = float(tol); max_iter = int(max_iter)
+    except Exception:
+        raise TypeError("x0 e tol devem ser numéricos e max_iter deve ser inteiro")
+    _validar_aceleracao(aceleracao)
+
+    formato = x.shape
+    g = compilar_funcao(g_str, vetorizada=True)
+    x, n_iter, convergiu = _iterar_ponto_fixo(g, x.ravel(), tol, max_iter, aceleracao)
+    return x.reshape(formato), n_iter.reshape(formato), convergiu.reshape(formato)
+
 # Método de Newton-Raphson
-def newton(func_str, x0, tol, max_iter, verbose=False):
+def _funcao_e_derivada(func_str, derivada='numerica', verbose=False):
+    """Prepara ``f`` e uma função ``fd(x) -> (f(x), f'(x))`` para Newton.
+
+    Com ``derivada='simbolica'`` e ``func_str`` string, ``f'`` é obtida com
+    SymPy e compilada junto de ``f`` (uma única chamada por passo). Se a
+    expressão não for simbólica (callable ou texto que o SymPy não
+    interpreta), usa-se a diferença central com ``h = 1e-6``.
+    """
+    if derivada not in ('numerica', 'simbolica'):
+        raise ValueError("derivada deve ser 'numerica' ou 'simbolica'.")
+
+    if derivada == 'simbolica' and isinstance(func_str, str):
+        try:
+            _validar_potencia(func_str)
+            fd = compilar_derivadas(func_str, ordem=1, modulos='math')
+            return (lambda x: fd(x)[0]), fd
+        except ValueError as e:
+            if verbose:
+                print(f"Derivada simbólica indisponível ({e}); usando diferenças finitas.")
+
+    fun = compilar_funcao(func_str)
+    h = 1e-6
+
+    def fd(x):
+        return fun(x), (fun(x + h) - fun(x - h)) / (2 * h)
+
+    return fun, fd
+
+def newton(func_str, x0, tol, max_iter, verbose=False, derivada='numerica', historico=None):
     """Método de Newton-Raphson para encontrar raiz de função dada por string.
 
     Parameters
     ----------
-    func_str : str
-        Expressão Python de ``f(x)``.
+    func_str : str or callable
+        Expressão Python de ``f(x)`` ou função já compilada.
     x0 : float
         Chute inicial.
     tol : float
@@ -179,6 +877,13 @@ def newton(func_str, x0, tol, max_iter, verbose=False):
         Número máximo de iterações.
     verbose : bool, optional
         Se True imprime detalhes de cada iteração.
+    derivada : {'numerica', 'simbolica'}, optional
+        ``'numerica'`` (padrão) aproxima ``f'`` por diferença central
+        (três avaliações por passo). ``'simbolica'`` deriva a expressão uma
+        única vez com SymPy e avalia ``f`` e ``f'`` em uma chamada fundida;
+        para entradas não simbólicas recai na diferença central.
+    historico : HistoricoConvergencia, optional
+        Se informado, recebe o registro das iterações (ver :class:`HistoricoConvergencia`).
 
     Returns
     -------
@@ -189,37 +894,249 @@ def newton(func_str, x0, tol, max_iter, verbose=False):
         x0 = float(x0); tol = float(tol); max_iter = int(max_iter)
     except Exception:
         raise TypeError("x0 and tol must be numeric, max_iter integer")
+    if derivada not in ('numerica', 'simbolica'):
+        raise ValueError("derivada deve ser 'numerica' ou 'simbolica'.")
 
-    h = 1e-6
+    try:
+        fun, fd = _funcao_e_derivada(func_str, derivada, verbose)
+    except Exception as e:
+        print(f"Erro ao compilar a função: {e}")
+        return None, 0
+
+    if historico is not None:
+        historico.iniciar(max_iter, 'Newton')
+    raiz, n_iter, _ = _iterar_newton(fun, fd, x0, tol, max_iter, verbose, historico)
+    return raiz, n_iter
+
+def _iterar_newton(fun, fd, x0, tol, max_iter, verbose=False, historico=None):
+    """Laço de Newton-Raphson sobre ``fd(x) -> (f(x), f'(x))`` já compilada.
+
+    Retorna ``(raiz, n_iter, convergiu)``; ``convergiu`` distingue a
+    convergência na última iteração permitida do esgotamento de ``max_iter``.
+    """
     for i in range(1, max_iter + 1):
         try:
-            fx = f(x0, func_str)
-            dfx = (f(x0 + h, func_str) - f(x0 - h, func_str)) / (2 * h)
+            fx, dfx = fd(x0)
         except Exception as e:
             print(f"Erro ao avaliar função/derivada: {e}")
-            return None, i
+            return None, i, False
         if dfx == 0:
             print("Erro: derivada zero.")
-            return None, i
+            return None, i, False
         x1 = x0 - fx / dfx
+        if historico is not None:
+            historico.registrar(x0, fx, x1 - x0)
         if verbose:
             try:
-                print(f"[Newton] Iter {i}: x = {x1:.6f}, f(x) = {f(x1, func_str):.6f}")
+                print(f"[Newton] Iter {i}: x = {x1:.6f}, f(x) = {fun(x1):.6f}")
             except Exception:
                 print(f"[Newton] Iter {i}: x = {x1:.6f}, f(x) = <erro na avaliação>")
         if abs(x1 - x0) < tol:
-            return x1, i
+            return x1, i, True
         x0 = x1
-    return x0, max_iter
+    return x0, max_iter, False
+
+# Newton com múltiplos chutes em paralelo
+def _newton_lote(args):
+    """Executa Newton para um lote de chutes (função de trabalho do pool de processos).
+
+    A expressão chega como string e é compilada uma única vez por lote
+    (cache de :mod:`codigos.expressoes`); mensagens de erro do método são
+    descartadas para não poluir a saída. Cada resultado é a tripla
+    ``(raiz, n_iter, convergiu)`` de :func:`_iterar_newton`.
+    """
+    func_str, chutes, tol, max_iter, derivada = args
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            fun, fd = _funcao_e_derivada(func_str, derivada, False)
+        except Exception:
+            return [(None, 0, False)] * len(chutes)
+        return [_iterar_newton(fun, fd, float(x0), tol, max_iter) for x0 in chutes]
+
+def newton_multiplos_chutes(func_str, chutes, tol, max_iter, derivada='numerica',
+                            processos=None, tol_duplicata=None):
+    """Newton-Raphson a partir de vários chutes iniciais, distribuídos entre processos.
+
+    Os chutes são divididos em lotes enviados a um
+    ``concurrent.futures.ProcessPoolExecutor``; cada processo recebe a
+    expressão como string e a compila uma única vez. As raízes convergidas
+    são ordenadas e agrupadas: valores a menos de ``tol_duplicata`` um do
+    outro são considerados a mesma raiz.
+
+    Parameters
+    ----------
+    func_str : str or callable
+        Expressão de ``f(x)``. Callables só são aceitos com ``processos=1``
+        (funções locais/lambdas não podem ser enviadas a outros processos).
+    chutes : array_like
+        Chutes iniciais.
+    tol : float
+        Tolerância para critério de parada de cada execução de :func:`newton`.
+    max_iter : int
+        Número máximo de iterações por chute.
+    derivada : {'numerica', 'simbolica'}, optional
+        Repassado a :func:`newton`.
+    processos : int or None, optional
+        Número de processos (``None`` usa o padrão do ``ProcessPoolExecutor``;
+        ``1`` executa tudo no processo atual).
+    tol_duplicata : float or None, optional
+        Distância máxima entre raízes consideradas iguais
+        (padrão: ``max(100 * tol, 1e-10)``).
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)
+        Tupla ``(raizes, bacias)``: raízes distintas em ordem crescente e o
+        número de chutes que convergiu para cada uma. Chutes que não
+        convergiram em ``max_iter`` iterações são descartados.
+    """
+    try:
+        chutes = np.asarray(chutes, dtype=float).ravel()
+        tol = float(tol); max_iter = int(max_iter)
+    except Exception:
+        raise TypeError("chutes e tol devem ser numéricos e max_iter deve ser inteiro")
+    if derivada not in ('numerica', 'simbolica'):
+        raise ValueError("derivada deve ser 'numerica' ou 'simbolica'.")
+    if tol_duplicata is None:
+        tol_duplicata = max(100 * tol, 1e-10)
+    if processos is not None:
+        processos = int(processos)
+        if processos < 1:
+            raise ValueError("processos deve ser um inteiro positivo.")
+    if callable(func_str) and processos != 1:
+        raise TypeError("Para execução em vários processos, func_str deve ser uma string.")
+
+    if chutes.size == 0:
+        return np.array([]), np.array([], dtype=int)
+
+    if processos == 1:
+        resultados = _newton_lote((func_str, chutes.tolist(), tol, max_iter, derivada))
+    else:
+        n_lotes = min(chutes.size, 4 * (processos or os.cpu_count() or 1))
+        lotes = [(func_str, lote.tolist(), tol, max_iter, derivada)
+                 for lote in np.array_split(chutes, n_lotes)]
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            resultados = [r for parcial in executor.map(_newton_lote, lotes) for r in parcial]
+
+    convergidas = np.array([r for r, _, convergiu in resultados
+                            if convergiu and np.isfinite(r)], dtype=float)
+    if convergidas.size == 0:
+        return np.array([]), np.array([], dtype=int)
+
+    convergidas.sort()
+    # novo grupo sempre que a distância ao valor anterior excede tol_duplicata
+    grupo = np.concatenate([[0], np.cumsum(np.diff(convergidas) > tol_duplicata)])
+    bacias = np.bincount(grupo)
+    raizes_ = np.bincount(grupo, weights=convergidas) / bacias
+    return raizes_, bacias
+
+# Continuação paramétrica
+def continuacao_parametrica(func_str, valores, x0, tol, max_iter, parametro='p',
+                            metodo='newton', derivada='numerica', preditor=True):
+    """Acompanha a raiz de ``f(x; p) = 0`` ao longo de uma sequência de valores de ``p``.
+
+    A expressão é compilada uma única vez como função de ``(x, p)``. Para
+    cada novo ``p`` o chute inicial é a raiz anterior ou, com
+    ``preditor=True``, a extrapolação linear (preditor secante) das duas
+    últimas raízes, o que em curvas suaves reduz o trabalho a uma ou duas
+    iterações por ponto.
+
+    Parameters
+    ----------
+    func_str : str or callable
+        Expressão em ``x`` e no parâmetro (ex.: ``'x**3 - x - p'``) ou
+        função ``f(x, p)``.
+    valores : array_like
+        Sequência de valores do parâmetro (em geral monótona).
+    x0 : float
+        Chute inicial para o primeiro valor de ``p``.
+    tol : float
+        Tolerância para critério de parada.
+    max_iter : int
+        Número máximo de iterações por ponto.
+    parametro : str, optional
+        Nome do símbolo do parâmetro na expressão (padrão: ``'p'``).
+    metodo : {'newton', 'secante'}, optional
+        Método usado como corretor em cada ponto.
+    derivada : {'numerica', 'simbolica'}, optional
+        Forma de obter ``f'`` no método de Newton (ver :func:`newton`).
+    preditor : bool, optional
+        Se True (padrão), usa o preditor secante a partir do terceiro ponto.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)
+        Tupla ``(curva, n_iter)`` com a raiz e o número de iterações para
+        cada valor de ``p``. Pontos sem convergência recebem ``nan``.
+    """
+    try:
+        valores = np.asarray(valores, dtype=float).ravel()
+        x0 = float(x0); tol = float(tol); max_iter = int(max_iter)
+    except Exception:
+        raise TypeError("valores, x0 e tol devem ser numéricos e max_iter deve ser inteiro")
+    if metodo not in ('newton', 'secante'):
+        raise ValueError("metodo deve ser 'newton' ou 'secante'.")
+    if derivada not in ('numerica', 'simbolica'):
+        raise ValueError("derivada deve ser 'numerica' ou 'simbolica'.")
+
+    variaveis = ('x', parametro)
+    fd_simbolica = None
+    if callable(func_str):
+        fxp = func_str
+    else:
+        _validar_potencia(func_str)
+        try:
+            fxp = compilar_lambdify(func_str, variaveis, modulos='math')
+        except ValueError:
+            fxp = compilar_eval(func_str, variaveis)
+        if metodo == 'newton' and derivada == 'simbolica':
+            try:
+                fd_simbolica = compilar_derivadas(func_str, ordem=1, variavel=variaveis, modulos='math')
+            except ValueError:
+                fd_simbolica = None
+
+    curva = np.full(valores.shape, np.nan)
+    n_iter = np.zeros(valores.shape, dtype=int)
+    historico = []  # pares (p, raiz) já convergidos
+    h = 1e-6
+
+    for k, pk in enumerate(valores):
+        if preditor and len(historico) >= 2 and historico[-1][0] != historico[-2][0]:
+            (p1, r1), (p2, r2) = historico[-2], historico[-1]
+            chute = r2 + (r2 - r1) * (pk - p2) / (p2 - p1)
+        elif historico:
+            chute = historico[-1][1]
+        else:
+            chute = x0
+
+        fun = (lambda x, pk=pk: fxp(x, pk))
+        if metodo == 'newton':
+            if fd_simbolica is not None:
+                fd = (lambda x, pk=pk: fd_simbolica(x, pk))
+            else:
+                fd = (lambda x, fun=fun: (fun(x), (fun(x + h) - fun(x - h)) / (2 * h)))
+            raiz, iters, convergiu = _iterar_newton(fun, fd, chute, tol, max_iter)
+        else:
+            anterior = historico[-1][1] if historico else chute
+            if anterior == chute:
+                anterior = chute + max(abs(chute), 1.0) * 1e-4
+            raiz, iters, convergiu = _iterar_secante(fun, anterior, chute, tol, max_iter)
+
+        n_iter[k] = iters
+        if convergiu and np.isfinite(raiz):
+            curva[k] = raiz
+            historico.append((pk, raiz))
+
+    return curva, n_iter
 
 # Método da Secante
-def secante(func_str, x0, x1, tol, max_iter, verbose=False):
+def secante(func_str, x0, x1, tol, max_iter, verbose=False, historico=None):
     """Método da secante para encontrar raiz de função dada por string.
 
     Parameters
     ----------
-    func_str : str
-        Expressão Python de ``f(x)``.
+    func_str : str or callable
+        Expressão Python de ``f(x)`` ou função já compilada.
     x0, x1 : float
         Dois chutes iniciais.
     tol : float
@@ -228,6 +1145,8 @@ def secante(func_str, x0, x1, tol, max_iter, verbose=False):
         Número máximo de iterações.
     verbose : bool, optional
         Se True imprime detalhes de cada iteração.
+    historico : HistoricoConvergencia, optional
+        Se informado, recebe o registro das iterações (ver :class:`HistoricoConvergencia`).
 
     Returns
     -------
@@ -239,26 +1158,841 @@ def secante(func_str, x0, x1, tol, max_iter, verbose=False):
     except Exception:
         raise TypeError("x0, x1, tol devem ser numéricos e max_iter deve ser inteiro")
 
+    try:
+        fun = compilar_funcao(func_str)
+    except Exception as e:
+        print(f"Erro ao compilar a função: {e}")
+        return None, 0
+
+    if historico is not None:
+        historico.iniciar(max_iter, 'Secante')
+    raiz, n_iter, _ = _iterar_secante(fun, x0, x1, tol, max_iter, verbose, historico)
+    return raiz, n_iter
+
+def _iterar_secante(fun, x0, x1, tol, max_iter, verbose=False, historico=None):
+    """Laço da secante sobre ``fun`` já compilada.
+
+    Retorna ``(raiz, n_iter, convergiu)``, como :func:`_iterar_newton`.
+    """
     for i in range(1, max_iter + 1):
         try:
-            fx0 = f(x0, func_str)
-            fx1 = f(x1, func_str)
+            fx0 = fun(x0)
+            fx1 = fun(x1)
         except Exception as e:
             print(f"Erro ao avaliar função: {e}")
-            return None, i
+            return None, i, False
         if fx1 - fx0 == 0:
             print("Erro: divisão por zero.")
-            return None, i
+            return None, i, False
         x2 = x1 - fx1 * (x1 - x0) / (fx1 - fx0)
+        if historico is not None:
+            historico.registrar(x1, fx1, x2 - x1)
         if verbose:
             try:
-                print(f"[Secante] Iter {i}: x = {x2:.6f}, f(x) = {f(x2, func_str):.6f}")
+                print(f"[Secante] Iter {i}: x = {x2:.6f}, f(x) = {fun(x2):.6f}")
             except Exception:
                 print(f"[Secante] Iter {i}: x = {x2:.6f}, f(x) = <erro na avaliação>")
         if abs(x2 - x1) < tol:
-            return x2, i
+            return x2, i, True
         x0, x1 = x1, x2
-    return x1, max_iter
+    return x1, max_iter, False
+
+# Método de Halley
+def halley(func_str, x0, tol, max_iter, verbose=False):
+    """Método de Halley (convergência cúbica) para encontrar raiz de ``f``.
+
+    Itera ``x_{k+1} = x_k - 2 f f' / (2 f'^2 - f f'')``. Para expressões
+    simbólicas, ``f``, ``f'`` e ``f''`` são obtidas com SymPy e compiladas
+    em uma única função fundida (uma avaliação por iteração). Para callables
+    ou texto não simbólico, as derivadas vêm de diferenças centrais (três
+    avaliações de ``f`` por iteração).
+
+    Parameters
+    ----------
+    func_str : str or callable
+        Expressão Python de ``f(x)`` ou função já compilada.
+    x0 : float
+        Chute inicial.
+    tol : float
+        Tolerância para critério de parada.
+    max_iter : int
+        Número máximo de iterações.
+    verbose : bool, optional
+        Se True imprime detalhes de cada iteração.
+
+    Returns
+    -------
+    (float, int, int)
+        Tupla (raiz_aproximada, n_iter, n_avaliacoes) ou ``(None, n_iter, n_avaliacoes)``
+        em caso de erro. ``n_avaliacoes`` conta as chamadas à função compilada
+        (a chamada fundida de ``f, f', f''`` conta como uma).
+    """
+    try:
+        x0 = float(x0); tol = float(tol); max_iter = int(max_iter)
+    except Exception:
+        raise TypeError("x0 e tol devem ser numéricos e max_iter deve ser inteiro")
+
+    fd2 = None
+    por_iteracao = 1
+    if isinstance(func_str, str):
+        try:
+            _validar_potencia(func_str)
+            fd2 = compilar_derivadas(func_str, ordem=2, modulos='math')
+        except Exception:
+            # sem derivadas simbólicas: diferenças finitas (erros de compilação
+            # da própria f são reportados logo abaixo)
+            fd2 = None
+    if fd2 is None:
+        try:
+            fun = compilar_funcao(func_str)
+        except Exception as e:
+            print(f"Erro ao compilar a função: {e}")
+            return None, 0, 0
+        h = 1e-4
+        por_iteracao = 3
+
+        def fd2(x):
+            fx, fmais, fmenos = fun(x), fun(x + h), fun(x - h)
+            return fx, (fmais - fmenos) / (2 * h), (fmais - 2 * fx + fmenos) / (h * h)
+
+    n_aval = 0
+    for i in range(1, max_iter + 1):
+        try:
+            fx, dfx, d2fx = fd2(x0)
+        except Exception as e:
+            print(f"Erro ao avaliar função/derivadas: {e}")
+            return None, i, n_aval
+        n_aval += por_iteracao
+        if fx == 0:
+            return x0, i, n_aval
+        denominador = 2 * dfx * dfx - fx * d2fx
+        if denominador == 0:
+            print("Erro: denominador nulo no passo de Halley.")
+            return None, i, n_aval
+        x1 = x0 - 2 * fx * dfx / denominador
+        if verbose:
+            # f no novo iterado, como em newton/secante (fora da contagem de avaliações)
+            try:
+                print(f"[Halley] Iter {i}: x = {x1:.6f}, f(x) = {fd2(x1)[0]:.6f}")
+            except Exception:
+                print(f"[Halley] Iter {i}: x = {x1:.6f}, f(x) = <erro na avaliação>")
+        if abs(x1 - x0) < tol:
+            return x1, i, n_aval
+        x0 = x1
+    return x0, max_iter, n_aval
+
+# Método de Steffensen
+def steffensen(func_str, x0, tol, max_iter, verbose=False):
+    """Método de Steffensen: convergência quadrática sem derivadas.
+
+    Substitui ``f'`` de Newton pela inclinação ``(f(x + f(x)) - f(x)) / f(x)``,
+    com duas avaliações de ``f`` por iteração. Converge bem quando o chute
+    está próximo da raiz (``|f(x0)|`` pequeno).
+
+    Parameters
+    ----------
+    func_str : str or callable
+        Expressão Python de ``f(x)`` ou função já compilada.
+    x0 : float
+        Chute inicial.
+    tol : float
+        Tolerância para critério de parada.
+    max_iter : int
+        Número máximo de iterações.
+    verbose : bool, optional
+        Se True imprime detalhes de cada iteração.
+
+    Returns
+    -------
+    (float, int, int)
+        Tupla (raiz_aproximada, n_iter, n_avaliacoes) ou ``(None, n_iter, n_avaliacoes)``
+        em caso de erro.
+    """
+    try:
+        x0 = float(x0); tol = float(tol); max_iter = int(max_iter)
+    except Exception:
+        raise TypeError("x0 e tol devem ser numéricos e max_iter deve ser inteiro")
+
+    try:
+        fun = compilar_funcao(func_str)
+    except Exception as e:
+        print(f"Erro ao compilar a função: {e}")
+        return None, 0, 0
+
+    n_aval = 0
+    for i in range(1, max_iter + 1):
+        try:
+            fx = fun(x0)
+            n_aval += 1
+            if fx == 0:
+                return x0, i, n_aval
+            fxf = fun(x0 + fx)
+            n_aval += 1
+        except Exception as e:
+            print(f"Erro ao avaliar função: {e}")
+            return None, i, n_aval
+        if fxf == fx:
+            print("Erro: divisão por zero.")
+            return None, i, n_aval
+        x1 = x0 - fx * fx / (fxf - fx)
+        if verbose:
+            print(f"[Steffensen] Iter {i}: x = {x1:.6f}, f(x) = {fx:.6f}")
+        if abs(x1 - x0) < tol:
+            return x1, i, n_aval
+        x0 = x1
+    return x0, max_iter, n_aval
+
+# Método de Brent
+def brent(func_str, a, b, tol, max_iter, verbose=False):
+    """Método de Brent para encontrar raiz em um intervalo com troca de sinal.
+
+    Combina interpolação quadrática inversa, secante e bisseção: enquanto
+    os passos interpolados reduzem o intervalo o suficiente, a convergência
+    é superlinear; caso contrário, um passo de bisseção é forçado, o que
+    garante a convergência como na :func:`bissecao`. Cada iteração faz uma
+    única avaliação de ``f``.
+
+    Parameters
+    ----------
+    func_str : str or callable
+        Expressão Python de ``f(x)`` ou função já compilada.
+    a, b : float
+        Intervalo inicial [a, b] com sinais opostos.
+    tol : float
+        Tolerância no tamanho do intervalo que contém a raiz.
+    max_iter : int
+        Número máximo de iterações.
+    verbose : bool, optional
+        Se True imprime detalhes de cada iteração.
+
+    Returns
+    -------
+    (float, int, int)
+        Tupla (raiz_aproximada, n_iter, n_avaliacoes) ou ``(None, n_iter, n_avaliacoes)``
+        se os sinais em a/b não forem opostos ou houver erro na avaliação.
+    """
+    try:
+        a = float(a); b = float(b); tol = float(tol); max_iter = int(max_iter)
+    except Exception:
+        raise TypeError("a, b, tol devem ser numéricos e max_iter deve ser inteiro")
+
+    try:
+        fun = compilar_funcao(func_str)
+        fa = fun(a)
+        fb = fun(b)
+    except Exception as e:
+        print(f"Erro na avaliação nos extremos: {e}")
+        return None, 0, 0
+    n_aval = 2
+
+    if fa == 0:
+        return a, 0, n_aval
+    if fb == 0:
+        return b, 0, n_aval
+    if fa * fb > 0:
+        print("Erro: f(a) e f(b) devem ter sinais opostos.")
+        return None, 0, n_aval
+
+    eps = np.finfo(float).eps
+    c, fc = b, fb
+    d = e = b - a
+    for i in range(1, max_iter + 1):
+        if (fb > 0) == (fc > 0):
+            # c passa a ser o extremo oposto a b
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol1 = 2 * eps * abs(b) + 0.5 * tol
+        xm = 0.5 * (c - b)
+        if abs(xm) <= tol1 or fb == 0:
+            return b, i - 1, n_aval
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # secante
+                p = 2 * xm * s
+                q = 1 - s
+            else:
+                # interpolação quadrática inversa
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * xm * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = xm
+        else:
+            d = e = xm
+
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else math.copysign(tol1, xm)
+        try:
+            fb = fun(b)
+        except Exception as e_aval:
+            print(f"Erro ao avaliar f(x): {e_aval}")
+            return None, i, n_aval
+        n_aval += 1
+        if verbose:
+            print(f"[Brent] Iter {i}: x = {b:.6f}, f(x) = {fb:.6f}")
+    return b, max_iter, n_aval
+
+# Método de Müller (raízes complexas)
+def _compilar_complexa(func_str):
+    """Compila ``f`` para aceitar argumentos complexos (backend NumPy do ``lambdify``)."""
+    if callable(func_str):
+        return func_str
+    _validar_potencia(func_str)
+    try:
+        return compilar_lambdify(func_str, modulos='numpy')
+    except ValueError:
+        return compilar_eval(func_str)
+
+def _iterar_muller(fun, x0, x1, x2, tol, max_iter, verbose=False):
+    """Laço do método de Müller em aritmética complexa.
+
+    Retorna ``(raiz, n_iter, convergiu)``, como :func:`_iterar_newton`.
+    """
+    x0, x1, x2 = complex(x0), complex(x1), complex(x2)
+    f0, f1, f2 = complex(fun(x0)), complex(fun(x1)), complex(fun(x2))
+    for i in range(1, max_iter + 1):
+        h1, h2 = x1 - x0, x2 - x1
+        if h1 == 0 or h2 == 0 or h1 + h2 == 0:
+            print("Erro: pontos coincidentes no método de Müller.")
+            return None, i, False
+        d1, d2 = (f1 - f0) / h1, (f2 - f1) / h2
+        a = (d2 - d1) / (h2 + h1)
+        b = a * h2 + d2
+        raiz_disc = cmath.sqrt(b * b - 4 * f2 * a)
+        # escolhe o denominador de maior módulo (passo mais curto e estável)
+        den = b + raiz_disc if abs(b + raiz_disc) >= abs(b - raiz_disc) else b - raiz_disc
+        if den == 0:
+            print("Erro: denominador nulo no método de Müller.")
+            return None, i, False
+        h = -2 * f2 / den
+        x3 = x2 + h
+        if verbose:
+            print(f"[Müller] Iter {i}: x = {x3:.6f}")
+        if abs(h) < tol:
+            return x3, i, True
+        x0, x1, x2 = x1, x2, x3
+        f0, f1 = f1, f2
+        f2 = complex(fun(x3))
+        if f2 == 0:
+            return x3, i, True
+    return x2, max_iter, False
+
+def muller(func_str, x0, x1, x2, tol, max_iter, verbose=False):
+    """Método de Müller para encontrar raízes reais ou complexas.
+
+    Ajusta uma parábola pelos três últimos pontos e toma a sua raiz mais
+    próxima; como a raiz de uma parábola pode ser complexa, o método
+    alcança raízes complexas mesmo a partir de chutes reais. A função é
+    compilada com o backend NumPy do ``lambdify``, que aceita complexos.
+
+    Parameters
+    ----------
+    func_str : str or callable
+        Expressão de ``f(x)`` ou função que aceite argumentos complexos.
+    x0, x1, x2 : complex
+        Três chutes iniciais distintos.
+    tol : float
+        Tolerância para critério de parada (``|x_{k+1} - x_k| < tol``).
+    max_iter : int
+        Número máximo de iterações.
+    verbose : bool, optional
+        Se True imprime detalhes de cada iteração.
+
+    Returns
+    -------
+    (complex, int)
+        Tupla (raiz_aproximada, n_iter) ou (None, n_iter) em caso de erro.
+    """
+    try:
+        x0 = complex(x0); x1 = complex(x1); x2 = complex(x2)
+        tol = float(tol); max_iter = int(max_iter)
+    except Exception:
+        raise TypeError("x0, x1, x2 e tol devem ser numéricos e max_iter deve ser inteiro")
+
+    try:
+        fun = _compilar_complexa(func_str)
+        with np.errstate(all='ignore'):
+            raiz, n_iter, _ = _iterar_muller(fun, x0, x1, x2, tol, max_iter, verbose)
+        return raiz, n_iter
+    except Exception as e:
+        print(f"Erro ao avaliar função: {e}")
+        return None, 0
+
+def muller_deflacao(func_str, n_raizes, tol, max_iter, chutes=(-0.5, 0.0, 0.5), polir=True):
+    """Encontra ``n_raizes`` raízes sucessivas com Müller e deflação.
+
+    Após cada raiz ``r`` encontrada, as próximas buscas usam
+    ``f(x) / prod(x - r_j)``, de modo que raízes já obtidas não são
+    reencontradas; cada busca parte dos mesmos chutes, sem reinício
+    manual. Com ``polir=True`` cada raiz é refinada com Müller sobre a
+    função original, eliminando o erro acumulado pela deflação.
+
+    Parameters
+    ----------
+    func_str : str or callable
+        Expressão de ``f(x)`` ou função que aceite argumentos complexos.
+    n_raizes : int
+        Número de raízes desejadas.
+    tol : float
+        Tolerância para critério de parada.
+    max_iter : int
+        Número máximo de iterações por raiz.
+    chutes : tuple of complex, optional
+        Três chutes iniciais usados em cada busca.
+    polir : bool, optional
+        Refina cada raiz na função original (padrão: True).
+
+    Returns
+    -------
+    np.ndarray
+        Raízes (complexas) na ordem em que foram encontradas; a busca é
+        interrompida na primeira falha.
+    """
+    try:
+        n_raizes = int(n_raizes); tol = float(tol); max_iter = int(max_iter)
+        c0, c1, c2 = (complex(c) for c in chutes)
+    except Exception:
+        raise TypeError("n_raizes e max_iter devem ser inteiros, tol numérico e chutes três números")
+
+    fun = _compilar_complexa(func_str)
+    encontradas = []
+
+    def deflacionada(x):
+        den = 1.0
+        for r in encontradas:
+            den = den * (x - r)
+        return fun(x) / den
+
+    with np.errstate(all='ignore'):
+        for _ in range(n_raizes):
+            try:
+                raiz, _, convergiu = _iterar_muller(deflacionada, c0, c1, c2, tol, max_iter)
+            except Exception as e:
+                print(f"Erro ao avaliar função: {e}")
+                break
+            if not convergiu or not cmath.isfinite(raiz):
+                break
+            if polir:
+                d = max(abs(raiz), 1.0) * 1e-3
+                try:
+                    refinada, _, _ = _iterar_muller(fun, raiz - d, raiz + d, raiz, tol, max_iter)
+                except Exception:
+                    refinada = None
+                if refinada is not None and cmath.isfinite(refinada) and abs(refinada - raiz) < 10 * d:
+                    raiz = refinada
+            encontradas.append(raiz)
+    return np.array(encontradas, dtype=complex)
+
+# Sistemas não lineares F(x) = 0
+def _preparar_sistema(funcs, n):
+    """Compila ``F`` e o jacobiano ``J`` de um sistema dado por expressões ``y[i]``.
+
+    Usa a mesma indexação de :func:`codigos.edos.runge_kutta_sistema`
+    (``y[1]``, ..., ``y[n]``). O jacobiano é simbólico quando possível; para
+    callables ou expressões não simbólicas, usa diferenças progressivas.
+    """
+    if callable(funcs):
+        F = lambda x: np.asarray(funcs(x), dtype=float)
+        J = None
+    else:
+        funcs = list(funcs)
+        if len(funcs) != n:
+            raise ValueError(f"Número de equações ({len(funcs)}) diferente do número de incógnitas ({n}).")
+        nomes = [f'y{j + 1}' for j in range(n)]
+
+        def repl_idx_name(m):
+            idx = int(m.group(1))
+            if idx < 1 or idx > n:
+                raise ValueError(f"Índice y[{idx}] fora do intervalo válido [1, {n}]")
+            return f'y{idx}'
+
+        exprs = [re.sub(r'y\[(\d+)\]', repl_idx_name, e.strip().replace('^', '**')) for e in funcs]
+        try:
+            F_comp = compilar_sistema(exprs, nomes)
+            J_comp = compilar_sistema(exprs, nomes, jacobiano=True)
+            F = lambda x: np.array(F_comp(*x), dtype=float)
+            J = lambda x: np.array(J_comp(*x), dtype=float)
+        except ValueError:
+            componentes = [compilar_eval(e, nomes) for e in exprs]
+            F = lambda x: np.array([c(*x) for c in componentes], dtype=float)
+            J = None
+
+    if J is None:
+        def J(x, Fx=None):
+            Fx = F(x) if Fx is None else Fx
+            jac = np.empty((Fx.size, x.size))
+            for j in range(x.size):
+                h = 1e-7 * max(1.0, abs(x[j]))
+                xh = x.copy()
+                xh[j] += h
+                jac[:, j] = (F(xh) - Fx) / h
+            return jac
+        return F, J
+    return F, (lambda x, Fx=None: J(x))
+
+def _resolver_fatoracao(fatoracao, b):
+    """Resolve ``A x = b`` a partir de ``P, L, U`` (``P A = L U``) de :func:`lu_com_pivot`."""
+    P, L, U = fatoracao
+    return backward_solve(U, forward_solve(L, P @ b))
+
+def _resolver_fatoracao_transposta(fatoracao, b):
+    """Resolve ``A^T x = b`` reaproveitando ``P, L, U`` de :func:`lu_com_pivot`."""
+    P, L, U = fatoracao
+    return P.T @ backward_solve(L.T, forward_solve(U.T, b))
+
+def newton_sistema(funcs, x0, tol, max_iter, metodo='newton', verbose=False):
+    """Resolve o sistema não linear ``F(x) = 0``.
+
+    As componentes de ``F`` são expressões em ``y[1], ..., y[n]`` (mesma
+    convenção de :func:`codigos.edos.runge_kutta_sistema`). ``F`` e o seu
+    jacobiano simbólico são compilados uma única vez.
+
+    - ``metodo='newton'``: a cada passo o jacobiano é avaliado, fatorado com
+      :func:`codigos.sistemaslineares.lu_com_pivot` e o passo é obtido por
+      substituições progressiva/regressiva.
+    - ``metodo='broyden'``: o jacobiano é avaliado e fatorado apenas no
+      início; os passos seguintes usam atualizações de posto 1 de Broyden
+      sobre a inversa (fórmula de Sherman-Morrison), reaproveitando a
+      fatoração. Se uma atualização se tornar degenerada, o jacobiano é
+      recalculado.
+
+    Parameters
+    ----------
+    funcs : list of str or callable
+        Componentes do sistema (ex.: ``['y[1]**2 + y[2]**2 - 4', 'y[1] - y[2]']``)
+        ou função ``F(x)`` que recebe e retorna arrays.
+    x0 : array_like
+        Chute inicial.
+    tol : float
+        Tolerância na norma infinito do passo.
+    max_iter : int
+        Número máximo de iterações.
+    metodo : {'newton', 'broyden'}, optional
+        Método de atualização do jacobiano (padrão: ``'newton'``).
+    verbose : bool, optional
+        Se True imprime detalhes de cada iteração.
+
+    Returns
+    -------
+    (np.ndarray, int)
+        Tupla (solucao_aproximada, n_iter) ou (None, n_iter) se o jacobiano
+        for singular ou houver erro na avaliação.
+    """
+    try:
+        x = np.array(x0, dtype=float).ravel()
+        tol = float(tol); max_iter = int(max_iter)
+    except Exception:
+        raise TypeError("x0 e tol devem ser numéricos e max_iter deve ser inteiro")
+    if metodo not in ('newton', 'broyden'):
+        raise ValueError("metodo deve ser 'newton' ou 'broyden'.")
+
+    F, J = _preparar_sistema(funcs, x.size)
+
+    def fatorar(x, Fx):
+        with np.errstate(all='ignore'):
+            jac = J(x, Fx)
+        if jac.shape != (x.size, x.size) or not np.all(np.isfinite(jac)):
+            return None
+        return lu_com_pivot(jac, None)
+
+    try:
+        Fx = F(x)
+        fatoracao = fatorar(x, Fx)
+    except Exception as e:
+        print(f"Erro ao avaliar o sistema: {e}")
+        return None, 0
+    # inversa de Broyden: H = J0^{-1} + sum(u v^T)
+    us, vs = [], []
+
+    for i in range(1, max_iter + 1):
+        if fatoracao is None:
+            print("Erro: jacobiano singular.")
+            return None, i
+        with np.errstate(all='ignore'):
+            dx = _resolver_fatoracao(fatoracao, -Fx)
+            for u, v in zip(us, vs):
+                dx -= u * (v @ Fx)
+        if not np.all(np.isfinite(dx)):
+            print("Erro: jacobiano singular.")
+            return None, i
+        x = x + dx
+        try:
+            F_novo = F(x)
+        except Exception as e:
+            print(f"Erro ao avaliar o sistema: {e}")
+            return None, i
+        if verbose:
+            print(f"[{metodo.capitalize()}] Iter {i}: x = {np.array2string(x, precision=6)}, "
+                  f"||F(x)|| = {np.max(np.abs(F_novo)):.6e}")
+        if np.max(np.abs(dx)) < tol:
+            return x, i
+
+        try:
+            if metodo == 'newton':
+                fatoracao = fatorar(x, F_novo)
+            else:
+                dF = F_novo - Fx
+                Hy = _resolver_fatoracao(fatoracao, dF)
+                HTs = _resolver_fatoracao_transposta(fatoracao, dx)
+                for u, v in zip(us, vs):
+                    Hy += u * (v @ dF)
+                    HTs += v * (u @ dx)
+                denominador = dx @ Hy
+                if abs(denominador) <= np.finfo(float).eps * np.linalg.norm(dx) * np.linalg.norm(Hy):
+                    # atualização degenerada: recomeça com o jacobiano verdadeiro
+                    fatoracao = fatorar(x, F_novo)
+                    us, vs = [], []
+                else:
+                    us.append((dx - Hy) / denominador)
+                    vs.append(HTs)
+        except Exception as e:
+            print(f"Erro ao atualizar o jacobiano: {e}")
+            return None, i
+        Fx = F_novo
+    return x, max_iter
+
+# Raízes de polinômios (matriz companheira)
+def _coeficientes_polinomio(func_str):
+    """Coeficientes (grau decrescente) se ``func_str`` for polinômio em x; senão ``None``."""
+    if not isinstance(func_str, str) or '^' in func_str:
+        return None
+    try:
+        expr = expressao_sympy(func_str)
+        poli = sp.Poly(expr, sp.Symbol('x'))
+    except Exception:
+        return None
+    coefs = poli.all_coeffs()
+    if not all(c.is_number for c in coefs):
+        return None
+    try:
+        return np.array([complex(c) for c in coefs])
+    except TypeError:
+        return None
+
+def _agrupar_multiplas(zs, coefs):
+    """Substitui aglomerados de autovalores de uma raiz múltipla pela sua média.
+
+    Uma raiz de multiplicidade ``m`` é perturbada em ``O(eps**(1/m))`` e
+    se espalha em ``m`` autovalores ao redor dela; a média do aglomerado
+    volta a ter erro ``O(eps)``. Os vizinhos mais próximos de cada raiz
+    são acrescentados um a um, enquanto ``p, p', ..., p^(m-1)`` se anulam
+    (relativamente) no centro ``c`` e o raio fica abaixo de ``1e-2 * max(1, |c|)``.
+    O maior grupo cujo raio não excede ``10 * eps**(1/m) * max(1, |c|)`` e
+    que dista das demais raízes mais de 100 vezes o raio é unido.
+
+    Retorna ``(zs, multiplicidade)``, com a multiplicidade estimada de cada raiz.
+    """
+    eps = np.finfo(float).eps
+    derivadas = [coefs]
+
+    def anula(k, c):
+        while len(derivadas) <= k:
+            derivadas.append(np.polyder(derivadas[-1]))
+        escala = np.polyval(np.abs(derivadas[k]), abs(c))
+        return abs(np.polyval(derivadas[k], c)) <= 1e-6 * escala
+
+    originais = zs
+    zs = zs.copy()
+    n = zs.size
+    multiplicidade = np.ones(n, dtype=int)
+    livres = np.ones(n, dtype=bool)
+    for i in range(n):
+        if not livres[i]:
+            continue
+        ordem = np.argsort(np.abs(originais - originais[i]), kind='mergesort')
+        grupo = ordem[:1]
+        for m in range(2, n + 1):
+            membros = ordem[:m]
+            if not livres[membros].all():
+                break
+            centro = originais[membros].mean()
+            raio = np.max(np.abs(originais[membros] - centro))
+            escala = max(1.0, abs(centro))
+            if raio > 1e-2 * escala or not all(anula(k, centro) for k in range(m)):
+                break
+            folga = np.min(np.abs(originais[ordem[m:]] - centro)) if m < n else np.inf
+            if raio <= 10 * eps ** (1 / m) * escala and folga > 100 * raio:
+                grupo = membros
+        zs[grupo] = originais[grupo].mean()
+        multiplicidade[grupo] = grupo.size
+        livres[grupo] = False
+    return zs, multiplicidade
+
+def raizes_polinomio(func_str, polir=True, apenas_reais=False, tol_imag=1e-10):
+    """Calcula todas as raízes de um polinômio pelos autovalores da matriz companheira.
+
+    O polinômio é reconhecido com ``sympy.Poly``; para grau ``n`` monta-se a
+    matriz companheira ``n x n`` cujos autovalores são exatamente as raízes
+    (reais e complexas), obtidas todas de uma vez com ``numpy.linalg.eigvals``.
+
+    Parameters
+    ----------
+    func_str : str
+        Expressão polinomial em ``x`` (ex.: ``'x**3 - 6*x**2 + 11*x - 6'``).
+    polir : bool, optional
+        Se True (padrão), aplica um passo de Newton a cada raiz simples para
+        reduzir o erro de arredondamento dos autovalores.
+    apenas_reais : bool, optional
+        Se True, retorna apenas as partes reais das raízes cuja parte
+        imaginária é desprezível (``|Im z| <= tol_imag * max(1, |z|)``).
+    tol_imag : float, optional
+        Tolerância relativa usada por ``apenas_reais``.
+
+    Returns
+    -------
+    np.ndarray
+        Raízes ordenadas pela parte real (e imaginária); ``complex`` por
+        padrão ou ``float`` quando ``apenas_reais=True``.
+
+    Raises
+    ------
+    ValueError
+        Se ``func_str`` não for um polinômio em ``x`` com coeficientes
+        numéricos, ou for o polinômio nulo.
+
+    Notes
+    -----
+    Os autovalores de uma raiz de multiplicidade ``m`` se espalham em um
+    aglomerado de raio ``O(eps**(1/m))``, com partes imaginárias espúrias.
+    Esses aglomerados são substituídos pela sua média, repetida ``m`` vezes
+    (ex.: ``(x - 1)**3`` retorna ``[1, 1, 1]``). Raízes distintas mais
+    próximas que esse raio também são unidas: a precisão em ponto
+    flutuante não permite separá-las.
+    """
+    coefs = _coeficientes_polinomio(func_str)
+    if coefs is None:
+        raise ValueError(f"'{func_str}' não é um polinômio em x com coeficientes numéricos.")
+    if not np.any(coefs):
+        raise ValueError("O polinômio nulo não possui raízes isoladas.")
+
+    # raízes nulas saem diretamente dos coeficientes finais iguais a zero
+    n_zeros = len(coefs) - len(np.trim_zeros(coefs, 'b'))
+    coefs = np.trim_zeros(coefs, 'b')
+    grau = len(coefs) - 1
+
+    if np.all(coefs.imag == 0):
+        # coeficientes reais: matriz real, raízes complexas saem em pares conjugados
+        coefs = coefs.real
+
+    if grau > 0:
+        companheira = np.zeros((grau, grau), dtype=coefs.dtype)
+        companheira[0, :] = -coefs[1:] / coefs[0]
+        companheira[np.arange(1, grau), np.arange(grau - 1)] = 1.0
+        zs, multiplicidade = _agrupar_multiplas(np.linalg.eigvals(companheira).astype(complex), coefs)
+        if polir:
+            derivada = np.polyder(coefs)
+            with np.errstate(all='ignore'):
+                pz = np.polyval(coefs, zs)
+                dpz = np.polyval(derivada, zs)
+                passo = np.where(dpz != 0, pz / np.where(dpz != 0, dpz, 1), 0)
+            # só aceita o passo se ele reduzir o resíduo (evita piorar raízes múltiplas)
+            candidatas = zs - passo
+            with np.errstate(all='ignore'):
+                melhora = np.abs(np.polyval(coefs, candidatas)) < np.abs(pz)
+            # raízes múltiplas já têm erro O(eps) pela média do aglomerado
+            zs = np.where(melhora & np.isfinite(candidatas) & (multiplicidade == 1), candidatas, zs)
+    else:
+        zs = np.array([], dtype=complex)
+
+    zs = np.concatenate([zs, np.zeros(n_zeros, dtype=complex)])
+    zs = zs[np.lexsort((zs.imag, zs.real))]
+
+    if apenas_reais:
+        reais = np.abs(zs.imag) <= tol_imag * np.maximum(1.0, np.abs(zs))
+        return zs.real[reais]
+    return zs
+
+def interpolacao_inversa(x, y, alvos, grau=2, extrapolar=False):
+    """Encontra ``x`` tal que ``y(x) = alvo`` em dados tabelados, para vários alvos.
+
+    Os eixos são trocados: ``x`` passa a ser função de ``y`` e é interpolado
+    pela forma de Newton com diferenças divididas locais (``grau + 1`` nós
+    vizinhos). A tabela de diferenças é calculada uma única vez e os
+    intervalos que contêm cada alvo são localizados de uma vez com
+    ``np.searchsorted``, de modo que milhares de consultas custam apenas
+    algumas operações vetorizadas. Com ``grau=2`` obtém-se a interpolação
+    quadrática inversa local.
+
+    Parameters
+    ----------
+    x, y : sequence of float
+        Dados tabelados; ``y`` deve ser estritamente monótono.
+    alvos : float or array_like
+        Valor(es) de ``y`` para os quais se deseja ``x``.
+    grau : int, optional
+        Grau do polinômio inverso local (padrão: 2). Deve ser menor que
+        o número de pontos.
+    extrapolar : bool, optional
+        Se False (padrão), alvos fora de ``[min(y), max(y)]`` retornam ``nan``;
+        se True, usa o polinômio do extremo da tabela.
+
+    Returns
+    -------
+    float or np.ndarray
+        Abscissas com o mesmo formato de ``alvos``.
+
+    Raises
+    ------
+    ValueError
+        Se ``y`` não for estritamente monótono ou ``grau`` for inválido.
+    TypeError
+        Se os dados não puderem ser convertidos para números reais.
+    """
+    try:
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        alvos = np.asarray(alvos, dtype=float)
+    except (ValueError, TypeError) as e:
+        raise TypeError(f"Os dados de entrada devem ser numéricos. Erro: {e}")
+    if x.ndim != 1 or x.shape != y.shape:
+        raise ValueError("x e y devem ser arrays 1D de mesmo comprimento.")
+    n = len(y)
+    grau = int(grau)
+    if not 1 <= grau <= n - 1:
+        raise ValueError(f"grau deve estar entre 1 e {n - 1}. Recebido: {grau}")
+
+    dy = np.diff(y)
+    if np.all(dy < 0):
+        x, y = x[::-1], y[::-1]
+    elif not np.all(dy > 0):
+        raise ValueError("y deve ser estritamente monótono para a interpolação inversa.")
+
+    # diferenças divididas de x em função de y (eixos trocados)
+    tabela = tabela_diferencas_divididas_vetorizada(y, x, max_ordem=grau)
+
+    t = alvos.ravel()
+    k = np.clip(np.searchsorted(y, t) - 1, 0, n - 2)      # intervalo [y_k, y_{k+1}]
+    s = np.clip(k - (grau - 1) // 2, 0, n - 1 - grau)     # primeiro nó do estêncil
+
+    # forma de Newton avaliada por Horner, para todos os alvos de uma vez
+    resultado = tabela[grau][s]
+    for j in range(grau - 1, -1, -1):
+        resultado = tabela[j][s] + (t - y[s + j]) * resultado
+
+    fora = (t < y[0]) | (t > y[-1])
+    # o polinômio inverso pode sair do intervalo (dados pouco suaves):
+    # nesses casos recorre à interpolação linear, que sempre fica dentro dele
+    linear = x[k] + (t - y[k]) * tabela[1][k]
+    baixo = np.minimum(x[k], x[k + 1])
+    alto = np.maximum(x[k], x[k + 1])
+    saiu = ~fora & ((resultado < baixo) | (resultado > alto))
+    resultado = np.where(saiu, linear, resultado)
+    if not extrapolar:
+        resultado = np.where(fora, np.nan, resultado)
+
+    resultado = resultado.reshape(alvos.shape)
+    return float(resultado) if resultado.ndim == 0 else resultado
 
 # Menu principal
 def pedir_dados_raizes(metodo=None):
@@ -4,7 +4,10 @@ import numpy as np
 
 Módulo contendo funções para montagem e exibição de sistemas lineares,
 eliminação de Gauss (com e sem pivotamento), decomposição LU (com e sem
-pivotamento), forward/backward solves e cálculo do resíduo.
+pivotamento), forward/backward solves e cálculo do resíduo, além de
+fatorações reutilizáveis (LU blocada, banda, Thomas), matrizes esparsas
+CSR, operadores lineares sem matriz explícita e métodos iterativos
+(Jacobi, Gauss-Seidel, SOR, gradientes conjugados e GMRES).
 
 Todas as funções aceitam entradas ``array_like`` (listas, arrays numpy, etc.),
 convertem internamente para ``numpy.ndarray`` quando necessário, e retornam
@@ -172,13 +175,18 @@ def eliminacao_gauss_sem_pivotamento(A, b, verbose=False):
             if verbose:
                 print(f"Pivô zero detectado na linha {k+1} no método sem pivotamento. Não é possível continuar.")
             return None, None, None, True
+        if not verbose:
+            # atualização de posto 1 da submatriz restante, de uma só vez
+            fatores = -A[k+1:,k] / A[k,k]
+            A[k+1:,k:] += np.outer(fatores, A[k,k:])
+            b[k+1:] += fatores * b[k]
+            continue
         for i in range(k+1, n):
             fator = -A[i,k] / A[k,k] 
             A[i,k:] += fator * A[k,k:]
             b[i] += fator * b[k]
-            if verbose:
-                print(f"Eliminando elemento A[{i+1},{k+1}], multiplicando linha {k+1} por {fator} e subtraindo da linha {i+1}:")
-                imprimir_sistema_linear(A, b, f"Sistema após eliminar entrada A[{i+1},{k+1}]", verbose)
+            print(f"Eliminando elemento A[{i+1},{k+1}], multiplicando linha {k+1} por {fator} e subtraindo da linha {i+1}:")
+            imprimir_sistema_linear(A, b, f"Sistema após eliminar entrada A[{i+1},{k+1}]", verbose)
     if any(abs(A[i,i]) < 1e-20 for i in range(n)):
         if verbose:
             print("Sistema impossível (pivô zero na diagonal após eliminação).")
@@ -218,7 +226,7 @@ def eliminacao_gauss_com_pivotamento(A, b, verbose=False):
     b = b.copy()
     imprimir_sistema_linear(A, b, "Sistema inicial", verbose)
     for k in range(n):
-        pivo_linha = max(range(k, n), key=lambda i: abs(A[i,k]))
+        pivo_linha = k + int(np.argmax(np.abs(A[k:,k])))
         if verbose:
             print(f"Pivô escolhido: {pivo_linha}")
         if abs(A[pivo_linha,k]) < 1e-20:
@@ -231,13 +239,18 @@ def eliminacao_gauss_com_pivotamento(A, b, verbose=False):
             if verbose:
                 print(f"Trocando linha {k+1} com linha {pivo_linha+1} (pivoteamento):")
                 imprimir_sistema_linear(A, b, f"Sistema após troca das linhas {k+1} e {pivo_linha+1}", verbose)
+        if not verbose:
+            # atualização de posto 1 da submatriz restante, de uma só vez
+            fatores = -A[k+1:,k] / A[k,k]
+            A[k+1:,k:] += np.outer(fatores, A[k,k:])
+            b[k+1:] += fatores * b[k]
+            continue
         for i in range(k+1, n):
             fator = -A[i,k] / A[k,k]
             A[i,k:] += fator * A[k,k:]
             b[i] += fator * b[k]
-            if verbose:
-                print(f"Eliminando elemento A[{i+1},{k+1}], multiplicando linha {k+1} por {fator} e subtraindo da linha {i+1}:")
-                imprimir_sistema_linear(A, b, f"Sistema após eliminar entrada A[{i+1},{k+1}]", verbose)
+            print(f"Eliminando elemento A[{i+1},{k+1}], multiplicando linha {k+1} por {fator} e subtraindo da linha {i+1}:")
+            imprimir_sistema_linear(A, b, f"Sistema após eliminar entrada A[{i+1},{k+1}]", verbose)
     x = np.zeros(n)
     for i in range(n-1, -1, -1):
         soma = np.dot(A[i,i+1:], x[i+1:])
@@ -346,6 +359,331 @@ def lu_com_pivot(A, b, verbose=False):
                 imprimir_sistema_linear(U, np.zeros(n), "Matriz U após etapa", verbose)
     return P, L, U
 
+class FatoracaoLU:
+    """Fatoração LU com pivotamento parcial reutilizável (``A[perm] = L @ U``).
+
+    ``L`` (sem a diagonal unitária) e ``U`` ficam armazenadas em um único
+    array ``lu`` e as trocas de linha em um vetor de índices ``perm``, em vez
+    das três matrizes densas de :func:`lu_com_pivot`. A matriz é fatorada
+    uma única vez; :meth:`solve` resolve então quantos lados direitos forem
+    necessários, inclusive vários de uma vez em uma matriz ``(n, k)``.
+
+    A fatoração é blocada: a cada ``bloco`` colunas, o painel correspondente
+    é fatorado coluna a coluna e o restante da matriz recebe a atualização
+    ``A22 -= L21 @ U12`` de uma só vez, um produto matriz-matriz que usa bem
+    a cache (e o BLAS do NumPy) para ``n`` grande. Com ``bloco >= n`` obtém-se
+    o algoritmo não blocado.
+
+    Parameters
+    ----------
+    A : array_like, shape (n, n)
+        Matriz a ser fatorada.
+    bloco : int, optional
+        Número de colunas por painel (default: 64).
+
+    Attributes
+    ----------
+    lu : np.ndarray, shape (n, n)
+        ``U`` no triângulo superior (com a diagonal) e os multiplicadores
+        de ``L`` abaixo da diagonal.
+    perm : np.ndarray of int, shape (n,)
+        A linha ``i`` de ``L @ U`` corresponde à linha ``perm[i]`` de ``A``.
+
+    Raises
+    ------
+    ZeroDivisionError
+        Se um pivô nulo for encontrado (matriz singular).
+    ValueError
+        Se ``bloco`` não for positivo.
+    """
+
+    def __init__(self, A, bloco=64):
+        A, _ = _validate_lu_inputs(A, None)
+        try:
+            bloco = int(bloco)
+        except (ValueError, TypeError):
+            raise TypeError(f"bloco deve ser um inteiro. Recebido: {type(bloco)}")
+        if bloco < 1:
+            raise ValueError(f"bloco deve ser um inteiro positivo. Recebido: {bloco}")
+        n = A.shape[0]
+        lu = A.copy()
+        perm = np.arange(n)
+        # LU blocada "right-looking": fatora um painel de colunas e atualiza
+        # o restante da matriz com um único produto matriz-matriz
+        for k0 in range(0, n, bloco):
+            k1 = min(k0 + bloco, n)
+            for k in range(k0, k1):
+                p = k + int(np.argmax(np.abs(lu[k:,k])))
+                if abs(lu[p,k]) < 1e-20:
+                    raise ZeroDivisionError("Pivô zero na fatoração LU - a matriz é singular.")
+                if p != k:
+                    lu[[k,p]] = lu[[p,k]]
+                    perm[[k,p]] = perm[[p,k]]
+                lu[k+1:,k] /= lu[k,k]
+                lu[k+1:,k+1:k1] -= np.outer(lu[k+1:,k], lu[k,k+1:k1])
+            if k1 < n:
+                # U12 = L11^{-1} A12, com L11 triangular inferior unitária
+                for i in range(k0+1, k1):
+                    lu[i,k1:] -= lu[i,k0:i] @ lu[k0:i,k1:]
+                lu[k1:,k1:] -= lu[k1:,k0:k1] @ lu[k0:k1,k1:]
+        self.lu = lu
+        self.perm = perm
+
+    @property
+    def n(self):
+        """Ordem da matriz fatorada."""
+        return self.lu.shape[0]
+
+    @property
+    def L(self):
+        """Matriz triangular inferior com diagonal unitária (densa)."""
+        return np.tril(self.lu, -1) + np.eye(self.n)
+
+    @property
+    def U(self):
+        """Matriz triangular superior (densa)."""
+        return np.triu(self.lu)
+
+    @property
+    def P(self):
+        """Matriz de permutação densa, com ``P @ A = L @ U`` (como em :func:`lu_com_pivot`)."""
+        return np.eye(self.n)[self.perm]
+
+    def solve(self, B, transposta=False):
+        """Resolve ``A X = B`` (ou ``A^T X = B``) reaproveitando a fatoração.
+
+        Parameters
+        ----------
+        B : array_like, shape (n,) or (n, k)
+            Lado(s) direito(s); cada coluna é um sistema independente.
+        transposta : bool, optional
+            Se True, resolve o sistema com ``A^T`` (default: False).
+
+        Returns
+        -------
+        X : np.ndarray
+            Solução com o mesmo formato de ``B``.
+        """
+        B = np.asarray(B, dtype=float)
+        n = self.n
+        if B.ndim not in (1, 2) or B.shape[0] != n:
+            raise ValueError("B deve ter formato (n,) ou (n, k), com n igual à ordem de A.")
+        lu = self.lu
+        if not transposta:
+            # L y = B[perm], depois U x = y; cada passo atua sobre todas as colunas
+            X = B[self.perm].copy()
+            for i in range(1, n):
+                X[i] -= lu[i,:i] @ X[:i]
+            for i in range(n-1, -1, -1):
+                X[i] = (X[i] - lu[i,i+1:] @ X[i+1:]) / lu[i,i]
+            return X
+        # A^T = U^T L^T P: U^T z = B, L^T w = z, x = P^T w
+        Z = B.copy()
+        for i in range(n):
+            Z[i] = (Z[i] - lu[:i,i] @ Z[:i]) / lu[i,i]
+        for i in range(n-2, -1, -1):
+            Z[i] -= lu[i+1:,i] @ Z[i+1:]
+        X = np.empty_like(Z)
+        X[self.perm] = Z
+        return X
+
+def thomas(inferior, diagonal, superior, d):
+    """Resolve um sistema tridiagonal pelo algoritmo de Thomas, em O(n).
+
+    Parameters
+    ----------
+    inferior : array_like, shape (n-1,)
+        Subdiagonal (``A[i+1, i]``).
+    diagonal : array_like, shape (n,)
+        Diagonal principal (``A[i, i]``).
+    superior : array_like, shape (n-1,)
+        Superdiagonal (``A[i, i+1]``).
+    d : array_like, shape (n,) or (n, k)
+        Lado(s) direito(s).
+
+    Returns
+    -------
+    x : np.ndarray
+        Solução com o mesmo formato de ``d``.
+
+    Raises
+    ------
+    ValueError
+        Se os comprimentos das diagonais forem incompatíveis.
+    ZeroDivisionError
+        Se surgir um pivô nulo (o algoritmo não faz pivotamento; é estável
+        para matrizes diagonalmente dominantes ou simétricas definidas positivas).
+    """
+    a = np.asarray(inferior, dtype=float)
+    b = np.asarray(diagonal, dtype=float)
+    c = np.asarray(superior, dtype=float)
+    d = np.asarray(d, dtype=float)
+    n = b.shape[0] if b.ndim == 1 else -1
+    if n < 1 or a.shape != (n-1,) or c.shape != (n-1,):
+        raise ValueError("A diagonal deve ter n elementos e as subdiagonais n-1 elementos.")
+    if d.ndim not in (1, 2) or d.shape[0] != n:
+        raise ValueError("d deve ter formato (n,) ou (n, k), com n igual ao tamanho da diagonal.")
+    c_mod = np.empty(max(n-1, 0))  # superdiagonal normalizada
+    x = d.copy()
+    for i in range(n):
+        pivo = b[i]
+        if i > 0:
+            pivo -= a[i-1] * c_mod[i-1]
+            x[i] -= a[i-1] * x[i-1]
+        if abs(pivo) < 1e-20:
+            raise ZeroDivisionError(f"Pivô zero na linha {i+1} do algoritmo de Thomas.")
+        if i < n-1:
+            c_mod[i] = c[i] / pivo
+        x[i] /= pivo
+    for i in range(n-2, -1, -1):
+        x[i] -= c_mod[i] * x[i+1]
+    return x
+
+def matriz_para_banda(A, kl, ku):
+    """Converte uma matriz densa para o armazenamento compacto de banda (LAPACK).
+
+    O elemento ``A[i, j]`` (com ``-ku <= i - j <= kl``) fica em
+    ``ab[ku + i - j, j]``; as posições fora da matriz ficam nulas.
+
+    Parameters
+    ----------
+    A : array_like, shape (n, n)
+        Matriz de banda.
+    kl, ku : int
+        Número de subdiagonais e superdiagonais.
+
+    Returns
+    -------
+    ab : np.ndarray, shape (kl + ku + 1, n)
+        Banda em formato compacto.
+    """
+    A, _ = _validate_lu_inputs(A, None)
+    kl, ku = _validar_larguras_banda(kl, ku)
+    n = A.shape[0]
+    ab = np.zeros((kl + ku + 1, n))
+    # diagonais além de n - 1 não existem na matriz e ficam nulas
+    for deslocamento in range(-min(ku, n - 1), min(kl, n - 1) + 1):
+        diagonal = np.diagonal(A, -deslocamento)
+        if deslocamento >= 0:
+            ab[ku + deslocamento, :n - deslocamento] = diagonal
+        else:
+            ab[ku + deslocamento, -deslocamento:] = diagonal
+    return ab
+
+def _validar_larguras_banda(kl, ku):
+    try:
+        kl = int(kl); ku = int(ku)
+    except (ValueError, TypeError):
+        raise TypeError("kl e ku devem ser inteiros.")
+    if kl < 0 or ku < 0:
+        raise ValueError("kl e ku devem ser não negativos.")
+    return kl, ku
+
+class FatoracaoBanda:
+    """Fatoração LU com pivotamento parcial de uma matriz de banda.
+
+    Só a banda é armazenada, no layout compacto do LAPACK (``dgbtrf``):
+    ``kl`` linhas extras guardam o preenchimento causado pelas trocas de
+    linha, de modo que a memória é O(n·(2kl + ku + 1)) e o custo da
+    fatoração O(n·kl·(kl + ku)), em vez de O(n³).
+
+    Parameters
+    ----------
+    ab : array_like, shape (kl + ku + 1, n)
+        Banda em formato compacto (``A[i, j] = ab[ku + i - j, j]``), como
+        gerado por :func:`matriz_para_banda`.
+    kl, ku : int
+        Número de subdiagonais e superdiagonais.
+
+    Attributes
+    ----------
+    lub : np.ndarray, shape (2kl + ku + 1, n)
+        ``U`` (com preenchimento) e os multiplicadores de ``L`` em formato
+        compacto: o elemento ``(i, j)`` fica em ``lub[kl + ku + i - j, j]``.
+    piv : np.ndarray of int, shape (n,)
+        Na etapa ``k`` a linha ``k`` foi trocada com a linha ``piv[k]``.
+
+    Raises
+    ------
+    ZeroDivisionError
+        Se um pivô nulo for encontrado (matriz singular).
+    """
+
+    def __init__(self, ab, kl, ku):
+        kl, ku = _validar_larguras_banda(kl, ku)
+        ab = np.asarray(ab, dtype=float)
+        if ab.ndim != 2 or ab.shape[0] != kl + ku + 1:
+            raise ValueError("ab deve ter formato (kl + ku + 1, n).")
+        n = ab.shape[1]
+        lub = np.zeros((2*kl + ku + 1, n))
+        lub[kl:] = ab
+        piv = np.arange(n)
+        centro = kl + ku  # linha de lub que guarda a diagonal principal
+        # deslocamentos (no array achatado) da linha do pivô e da janela de
+        # atualização, calculados uma vez e transladados de k a cada etapa
+        plano = lub.reshape(-1)
+        dj = np.arange(kl + ku + 1)
+        linha_pivo = (centro - dj) * n + dj
+        janela = (centro + np.arange(1, kl + 1)[:, None] - dj[1:]) * n + dj[1:]
+        for k in range(n):
+            m = min(kl, n-1-k)       # elementos abaixo do pivô na coluna k
+            w = min(kl + ku, n-1-k)  # alcance de U na linha k (com preenchimento)
+            p = int(np.argmax(np.abs(lub[centro:centro+m+1, k])))
+            if abs(lub[centro+p, k]) < 1e-20:
+                raise ZeroDivisionError("Pivô zero na fatoração LU de banda - a matriz é singular.")
+            if p != 0:
+                piv[k] = k + p
+                idx = linha_pivo[:w+1] + k
+                linha_k = plano[idx]
+                plano[idx] = plano[idx + p*n]
+                plano[idx + p*n] = linha_k
+            lub[centro+1:centro+m+1, k] /= lub[centro, k]
+            if m and w:
+                # atualização de posto 1 da janela (m x w) abaixo e à direita do pivô
+                plano[janela[:m, :w] + k] -= np.outer(lub[centro+1:centro+m+1, k], plano[linha_pivo[1:w+1] + k])
+        self.kl = kl
+        self.ku = ku
+        self.lub = lub
+        self.piv = piv
+
+    @property
+    def n(self):
+        """Ordem da matriz fatorada."""
+        return self.lub.shape[1]
+
+    def solve(self, B):
+        """Resolve ``A X = B`` reaproveitando a fatoração de banda.
+
+        Parameters
+        ----------
+        B : array_like, shape (n,) or (n, k)
+            Lado(s) direito(s).
+
+        Returns
+        -------
+        X : np.ndarray
+            Solução com o mesmo formato de ``B``.
+        """
+        X = np.array(B, dtype=float)
+        n, kl, ku, lub = self.n, self.kl, self.ku, self.lub
+        if X.ndim not in (1, 2) or X.shape[0] != n:
+            raise ValueError("B deve ter formato (n,) ou (n, k), com n igual à ordem de A.")
+        centro = kl + ku
+        for k in range(n):
+            p = self.piv[k]
+            if p != k:
+                X[[k, p]] = X[[p, k]]
+            m = min(kl, n-1-k)
+            if m:
+                X[k+1:k+m+1] -= np.multiply.outer(lub[centro+1:centro+m+1, k], X[k])
+        plano = lub.reshape(-1)
+        dj = np.arange(1, kl + ku + 1)
+        linha_u = (centro - dj) * n + dj  # linha k de U (sem a diagonal), transladada por k
+        for k in range(n-1, -1, -1):
+            w = min(kl + ku, n-1-k)
+            X[k] = (X[k] - plano[linha_u[:w] + k] @ X[k+1:k+w+1]) / lub[centro, k]
+        return X
+
 def forward_solve(L, b):
     """Resolve o sistema triangular inferior L y = b por substituição progressiva.
 
@@ -405,8 +743,9 @@ def calcular_residuo(A, x, b):
 
     Parameters
     ----------
-    A : array_like
-        Matriz dos coeficientes.
+    A : array_like, MatrizCSR or OperadorLinear
+        Matriz dos coeficientes, ou operador que fornece apenas o produto
+        ``A @ x`` (a matriz não é materializada).
     x : array_like
         Solução candidata do sistema.
     b : array_like
@@ -417,16 +756,17 @@ def calcular_residuo(A, x, b):
     r : np.ndarray
         Vetor resíduo (b - A x).
     """
-    A = np.asarray(A, dtype=float)
+    if not isinstance(A, (MatrizCSR, OperadorLinear)):
+        A = np.asarray(A, dtype=float)
+        if A.ndim != 2:
+            raise ValueError("A deve ser uma matriz 2D.")
     x = np.asarray(x, dtype=float)
     b = np.asarray(b, dtype=float)
-    if A.ndim != 2:
-        raise ValueError("A deve ser uma matriz 2D.")
     if x.ndim != 1 or x.shape[0] != A.shape[1]:
         raise ValueError("x deve ser um vetor 1D com comprimento igual ao número de colunas de A.")
     if b.ndim != 1 or b.shape[0] != A.shape[0]:
         raise ValueError("b deve ser um vetor 1D com comprimento igual ao número de linhas de A.")
-    r = b - A @ x
+    r = b - (A @ x if isinstance(A, np.ndarray) else A.matvec(x))
     return r
 
 def exibir_residuo_detalhado(A, x, b):
@@ -452,6 +792,812 @@ def exibir_residuo_detalhado(A, x, b):
         print(f"{r[i]:>{largura}}")
     print()
 
+class OperadorLinear:
+    """Operador linear definido apenas pelo produto matriz-vetor.
+
+    Permite usar os métodos iterativos (e :func:`calcular_residuo`) com
+    operadores que nunca são montados como matriz, por exemplo um estêncil
+    de diferenças finitas aplicado diretamente à malha.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Dimensões ``(n_linhas, n_colunas)`` do operador.
+    matvec : callable
+        Função ``matvec(x)`` que retorna ``A @ x``.
+    rmatvec : callable, optional
+        Função ``rmatvec(y)`` que retorna ``A^T @ y``.
+    diagonal : array_like or callable, optional
+        Diagonal de ``A`` (ou função sem argumentos que a calcula); usada
+        por :func:`jacobi` e pelo precondicionador de Jacobi.
+
+    Raises
+    ------
+    ValueError
+        Se ``shape`` não for um par de inteiros positivos.
+    TypeError
+        Se ``matvec`` ou ``rmatvec`` não forem funções.
+    """
+
+    def __init__(self, shape, matvec, rmatvec=None, diagonal=None):
+        try:
+            self.shape = (int(shape[0]), int(shape[1]))
+        except (ValueError, TypeError, IndexError):
+            raise ValueError("shape deve ser um par de inteiros (n_linhas, n_colunas).")
+        if len(shape) != 2 or min(self.shape) < 1:
+            raise ValueError("shape deve ser um par de inteiros positivos.")
+        if not callable(matvec) or (rmatvec is not None and not callable(rmatvec)):
+            raise TypeError("matvec e rmatvec devem ser funções.")
+        self._matvec = matvec
+        self._rmatvec = rmatvec
+        self._diagonal = diagonal
+
+    @classmethod
+    def de_matriz(cls, A):
+        """Envolve uma matriz densa ou :class:`MatrizCSR` em um operador."""
+        if isinstance(A, MatrizCSR):
+            return cls(A.shape, A.matvec, A.rmatvec, A.diagonal)
+        A = np.asarray(A, dtype=float)
+        if A.ndim != 2:
+            raise ValueError("A deve ser uma matriz 2D.")
+        return cls(A.shape, A.__matmul__, A.T.__matmul__, np.diagonal(A).copy())
+
+    def matvec(self, x):
+        """Produto ``A @ x``."""
+        x = np.asarray(x, dtype=float)
+        if x.shape != (self.shape[1],):
+            raise ValueError("x deve ser um vetor 1D com comprimento igual ao número de colunas de A.")
+        return np.asarray(self._matvec(x), dtype=float)
+
+    def rmatvec(self, y):
+        """Produto ``A^T @ y`` (exige ``rmatvec`` na construção)."""
+        if self._rmatvec is None:
+            raise ValueError("O operador não define rmatvec (produto pela transposta).")
+        y = np.asarray(y, dtype=float)
+        if y.shape != (self.shape[0],):
+            raise ValueError("y deve ser um vetor 1D com comprimento igual ao número de linhas de A.")
+        return np.asarray(self._rmatvec(y), dtype=float)
+
+    def __matmul__(self, x):
+        return self.matvec(x)
+
+    @property
+    def T(self):
+        """Operador transposto (exige ``rmatvec``)."""
+        if self._rmatvec is None:
+            raise ValueError("O operador não define rmatvec (produto pela transposta).")
+        return OperadorLinear(self.shape[::-1], self._rmatvec, self._matvec)
+
+    def tem_diagonal(self):
+        """Indica se a diagonal foi informada."""
+        return self._diagonal is not None
+
+    def diagonal(self):
+        """Diagonal do operador (exige ``diagonal`` na construção)."""
+        if self._diagonal is None:
+            raise ValueError("O operador não define a diagonal.")
+        diag = self._diagonal() if callable(self._diagonal) else self._diagonal
+        diag = np.asarray(diag, dtype=float)
+        if diag.shape != (min(self.shape),):
+            raise ValueError("A diagonal do operador tem comprimento incorreto.")
+        return diag
+
+class MatrizCSR:
+    """Matriz esparsa no formato CSR (*compressed sparse row*).
+
+    Os elementos não nulos da linha ``i`` são ``data[indptr[i]:indptr[i+1]]``,
+    nas colunas ``indices[indptr[i]:indptr[i+1]]``. Só esses três arrays
+    são guardados, o que permite representar sistemas com milhões de
+    incógnitas sem materializar a matriz densa ``n x n``.
+
+    Parameters
+    ----------
+    data : array_like, shape (nnz,)
+        Valores não nulos, linha a linha.
+    indices : array_like of int, shape (nnz,)
+        Coluna de cada valor.
+    indptr : array_like of int, shape (n_linhas + 1,)
+        Início de cada linha em ``data``/``indices``.
+    shape : tuple of int
+        Dimensões ``(n_linhas, n_colunas)``.
+
+    Raises
+    ------
+    ValueError
+        Se os arrays forem inconsistentes entre si ou com ``shape``.
+    """
+
+    def __init__(self, data, indices, indptr, shape):
+        try:
+            self.data = np.asarray(data, dtype=float)
+            self.indices = np.asarray(indices, dtype=np.int64)
+            self.indptr = np.asarray(indptr, dtype=np.int64)
+            self.shape = (int(shape[0]), int(shape[1]))
+        except (ValueError, TypeError) as e:
+            raise TypeError(f"data, indices, indptr e shape devem ser numéricos. Erro: {e}")
+        n_linhas, n_colunas = self.shape
+        if self.data.ndim != 1 or self.indices.shape != self.data.shape:
+            raise ValueError("data e indices devem ser vetores 1D de mesmo comprimento.")
+        if self.indptr.shape != (n_linhas + 1,) or self.indptr[0] != 0 or self.indptr[-1] != self.data.size:
+            raise ValueError("indptr deve ter n_linhas + 1 elementos, começando em 0 e terminando em nnz.")
+        if np.any(np.diff(self.indptr) < 0):
+            raise ValueError("indptr deve ser não decrescente.")
+        if self.indices.size and (self.indices.min() < 0 or self.indices.max() >= n_colunas):
+            raise ValueError("indices contém colunas fora da matriz.")
+        self._linhas = None
+
+    @classmethod
+    def de_coordenadas(cls, linhas, colunas, valores, shape):
+        """Monta a matriz a partir de triplas ``(i, j, valor)``; repetições são somadas."""
+        linhas = np.asarray(linhas, dtype=np.int64)
+        colunas = np.asarray(colunas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+        if not (linhas.shape == colunas.shape == valores.shape) or linhas.ndim != 1:
+            raise ValueError("linhas, colunas e valores devem ser vetores 1D de mesmo comprimento.")
+        n_linhas, n_colunas = int(shape[0]), int(shape[1])
+        if linhas.size and (linhas.min() < 0 or linhas.max() >= n_linhas):
+            raise ValueError("linhas contém índices fora da matriz.")
+        if colunas.size and (colunas.min() < 0 or colunas.max() >= n_colunas):
+            raise ValueError("colunas contém índices fora da matriz.")
+        # ordena por (linha, coluna) e soma as entradas repetidas
+        chave = linhas * n_colunas + colunas
+        ordem = np.argsort(chave, kind='stable')
+        chave, valores = chave[ordem], valores[ordem]
+        novo = np.ones(chave.size, dtype=bool)
+        novo[1:] = chave[1:] != chave[:-1]
+        inicio = np.flatnonzero(novo)
+        valores = np.add.reduceat(valores, inicio) if chave.size else valores
+        chave = chave[inicio]
+        linhas, colunas = chave // n_colunas, chave % n_colunas
+        indptr = np.zeros(n_linhas + 1, dtype=np.int64)
+        np.cumsum(np.bincount(linhas, minlength=n_linhas), out=indptr[1:])
+        return cls(valores, colunas, indptr, (n_linhas, n_colunas))
+
+    @classmethod
+    def de_densa(cls, A):
+        """Converte uma matriz densa, guardando apenas os elementos não nulos."""
+        A = np.asarray(A, dtype=float)
+        if A.ndim != 2:
+            raise ValueError("A deve ser uma matriz 2D.")
+        linhas, colunas = np.nonzero(A)
+        return cls.de_coordenadas(linhas, colunas, A[linhas, colunas], A.shape)
+
+    @property
+    def nnz(self):
+        """Número de elementos armazenados."""
+        return self.data.size
+
+    def _indices_linhas(self):
+        # linha de cada elemento armazenado (calculada uma vez)
+        if self._linhas is None:
+            self._linhas = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return self._linhas
+
+    def matvec(self, x):
+        """Produto ``A @ x`` para um vetor ``x``."""
+        x = np.asarray(x, dtype=float)
+        if x.shape != (self.shape[1],):
+            raise ValueError("x deve ser um vetor 1D com comprimento igual ao número de colunas de A.")
+        # bincount devolve inteiros quando não há pesos (matriz vazia)
+        return np.bincount(self._indices_linhas(), weights=self.data * x[self.indices],
+                           minlength=self.shape[0]).astype(float, copy=False)
+
+    def rmatvec(self, y):
+        """Produto ``A^T @ y`` para um vetor ``y``."""
+        y = np.asarray(y, dtype=float)
+        if y.shape != (self.shape[0],):
+            raise ValueError("y deve ser um vetor 1D com comprimento igual ao número de linhas de A.")
+        return np.bincount(self.indices, weights=self.data * y[self._indices_linhas()],
+                           minlength=self.shape[1]).astype(float, copy=False)
+
+    def __matmul__(self, x):
+        return self.matvec(x)
+
+    def diagonal(self):
+        """Diagonal principal (zeros onde não há elemento armazenado)."""
+        d = np.zeros(min(self.shape))
+        linhas = self._indices_linhas()
+        na_diagonal = linhas == self.indices
+        np.add.at(d, linhas[na_diagonal], self.data[na_diagonal])
+        return d
+
+    def todensa(self):
+        """Retorna a matriz densa equivalente (apenas para matrizes pequenas)."""
+        A = np.zeros(self.shape)
+        np.add.at(A, (self._indices_linhas(), self.indices), self.data)
+        return A
+
+def _como_csr(A):
+    """Aceita uma :class:`MatrizCSR` ou uma matriz densa quadrada."""
+    if isinstance(A, OperadorLinear) or callable(A):
+        raise ValueError("Este método precisa da matriz explícita (densa ou MatrizCSR), "
+                         "não apenas do produto matriz-vetor.")
+    if not isinstance(A, MatrizCSR):
+        A, _ = _validate_lu_inputs(A, None)
+        A = MatrizCSR.de_densa(A)
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("A deve ser uma matriz quadrada.")
+    return A
+
+def diagonal_dominante(A, estrita=True):
+    """Verifica se ``A`` é diagonalmente dominante por linhas.
+
+    Condição suficiente para a convergência de Jacobi e Gauss-Seidel:
+    ``|a_ii| > sum_{j != i} |a_ij|`` para todo ``i`` (``>=`` se ``estrita=False``).
+
+    Parameters
+    ----------
+    A : MatrizCSR or array_like
+        Matriz quadrada.
+    estrita : bool, optional
+        Exige dominância estrita (default: True).
+
+    Returns
+    -------
+    bool
+        True se a condição vale em todas as linhas.
+    """
+    A = _como_csr(A)
+    diag = np.abs(A.diagonal())
+    soma_linhas = np.bincount(A._indices_linhas(), weights=np.abs(A.data), minlength=A.shape[0])
+    fora = soma_linhas - diag
+    return bool(np.all(diag > fora) if estrita else np.all(diag >= fora))
+
+def _preparar_iterativo(A, b, x0, tol, max_iter):
+    """Validação comum aos métodos iterativos estacionários."""
+    if isinstance(A, OperadorLinear):
+        if A.shape[0] != A.shape[1]:
+            raise ValueError("A deve ser um operador quadrado.")
+    else:
+        A = _como_csr(A)
+    n = A.shape[0]
+    try:
+        b = np.asarray(b, dtype=float)
+        x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+        tol = float(tol); max_iter = int(max_iter)
+    except (ValueError, TypeError):
+        raise TypeError("b e x0 devem ser numéricos, tol um número e max_iter um inteiro.")
+    if b.shape != (n,):
+        raise ValueError("b deve ser um vetor 1D com comprimento igual ao número de linhas de A.")
+    if x.shape != (n,):
+        raise ValueError("x0 deve ser um vetor 1D com comprimento igual ao número de colunas de A.")
+    diag = A.diagonal()
+    if np.any(diag == 0):
+        raise ValueError("A diagonal de A não pode ter elementos nulos nos métodos iterativos.")
+    return A, b, x, tol, max_iter, diag
+
+def jacobi(A, b, x0=None, tol=1e-8, max_iter=1000, verbose=False):
+    """Resolve ``A x = b`` pelo método de Jacobi.
+
+    Cada varredura é totalmente vetorizada: ``x <- x + (b - A x) / diag(A)``.
+    O critério de parada é o resíduo relativo ``||b - A x|| / ||b|| < tol``.
+
+    Parameters
+    ----------
+    A : MatrizCSR, OperadorLinear or array_like, shape (n, n)
+        Matriz dos coeficientes (esparsa ou densa) ou operador com diagonal.
+    b : array_like, shape (n,)
+        Vetor dos termos independentes.
+    x0 : array_like, optional
+        Aproximação inicial (default: vetor nulo).
+    tol : float, optional
+        Tolerância do resíduo relativo (default: 1e-8).
+    max_iter : int, optional
+        Número máximo de varreduras (default: 1000).
+    verbose : bool, optional
+        Se True, avisa quando A não é diagonalmente dominante e imprime o
+        resíduo a cada iteração.
+
+    Returns
+    -------
+    tuple
+        ``(x, n_iter, historico)``: solução (``None`` se não convergir),
+        número de iterações e array com o resíduo relativo de cada iteração.
+    """
+    A, b, x, tol, max_iter, diag = _preparar_iterativo(A, b, x0, tol, max_iter)
+    if verbose and isinstance(A, MatrizCSR) and not diagonal_dominante(A):
+        print("Aviso: A não é estritamente diagonalmente dominante; a convergência não é garantida.")
+    norma_b = np.linalg.norm(b) or 1.0
+    historico = []
+    r = b - A.matvec(x)
+    for i in range(1, max_iter + 1):
+        x += r / diag
+        r = b - A.matvec(x)
+        historico.append(np.linalg.norm(r) / norma_b)
+        if verbose:
+            print(f"Iteração {i}: resíduo relativo = {historico[-1]:.6e}")
+        if historico[-1] < tol:
+            return x, i, np.array(historico)
+    print(f"Jacobi não convergiu em {max_iter} iterações.")
+    return None, max_iter, np.array(historico)
+
+def sor(A, b, omega=1.0, x0=None, tol=1e-8, max_iter=1000, verbose=False):
+    """Resolve ``A x = b`` pelo método SOR (sobre-relaxação sucessiva).
+
+    Cada linha é atualizada com os valores mais recentes de ``x``:
+    ``x_i <- x_i + omega * (b_i - A[i, :] x) / a_ii``. Com ``omega = 1``
+    obtém-se Gauss-Seidel. A varredura é sequencial por natureza, mas cada
+    linha usa apenas os seus elementos não nulos.
+
+    Parameters
+    ----------
+    A : MatrizCSR or array_like, shape (n, n)
+        Matriz dos coeficientes (esparsa ou densa).
+    b : array_like, shape (n,)
+        Vetor dos termos independentes.
+    omega : float, optional
+        Fator de relaxação, ``0 < omega < 2`` (default: 1.0).
+    x0 : array_like, optional
+        Aproximação inicial (default: vetor nulo).
+    tol : float, optional
+        Tolerância do resíduo relativo (default: 1e-8).
+    max_iter : int, optional
+        Número máximo de varreduras (default: 1000).
+    verbose : bool, optional
+        Se True, avisa quando A não é diagonalmente dominante e imprime o
+        resíduo a cada iteração.
+
+    Returns
+    -------
+    tuple
+        ``(x, n_iter, historico)``: solução (``None`` se não convergir),
+        número de iterações e array com o resíduo relativo de cada iteração.
+
+    Raises
+    ------
+    ValueError
+        Se ``omega`` estiver fora de ``(0, 2)`` ou a diagonal tiver zeros.
+    """
+    if isinstance(A, OperadorLinear):
+        raise ValueError("Gauss-Seidel e SOR precisam das linhas de A (matriz densa ou MatrizCSR).")
+    A, b, x, tol, max_iter, diag = _preparar_iterativo(A, b, x0, tol, max_iter)
+    omega = float(omega)
+    if not 0 < omega < 2:
+        raise ValueError("omega deve estar no intervalo (0, 2).")
+    if verbose and not diagonal_dominante(A):
+        print("Aviso: A não é estritamente diagonalmente dominante; a convergência não é garantida.")
+    data, indices, indptr = A.data, A.indices, A.indptr
+    fator = omega / diag
+    norma_b = np.linalg.norm(b) or 1.0
+    historico = []
+    for it in range(1, max_iter + 1):
+        for i in range(A.shape[0]):
+            ini, fim = indptr[i], indptr[i+1]
+            x[i] += fator[i] * (b[i] - data[ini:fim] @ x[indices[ini:fim]])
+        historico.append(np.linalg.norm(b - A.matvec(x)) / norma_b)
+        if verbose:
+            print(f"Iteração {it}: resíduo relativo = {historico[-1]:.6e}")
+        if historico[-1] < tol:
+            return x, it, np.array(historico)
+    print(f"SOR (omega={omega}) não convergiu em {max_iter} iterações.")
+    return None, max_iter, np.array(historico)
+
+def gauss_seidel(A, b, x0=None, tol=1e-8, max_iter=1000, verbose=False):
+    """Resolve ``A x = b`` pelo método de Gauss-Seidel (:func:`sor` com ``omega = 1``).
+
+    Returns
+    -------
+    tuple
+        ``(x, n_iter, historico)``, como em :func:`sor`.
+    """
+    return sor(A, b, 1.0, x0, tol, max_iter, verbose)
+
+def _produto_em(A):
+    """Retorna ``(n, produto)``, com ``produto(x, out)`` gravando ``A @ x`` em ``out``.
+
+    Aceita matriz densa, :class:`MatrizCSR`, :class:`OperadorLinear` ou
+    função ``A(x)`` (sem matriz explícita); nesse último caso ``n`` é ``None``.
+    """
+    if isinstance(A, (MatrizCSR, OperadorLinear)):
+        if A.shape[0] != A.shape[1]:
+            raise ValueError("A deve ser uma matriz quadrada.")
+        def produto(x, out):
+            out[:] = A.matvec(x)
+        return A.shape[0], produto
+    if callable(A):
+        def produto(x, out):
+            out[:] = A(x)
+        return None, produto
+    A, _ = _validate_lu_inputs(A, None)
+    def produto(x, out):
+        np.dot(A, x, out=out)
+    return A.shape[0], produto
+
+def _preparar_krylov(A, b, x0, tol, max_iter):
+    """Validação comum aos métodos de Krylov."""
+    n, produto = _produto_em(A)
+    try:
+        b = np.asarray(b, dtype=float)
+        tol = float(tol)
+    except (ValueError, TypeError):
+        raise TypeError("b deve ser numérico e tol um número.")
+    if b.ndim != 1 or (n is not None and b.shape[0] != n):
+        raise ValueError("b deve ser um vetor 1D com comprimento igual ao número de linhas de A.")
+    n = b.shape[0]
+    try:
+        x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+        max_iter = n if max_iter is None else int(max_iter)
+    except (ValueError, TypeError):
+        raise TypeError("x0 deve ser numérico e max_iter um inteiro.")
+    if x.shape != (n,):
+        raise ValueError("x0 deve ser um vetor 1D com comprimento igual ao número de colunas de A.")
+    return produto, n, b, x, tol, max_iter
+
+def _diagonal_de(A):
+    """Diagonal de uma matriz densa, :class:`MatrizCSR` ou :class:`OperadorLinear` (None se indisponível)."""
+    if isinstance(A, MatrizCSR):
+        return A.diagonal()
+    if isinstance(A, OperadorLinear):
+        return A.diagonal() if A.tem_diagonal() else None
+    if callable(A):
+        return None
+    return np.diagonal(np.asarray(A, dtype=float)).copy()
+
+def precondicionador_jacobi(A):
+    """Precondicionador de Jacobi (diagonal): ``M^{-1} r = r / diag(A)``.
+
+    Parameters
+    ----------
+    A : MatrizCSR or array_like
+        Matriz do sistema.
+
+    Returns
+    -------
+    callable
+        Função ``M(r, out=None)`` que aplica ``M^{-1}`` a ``r``.
+    """
+    diag = _diagonal_de(A)
+    if diag is None:
+        raise ValueError("O precondicionador de Jacobi precisa da diagonal de A.")
+    if np.any(diag == 0):
+        raise ValueError("A diagonal de A não pode ter elementos nulos.")
+    inverso = 1.0 / diag
+
+    def aplicar(r, out=None):
+        return np.multiply(r, inverso, out=out)
+    return aplicar
+
+def precondicionador_ic0(A):
+    """Precondicionador de Cholesky incompleta sem preenchimento, IC(0).
+
+    Calcula ``L`` triangular inferior com o mesmo padrão de esparsidade do
+    triângulo inferior de ``A`` e ``A ≈ L L^T``; a aplicação de ``M^{-1}``
+    são duas substituições triangulares esparsas, vetorizadas por níveis
+    de dependência entre as linhas.
+
+    Parameters
+    ----------
+    A : MatrizCSR or array_like
+        Matriz simétrica definida positiva.
+
+    Returns
+    -------
+    callable
+        Função ``M(r, out=None)`` que aplica ``(L L^T)^{-1}`` a ``r``.
+
+    Raises
+    ------
+    ValueError
+        Se a fatoração incompleta falhar (pivô não positivo), o que pode
+        ocorrer para matrizes SPD que não sejam M-matrizes.
+    """
+    A = _como_csr(A)
+    n = A.shape[0]
+    linhas = []  # linha i de L como dicionário coluna -> valor
+    for i in range(n):
+        ini, fim = A.indptr[i], A.indptr[i+1]
+        cols, vals = A.indices[ini:fim], A.data[ini:fim]
+        baixo = cols <= i
+        linha = {}
+        for j, v in zip(cols[baixo].tolist(), vals[baixo].tolist()):
+            linha[j] = linha.get(j, 0.0) + v
+        for k in sorted(c for c in linha if c < i):
+            linha_k = linhas[k]
+            soma = sum(v * linha_k[j] for j, v in linha.items() if j < k and j in linha_k)
+            linha[k] = (linha[k] - soma) / linha_k[k]
+        d = linha.get(i, 0.0) - sum(v * v for j, v in linha.items() if j < i)
+        if d <= 0:
+            raise ValueError(f"Cholesky incompleta falhou na linha {i+1} (pivô não positivo).")
+        linha[i] = np.sqrt(d)
+        linhas.append(linha)
+
+    ordenadas = [sorted(linha.items()) for linha in linhas]
+    linhas_idx = np.repeat(np.arange(n), [len(l) for l in ordenadas])
+    colunas = np.array([j for l in ordenadas for j, _ in l], dtype=np.int64)
+    valores = np.array([v for l in ordenadas for _, v in l])
+    niveis_L = _niveis_triangular(MatrizCSR.de_coordenadas(linhas_idx, colunas, valores, (n, n)), True)
+    niveis_LT = _niveis_triangular(MatrizCSR.de_coordenadas(colunas, linhas_idx, valores, (n, n)), False)
+
+    def aplicar(r, out=None):
+        y = np.empty(n) if out is None else out
+        _resolver_por_niveis(niveis_L, r, y)
+        _resolver_por_niveis(niveis_LT, y, y)
+        return y
+    return aplicar
+
+def _niveis_triangular(T, inferior):
+    """Agrupa as linhas de uma matriz triangular esparsa em níveis independentes.
+
+    A linha ``i`` fica no nível ``1 + max(nível das linhas de que depende)``;
+    todas as linhas de um mesmo nível podem ser resolvidas juntas, de forma
+    vetorizada (*level scheduling*). Para matrizes de diferenças finitas em
+    malhas 2D há apenas O(sqrt(n)) níveis.
+    """
+    n = T.shape[0]
+    entrada_linha = T._indices_linhas()
+    fora = T.indices != entrada_linha
+    diag = np.zeros(n)
+    diag[entrada_linha[~fora]] = T.data[~fora]
+    nivel = np.zeros(n, dtype=np.int64)
+    indptr, indices = T.indptr, T.indices
+    for i in (range(n) if inferior else range(n-1, -1, -1)):
+        cols = indices[indptr[i]:indptr[i+1]]
+        cols = cols[cols != i]
+        if cols.size:
+            nivel[i] = nivel[cols].max() + 1
+    n_niveis = int(nivel.max()) + 1 if n else 0
+
+    e_linha, e_coluna, e_valor = entrada_linha[fora], T.indices[fora], T.data[fora]
+    ordem_linhas = np.argsort(nivel, kind='stable')
+    ordem_entradas = np.argsort(nivel[e_linha], kind='stable')
+    cortes_linhas = np.searchsorted(nivel[ordem_linhas], np.arange(n_niveis + 1))
+    cortes_entradas = np.searchsorted(nivel[e_linha][ordem_entradas], np.arange(n_niveis + 1))
+    posicao = np.empty(n, dtype=np.int64)
+    niveis = []
+    for l in range(n_niveis):
+        linhas = ordem_linhas[cortes_linhas[l]:cortes_linhas[l+1]]
+        posicao[linhas] = np.arange(linhas.size)
+        sel = ordem_entradas[cortes_entradas[l]:cortes_entradas[l+1]]
+        niveis.append((linhas, posicao[e_linha[sel]], e_coluna[sel], e_valor[sel], diag[linhas]))
+    return niveis
+
+def _resolver_por_niveis(niveis, r, y):
+    """Substituição triangular esparsa, nível a nível; grava a solução em ``y``."""
+    for linhas, posicao, colunas, valores, diag in niveis:
+        soma = np.bincount(posicao, weights=valores * y[colunas], minlength=linhas.size)
+        y[linhas] = (r[linhas] - soma) / diag
+
+def _como_precondicionador(A, precondicionador):
+    """Converte ``None``, ``'jacobi'``, ``'ic0'``, ``'lu'`` ou uma função em ``M(r, out)``."""
+    if precondicionador is None:
+        def identidade(r, out=None):
+            if out is None:
+                return r.copy()
+            out[:] = r
+            return out
+        return identidade
+    if isinstance(precondicionador, str):
+        opcoes = {'jacobi': precondicionador_jacobi, 'ic0': precondicionador_ic0,
+                  'lu': precondicionador_lu}
+        if precondicionador not in opcoes:
+            raise ValueError(f"Precondicionador desconhecido: '{precondicionador}'. "
+                             f"Use um de {sorted(opcoes)} ou uma função.")
+        return opcoes[precondicionador](A)
+    if not callable(precondicionador):
+        raise TypeError("precondicionador deve ser None, uma string ou uma função.")
+
+    def aplicar(r, out=None):
+        z = np.asarray(precondicionador(r), dtype=float)
+        if out is None:
+            return z
+        out[:] = z
+        return out
+    return aplicar
+
+def gradiente_conjugado(A, b, x0=None, tol=1e-8, max_iter=None, precondicionador=None,
+                        verbose=False):
+    """Resolve ``A x = b`` (A simétrica definida positiva) por gradientes conjugados.
+
+    Aceita a matriz densa, uma :class:`MatrizCSR` ou apenas a função
+    ``A(x)`` que calcula o produto (sem montar a matriz). Os vetores de
+    trabalho (resíduo, direção, ``A p``, ...) são alocados uma única vez e
+    atualizados no lugar a cada iteração.
+
+    Parameters
+    ----------
+    A : array_like, MatrizCSR, OperadorLinear or callable
+        Matriz (ou operador) simétrica definida positiva.
+    b : array_like, shape (n,)
+        Vetor dos termos independentes.
+    x0 : array_like, optional
+        Aproximação inicial (default: vetor nulo).
+    tol : float, optional
+        Tolerância do resíduo relativo ``||b - A x|| / ||b||`` (default: 1e-8).
+    max_iter : int, optional
+        Número máximo de iterações (default: ``n``).
+    precondicionador : {None, 'jacobi', 'ic0', 'lu'} or callable, optional
+        Precondicionador: diagonal, Cholesky incompleta IC(0), LU de ``A``
+        (:func:`precondicionador_lu`) ou uma função ``M(r)`` que aproxima
+        ``A^{-1} r`` (default: sem precondicionamento).
+    verbose : bool, optional
+        Se True, imprime o resíduo relativo a cada iteração.
+
+    Returns
+    -------
+    tuple
+        ``(x, n_iter, historico)``: solução (``None`` se não convergir ou se
+        A não for definida positiva), número de iterações e array com o
+        resíduo relativo de cada iteração.
+    """
+    produto, n, b, x, tol, max_iter = _preparar_krylov(A, b, x0, tol, max_iter)
+    M = _como_precondicionador(A, precondicionador)
+
+    r = np.empty(n)
+    produto(x, r)
+    np.subtract(b, r, out=r)
+    z = M(r, np.empty(n))
+    p = z.copy()
+    Ap = np.empty(n)
+    aux = np.empty(n)
+    rz = r @ z
+    norma_b = np.linalg.norm(b) or 1.0
+    historico = [np.linalg.norm(r) / norma_b]
+    if historico[0] < tol:
+        return x, 0, np.array(historico)
+    for i in range(1, max_iter + 1):
+        produto(p, Ap)
+        pAp = p @ Ap
+        if pAp <= 0:
+            print("Gradiente conjugado interrompido: A não é definida positiva.")
+            return None, i, np.array(historico)
+        alpha = rz / pAp
+        np.multiply(p, alpha, out=aux)
+        x += aux
+        np.multiply(Ap, alpha, out=aux)
+        r -= aux
+        historico.append(np.linalg.norm(r) / norma_b)
+        if verbose:
+            print(f"Iteração {i}: resíduo relativo = {historico[-1]:.6e}")
+        if historico[-1] < tol:
+            return x, i, np.array(historico)
+        M(r, z)
+        rz_novo = r @ z
+        p *= rz_novo / rz
+        p += z
+        rz = rz_novo
+    print(f"Gradiente conjugado não convergiu em {max_iter} iterações.")
+    return None, max_iter, np.array(historico)
+
+def precondicionador_lu(M, bloco=64):
+    """Precondicionador a partir da fatoração LU de uma matriz ``M ≈ A``.
+
+    ``M`` é fatorada uma vez com :class:`FatoracaoLU`; cada aplicação é
+    então apenas um par de substituições triangulares. Usar ``M = A``
+    resolve o sistema diretamente; na prática ``M`` costuma ser uma versão
+    mais simples de ``A`` (por exemplo, só a parte difusiva de um operador
+    de convecção-difusão, ou uma matriz de um passo anterior).
+
+    Parameters
+    ----------
+    M : MatrizCSR or array_like, shape (n, n)
+        Matriz que aproxima ``A``.
+    bloco : int, optional
+        Tamanho do bloco da fatoração LU (default: 64).
+
+    Returns
+    -------
+    callable
+        Função ``M(r, out=None)`` que aplica ``M^{-1}`` a ``r``.
+    """
+    if isinstance(M, MatrizCSR):
+        M = M.todensa()
+    elif isinstance(M, OperadorLinear) or callable(M):
+        raise ValueError("O precondicionador LU precisa da matriz explícita.")
+    fatoracao = FatoracaoLU(M, bloco)
+
+    def aplicar(r, out=None):
+        z = fatoracao.solve(r)
+        if out is None:
+            return z
+        out[:] = z
+        return out
+    return aplicar
+
+def gmres(A, b, x0=None, tol=1e-8, max_iter=None, reinicio=30, precondicionador=None,
+          verbose=False):
+    """Resolve ``A x = b`` pelo GMRES com reinícios, para matrizes não simétricas.
+
+    A cada ciclo constrói-se uma base de Krylov de até ``reinicio`` vetores
+    pelo processo de Arnoldi com Gram-Schmidt modificado; o problema de
+    mínimos quadrados com a matriz de Hessenberg é resolvido de forma
+    incremental com rotações de Givens, o que dá o resíduo de cada iteração
+    sem custo extra. A base e a matriz de Hessenberg são alocadas uma única
+    vez e reutilizadas nos reinícios. O precondicionamento é à direita, de
+    modo que o resíduo monitorado é o do sistema original.
+
+    Parameters
+    ----------
+    A : array_like, MatrizCSR, OperadorLinear or callable
+        Matriz (ou operador ``A(x)``) do sistema.
+    b : array_like, shape (n,)
+        Vetor dos termos independentes.
+    x0 : array_like, optional
+        Aproximação inicial (default: vetor nulo).
+    tol : float, optional
+        Tolerância do resíduo relativo ``||b - A x|| / ||b||`` (default: 1e-8).
+    max_iter : int, optional
+        Número máximo total de iterações de Arnoldi (default: ``n``).
+    reinicio : int, optional
+        Dimensão máxima da base de Krylov antes de reiniciar (default: 30).
+    precondicionador : {None, 'jacobi', 'ic0', 'lu'} or callable, optional
+        Precondicionador à direita; ``'lu'`` usa :func:`precondicionador_lu`
+        com a própria ``A`` (default: sem precondicionamento).
+    verbose : bool, optional
+        Se True, imprime o resíduo relativo a cada iteração.
+
+    Returns
+    -------
+    tuple
+        ``(x, n_iter, historico)``: solução (``None`` se não convergir),
+        número total de iterações e array com o resíduo relativo de cada
+        iteração (o primeiro elemento é o resíduo inicial).
+    """
+    produto, n, b, x, tol, max_iter = _preparar_krylov(A, b, x0, tol, max_iter)
+    try:
+        reinicio = int(reinicio)
+    except (ValueError, TypeError):
+        raise TypeError("reinicio deve ser um inteiro.")
+    if reinicio < 1:
+        raise ValueError("reinicio deve ser um inteiro positivo.")
+    M = _como_precondicionador(A, precondicionador)
+
+    m = min(reinicio, n)
+    V = np.empty((m + 1, n))   # base de Krylov, um vetor por linha
+    H = np.zeros((m + 1, m))   # Hessenberg (triangularizada pelas rotações)
+    cs, sn = np.zeros(m), np.zeros(m)
+    g = np.zeros(m + 1)
+    r, w, aux = np.empty(n), np.empty(n), np.empty(n)
+    norma_b = np.linalg.norm(b) or 1.0
+    historico = []
+    total = 0
+    while True:
+        produto(x, r)
+        np.subtract(b, r, out=r)
+        beta = np.linalg.norm(r)
+        if not historico:
+            historico.append(beta / norma_b)
+        if beta / norma_b < tol:
+            return x, total, np.array(historico)
+        if total >= max_iter:
+            break
+        np.divide(r, beta, out=V[0])
+        H[:] = 0.0
+        g[:] = 0.0
+        g[0] = beta
+        k = 0
+        for j in range(m):
+            M(V[j], aux)
+            produto(aux, w)
+            for i in range(j + 1):
+                H[i, j] = w @ V[i]
+                np.multiply(V[i], H[i, j], out=aux)
+                w -= aux
+            H[j+1, j] = np.linalg.norm(w)
+            if H[j+1, j] > 0:
+                np.divide(w, H[j+1, j], out=V[j+1])
+            for i in range(j):
+                H[i, j], H[i+1, j] = (cs[i] * H[i, j] + sn[i] * H[i+1, j],
+                                      -sn[i] * H[i, j] + cs[i] * H[i+1, j])
+            raio = np.hypot(H[j, j], H[j+1, j])
+            if raio == 0:
+                print("GMRES interrompido: matriz singular.")
+                return None, total, np.array(historico)
+            cs[j], sn[j] = H[j, j] / raio, H[j+1, j] / raio
+            H[j, j], H[j+1, j] = raio, 0.0
+            g[j+1] = -sn[j] * g[j]
+            g[j] = cs[j] * g[j]
+            total += 1
+            k = j + 1
+            historico.append(abs(g[j+1]) / norma_b)
+            if verbose:
+                print(f"Iteração {total}: resíduo relativo = {historico[-1]:.6e}")
+            if historico[-1] < tol or total >= max_iter:
+                break
+        y = backward_solve(H[:k, :k], g[:k])
+        x += M(V[:k].T @ y, aux)
+    print(f"GMRES não convergiu em {max_iter} iterações.")
+    return None, max_iter, np.array(historico)
+
 def menu():
     while True:
         print("\nMenu de métodos para resolver sistemas lineares:")
@@ -0,0 +1,45 @@
+"""Benchmark: LU blocada (`FatoracaoLU`) versus `lu_com_pivot`.
+
+Mede o tempo de fatoração para matrizes aleatórias de ordem crescente e,
+para a maior ordem, o efeito do tamanho do bloco. ``lu_com_pivot`` só é
+medida até ``N_MAX_REFERENCIA`` por ser lenta para ``n`` grande.
+
+Uso: ``PYTHONPATH=. python tests/exemplos/benchmark_lu_blocada.py [n1 n2 ...]``
+"""
+
+import sys
+import time
+
+import numpy as np
+from codigos import sistemaslineares as sl
+
+N_MAX_REFERENCIA = 800
+
+
+def cronometrar(func, repeticoes=3):
+    """Menor tempo (s) entre ``repeticoes`` execuções de ``func()``."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+if __name__ == '__main__':
+    ordens = [int(n) for n in sys.argv[1:]] or [100, 200, 400, 800, 1600]
+    rng = np.random.default_rng(0)
+
+    print(f"{'n':>6} {'lu_com_pivot':>14} {'não blocada':>14} {'blocada (64)':>14} {'ganho':>8}")
+    for n in ordens:
+        A = rng.standard_normal((n, n))
+        t_ref = cronometrar(lambda: sl.lu_com_pivot(A, None), 1) if n <= N_MAX_REFERENCIA else float('nan')
+        t_simples = cronometrar(lambda: sl.FatoracaoLU(A, bloco=n))
+        t_blocada = cronometrar(lambda: sl.FatoracaoLU(A, bloco=64))
+        print(f"{n:>6} {t_ref:>14.4f} {t_simples:>14.4f} {t_blocada:>14.4f} {t_simples / t_blocada:>7.1f}x")
+
+    n = ordens[-1]
+    A = rng.standard_normal((n, n))
+    print(f"\nTamanho do bloco (n = {n}):")
+    for bloco in (8, 16, 32, 64, 128, 256):
+        print(f"{bloco:>6} {cronometrar(lambda: sl.FatoracaoLU(A, bloco=bloco)):>10.4f} s")
@@ -0,0 +1,84 @@
+"""Testes para o módulo `codigos.expressoes`.
+
+- Cache LRU: contagem de hits/misses, descarte (eviction) e limpeza
+- Compilação: `lambdify` vetorizado, backend `math` e fallback com `eval`
+- Integração: chamadas repetidas de `raizes` e `integracoes` reaproveitam o cache
+"""
+
+import math
+import numpy as np
+import pytest
+from codigos import expressoes, raizes, integracoes
+
+
+def test_cache_lru_hits_misses_evictions():
+    """Verifica as estatísticas e a política LRU de `CacheExpressoes`.
+
+    - Capacidade 2: a terceira chave descarta a menos usada recentemente
+    """
+    cache = expressoes.CacheExpressoes(2)
+    assert cache.obter('a', lambda: 1) == 1
+    assert cache.obter('b', lambda: 2) == 2
+    assert cache.obter('a', lambda: -1) == 1  # hit, 'a' passa a ser a mais recente
+    cache.obter('c', lambda: 3)               # descarta 'b'
+    info = cache.info()
+    assert info['hits'] == 1
+    assert info['misses'] == 3
+    assert info['evictions'] == 1
+    assert info['tamanho'] == 2
+    assert cache.obter('b', lambda: 20) == 20
+    cache.limpar()
+    assert len(cache) == 0
+    assert cache.info()['hits'] == 0
+
+
+def test_cache_capacidade_invalida():
+    """Capacidade não positiva deve ser rejeitada."""
+    with pytest.raises(ValueError):
+        expressoes.CacheExpressoes(0)
+
+
+def test_compilar_lambdify_reaproveita_cache():
+    """A mesma expressão (com espaços diferentes) é compilada uma única vez."""
+    expressoes.limpar_cache()
+    f1 = expressoes.compilar_lambdify('x**2 - 4')
+    f2 = expressoes.compilar_lambdify('  x**2   - 4 ')
+    assert f1 is f2
+    assert np.allclose(f1(np.array([0.0, 2.0])), [-4.0, 0.0])
+    assert expressoes.info_cache()['hits'] >= 1
+
+
+def test_compilar_lambdify_backend_math_e_variaveis():
+    """Backend `math` e múltiplas variáveis geram funções independentes."""
+    g = expressoes.compilar_lambdify('math.exp(x) - y', ('x', 'y'), modulos='math')
+    assert abs(g(0.0, 1.0)) < 1e-15
+    with pytest.raises(ValueError):
+        expressoes.compilar_lambdify('x + z')
+
+
+def test_compilar_eval_fallback():
+    """`compilar_eval` avalia expressões Python com `math` e rejeita sintaxe inválida."""
+    g = expressoes.compilar_eval('math.sqrt(x) + y', ('x', 'y'))
+    assert g(4.0, 1.0) == 3.0
+    with pytest.raises(ValueError):
+        expressoes.compilar_eval('x +* 2')
+
+
+def test_entradas_de_raizes_e_integracoes_usam_cache():
+    """Chamadas repetidas de `raizes.f` e `newton_cotes` geram apenas hits."""
+    expressoes.limpar_cache()
+    raizes.f(1.0, 'x**3 - 1')
+    integracoes.newton_cotes('x**3 - 1', 0.0, 1.0, 2)
+    misses = expressoes.info_cache()['misses']
+    for _ in range(5):
+        assert raizes.f(1.0, 'x**3 - 1') == 0.0
+        assert math.isclose(integracoes.newton_cotes('x**3 - 1', 0.0, 1.0, 2), -0.75)
+    assert expressoes.info_cache()['misses'] == misses
+
+
+def test_compilar_derivadas_fundida():
+    """`compilar_derivadas` retorna f e derivadas em uma única chamada."""
+    g = expressoes.compilar_derivadas('x**3 - 2*x', ordem=2)
+    fx, d1, d2 = g(2.0)
+    assert (fx, d1, d2) == (4.0, 10.0, 12.0)
+    assert expressoes.compilar_derivadas('x**3 - 2*x', ordem=2) is g
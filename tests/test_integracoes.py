@@ -114,3 +114,24 @@ def test_simpson_3_8_composta_monkeypatch(monkeypatch):
     res = ig.simpson_3_8_composta('x**3', 0.0, 1.0)
     # integral of x^3 from 0 to1 = 1/4
     assert pytest.approx(res, rel=1e-12) == 0.25
+
+
+def test_regras_fallback_compilam_uma_vez(monkeypatch):
+    """Sem lambdify, a expressão é compilada uma única vez para todos os nós.
+
+    - f(x) = x if x > 0 else -x (sintaxe Python, não aceita pelo SymPy) em [-1, 1]
+    - Resultado idêntico ao da versão vetorizada ``Abs(x)`` nos mesmos nós
+    """
+    chamadas = []
+    original = ig.compilar_eval
+    monkeypatch.setattr(ig, 'compilar_eval', lambda *args, **kw: chamadas.append(1) or original(*args, **kw))
+    monkeypatch.setattr(ig, 'pedir_m_ou_h', lambda a, b, regra: (6, 2.0 / 6))
+    monkeypatch.setattr('builtins.input', lambda prompt='': 'n')
+    func = 'x if x > 0 else -x'
+    for regra in (ig.trapezio_composta, ig.simpson_1_3_composta, ig.simpson_3_8_composta):
+        chamadas.clear()
+        assert pytest.approx(regra(func, -1.0, 1.0), rel=1e-12) == regra('Abs(x)', -1.0, 1.0)
+        assert len(chamadas) == 1
+    chamadas.clear()
+    assert pytest.approx(ig.newton_cotes(func, -1.0, 1.0, 3), rel=1e-12) == ig.newton_cotes('Abs(x)', -1.0, 1.0, 3)
+    assert len(chamadas) == 1
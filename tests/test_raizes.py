@@ -7,7 +7,9 @@
 """
 
 import math
-from codigos import raizes
+import numpy as np
+import pytest
+from codigos import raizes, interpolacoes, expressoes
 
 def test_bissecao_basic():
     """Verifica a convergência básica do método da bisseção.
@@ -132,3 +134,470 @@ def test_bissecao_with_verbose():
     assert raiz is not None
     assert abs(raiz - 2.0) < 1e-8
     assert iters > 0
+
+
+def test_metodos_aceitam_callable():
+    """Verifica que bisseção, Newton e secante aceitam funções já compiladas.
+
+    - Mesma raiz obtida com string e com callable equivalente
+    """
+    g = lambda x: x**2 - 2
+    r1, _ = raizes.bissecao(g, 0.0, 2.0, 1e-10, 100)
+    r2, _ = raizes.newton(g, 1.0, 1e-12, 50)
+    r3, _ = raizes.secante(g, 1.0, 2.0, 1e-12, 50)
+    for r in (r1, r2, r3):
+        assert abs(r - math.sqrt(2.0)) < 1e-9
+
+
+def test_compilar_funcao_escalar_e_vetorizada():
+    """Garante que `compilar_funcao` gera versões escalar e vetorizada coerentes.
+
+    - Escalar preserva erros de domínio do `math`
+    - Vetorizada avalia arrays inteiros (inclusive expressões constantes)
+    """
+    fs = raizes.compilar_funcao('log(x) - 1')
+    assert abs(fs(math.e)) < 1e-15
+    with pytest.raises(ValueError):
+        fs(-1.0)
+    fv = raizes.compilar_funcao('x**2 - 4', vetorizada=True)
+    assert np.allclose(fv(np.array([0.0, 2.0, 3.0])), [-4.0, 0.0, 5.0])
+    fc = raizes.compilar_funcao('3', vetorizada=True)
+    assert fc(np.zeros(4)).shape == (4,)
+
+
+def test_bissecao_vetorizada_varios_intervalos():
+    """Verifica a bisseção em lote sobre vários intervalos.
+
+    - Função: f(x) = x**2 - 4, com intervalos contendo +2, -2 e um sem troca de sinal
+    - Resultado esperado: raízes corretas, iterações iguais às da versão escalar e
+      intervalo inválido marcado como não convergido
+    """
+    a = np.array([0.0, -3.0, 5.0])
+    b = np.array([3.0, 0.0, 6.0])
+    r, it, ok = raizes.bissecao_vetorizada('x**2 - 4', a, b, 1e-10, 100)
+    assert np.allclose(r[:2], [2.0, -2.0], atol=1e-9)
+    assert ok.tolist() == [True, True, False]
+    assert np.isnan(r[2]) and it[2] == 0
+    _, it_escalar = raizes.bissecao('x**2 - 4', 0.0, 3.0, 1e-10, 100)
+    assert it[0] == it_escalar
+
+
+def test_newton_derivada_simbolica():
+    """Compara Newton com derivada simbólica e com diferença central.
+
+    - Função: f(x) = cos(x) - x, chute x0 = 1
+    - A derivada simbólica converge para a mesma raiz em no máximo as mesmas iterações
+    - Entradas não simbólicas (callable) recaem na diferença finita
+    """
+    r_num, it_num = raizes.newton('cos(x) - x', 1.0, 1e-12, 50)
+    r_sim, it_sim = raizes.newton('cos(x) - x', 1.0, 1e-12, 50, derivada='simbolica')
+    assert abs(r_sim - 0.7390851332151607) < 1e-12
+    assert abs(r_sim - r_num) < 1e-10
+    assert it_sim <= it_num
+    r_cal, _ = raizes.newton(lambda x: math.cos(x) - x, 1.0, 1e-12, 50, derivada='simbolica')
+    assert abs(r_cal - r_sim) < 1e-10
+
+
+def test_brent_converge_com_menos_avaliacoes():
+    """Verifica o método de Brent contra a bisseção.
+
+    - Função: f(x) = x**3 - 2*x - 5, intervalo [2, 3]
+    - Resultado esperado: raiz com precisão dupla usando bem menos avaliações
+      que a bisseção (que faz ~50 avaliações)
+    """
+    raiz, iters, n_aval = raizes.brent('x**3 - 2*x - 5', 2.0, 3.0, 1e-14, 100)
+    assert abs(raiz - 2.0945514815423265) < 1e-12
+    assert n_aval == iters + 2
+    assert n_aval < 15
+    assert raizes.brent('x**2 + 1', -1.0, 1.0, 1e-8, 10)[0] is None
+
+
+def test_brent_funcao_dificil_para_secante():
+    """Brent mantém o intervalo mesmo quando a secante diverge.
+
+    - Função: f(x) = atan(x), chutes afastados fazem a secante divergir
+    """
+    raiz, _, _ = raizes.brent('atan(x)', -4.0, 10.0, 1e-12, 100)
+    assert abs(raiz) < 1e-10
+
+
+def test_encontrar_raizes_intervalo():
+    """Verifica a busca de todas as raízes em um intervalo.
+
+    - Função: f(x) = sin(x) em [-1, 10] (raízes 0, pi, 2pi, 3pi)
+    - Função: f(x) = (x - 1)**2 * (x + 2) (raiz dupla em 1, sem troca de sinal)
+    """
+    r = raizes.encontrar_raizes('sin(x)', -1.0, 10.0, 1e-12, 200)
+    assert np.allclose(r, [0.0, math.pi, 2 * math.pi, 3 * math.pi], atol=1e-10)
+    r2 = raizes.encontrar_raizes('(x - 1)**2 * (x + 2)', -3.0, 3.0, 1e-12, 200, n_pontos=50)
+    assert r2.size == 2
+    assert abs(r2[0] + 2.0) < 1e-10
+    assert abs(r2[1] - 1.0) < 1e-6
+    assert raizes.encontrar_raizes('x**2 + 1', -2.0, 2.0, 1e-12, 200).size == 0
+
+
+def test_encontrar_raizes_descarta_polos():
+    """Trocas de sinal em polos não são raízes.
+
+    - f(x) = tan(x) em [0.5, 10]: raízes pi, 2pi, 3pi (polos em pi/2 + k*pi)
+    - f(x) = 1/x em [-1, 1]: nenhuma raiz
+    """
+    r = raizes.encontrar_raizes('tan(x)', 0.5, 10.0, 1e-12, 200)
+    assert np.allclose(r, [math.pi, 2 * math.pi, 3 * math.pi], atol=1e-10)
+    assert raizes.encontrar_raizes('1/x', -1.0, 1.0, 1e-12, 200).size == 0
+
+
+def test_encontrar_raizes_malha_sobre_a_raiz():
+    """Amostra exatamente nula na malha não esconde uma raiz na célula vizinha.
+
+    - f(x) = x*(x - 0.003) em [-1, 1] com 401 pontos: a malha passa por 0
+    - f(x) = (x - 1)*(x - 1.001) em [0, 2]: raízes separadas por menos de uma célula
+    """
+    r = raizes.encontrar_raizes('x*(x - 0.003)', -1.0, 1.0, 1e-12, 200, n_pontos=401)
+    assert np.allclose(r, [0.0, 0.003], atol=1e-10)
+    for n in (400, 401, 1000, 2001):
+        r = raizes.encontrar_raizes('(x - 1)*(x - 1.001)', 0.0, 2.0, 1e-12, 200, n_pontos=n)
+        assert np.allclose(r, [1.0, 1.001], atol=1e-10)
+
+
+def test_raizes_polinomio_matriz_companheira():
+    """Verifica as raízes de polinômios pela matriz companheira.
+
+    - f(x) = x**3 - 6*x**2 + 11*x - 6: raízes reais 1, 2, 3
+    - f(x) = x**4 + x**2: raiz dupla em 0 e par complexo ±i
+    - Expressão não polinomial deve ser rejeitada
+    """
+    r = raizes.raizes_polinomio('x**3 - 6*x**2 + 11*x - 6')
+    assert np.allclose(r, [1.0, 2.0, 3.0], atol=1e-12)
+    z = raizes.raizes_polinomio('x**4 + x**2')
+    assert np.allclose(sorted(z, key=lambda w: round(w.imag, 8)), [-1j, 0.0, 0.0, 1j], atol=1e-12)
+    assert np.allclose(raizes.raizes_polinomio('x**4 + x**2', apenas_reais=True), [0.0, 0.0])
+    with pytest.raises(ValueError):
+        raizes.raizes_polinomio('sin(x) - x')
+
+
+def test_raizes_polinomio_raizes_multiplas():
+    """Aglomerados de autovalores de raízes múltiplas viram a raiz repetida.
+
+    - f(x) = (x - 1)**3: raiz tripla em 1 (autovalores espalhados em ~1e-5)
+    - f(x) = (x - 1)**3 * (x + 2)**2: raízes 1 (tripla) e -2 (dupla)
+    - Raízes simples próximas, como 1 e 1.0001, continuam separadas
+    """
+    assert np.allclose(raizes.raizes_polinomio('(x-1)**3', apenas_reais=True), [1.0, 1.0, 1.0], atol=1e-12)
+    r = raizes.raizes_polinomio('(x-1)**3 * (x+2)**2', apenas_reais=True)
+    assert np.allclose(r, [-2.0, -2.0, 1.0, 1.0, 1.0], atol=1e-12)
+    assert np.allclose(raizes.raizes_polinomio('(x - 1)*(x - 1.0001)', apenas_reais=True), [1.0, 1.0001])
+
+
+def test_raizes_polinomio_raizes_distintas_nao_sao_unidas():
+    """Raízes simples bem separadas não são confundidas com aglomerados.
+
+    - f(x) = x**n - 1 (n = 16, 20): as n raízes da unidade
+    - Polinômio de Wilkinson prod(x - k), k = 1..20: raízes reais distintas
+    """
+    for n in (16, 20):
+        z = raizes.raizes_polinomio(f'x**{n} - 1')
+        esperadas = np.exp(2j * np.pi * np.arange(n) / n)
+        assert z.size == n
+        assert all(np.min(np.abs(z - w)) < 1e-12 for w in esperadas)
+    wilkinson = ' * '.join(f'(x - {k})' for k in range(1, 21))
+    r = raizes.raizes_polinomio(wilkinson, apenas_reais=True)
+    assert r.size == 20
+    assert np.allclose(r, np.arange(1, 21), atol=0.1)
+
+
+def test_newton_multiplos_chutes_pool():
+    """Verifica Newton com múltiplos chutes distribuídos em processos.
+
+    - Função: f(x) = x**3 - x (raízes -1, 0, 1)
+    - Raízes duplicadas são agrupadas e a soma das bacias é o nº de chutes convergidos
+    - Execução serial (processos=1) e paralela devem coincidir
+    """
+    chutes = np.linspace(-2.0, 2.0, 41)
+    r1, b1 = raizes.newton_multiplos_chutes('x**3 - x', chutes, 1e-12, 100, processos=1)
+    r2, b2 = raizes.newton_multiplos_chutes('x**3 - x', chutes, 1e-12, 100, processos=2)
+    assert np.allclose(r1, [-1.0, 0.0, 1.0], atol=1e-10)
+    assert np.allclose(r1, r2) and b1.tolist() == b2.tolist()
+    assert b1.sum() <= chutes.size
+
+
+def test_newton_multiplos_chutes_convergencia_na_ultima_iteracao():
+    """Chute que converge exatamente na iteração max_iter não é descartado."""
+    raiz, it = raizes.newton('x**2 - 2', 1.0, 1e-12, 6)
+    assert it == 6 and abs(raiz - math.sqrt(2.0)) < 1e-12
+    r, b = raizes.newton_multiplos_chutes('x**2 - 2', [1.0], 1e-12, 6, processos=1)
+    assert np.allclose(r, [math.sqrt(2.0)], atol=1e-12) and b.tolist() == [1]
+    r, b = raizes.newton_multiplos_chutes('x**2 - 2', [1.0], 1e-12, 5, processos=1)
+    assert r.size == 0 and b.size == 0
+
+
+def test_continuacao_parametrica_preditor():
+    """Verifica a continuação paramétrica de f(x; p) = x**3 + x - p.
+
+    - Raiz única e crescente em p; compara com Newton pontual
+    - O preditor secante reduz o total de iterações em relação ao chute anterior
+    """
+    ps = np.linspace(0.0, 10.0, 101)
+    curva, its = raizes.continuacao_parametrica('x**3 + x - p', ps, 0.0, 1e-12, 50,
+                                                derivada='simbolica')
+    assert np.all(np.abs(curva**3 + curva - ps) < 1e-9)
+    _, its_sem = raizes.continuacao_parametrica('x**3 + x - p', ps, 0.0, 1e-12, 50, preditor=False)
+    assert its.sum() < its_sem.sum()
+    curva_s, _ = raizes.continuacao_parametrica('x**3 + x - p', ps, 0.0, 1e-12, 50, metodo='secante')
+    assert np.allclose(curva_s, curva, atol=1e-9)
+
+
+def test_continuacao_parametrica_convergencia_na_ultima_iteracao():
+    """Ponto que converge exatamente em max_iter entra na curva (Newton e secante)."""
+    _, it = raizes.newton('x**2 - 2', 1.0, 1e-12, 50)
+    curva, n_iter = raizes.continuacao_parametrica('x**2 - p', [2.0], 1.0, 1e-12, it)
+    assert abs(curva[0] - math.sqrt(2.0)) < 1e-12 and n_iter[0] == it
+    _, it = raizes.secante('x**2 - 2', 1.0001, 1.0, 1e-12, 50)
+    curva, n_iter = raizes.continuacao_parametrica('x**2 - p', [2.0], 1.0, 1e-12, it, metodo='secante')
+    assert abs(curva[0] - math.sqrt(2.0)) < 1e-12 and n_iter[0] == it
+    curva, _ = raizes.continuacao_parametrica('x**2 - p', [2.0], 1.0, 1e-12, it - 1, metodo='secante')
+    assert np.isnan(curva[0])
+
+
+def test_newton_sistema_newton_e_broyden():
+    """Verifica a solução de sistemas não lineares F(x) = 0.
+
+    - Sistema: y1**2 + y2**2 = 4 e exp(y1) + y2 = 1 (indexação `y[i]` como nas EDOs)
+    - Newton (jacobiano simbólico + LU) e Broyden convergem para a mesma solução
+    - Jacobiano singular é reportado com solução ``None``
+    """
+    funcs = ['y[1]**2 + y[2]**2 - 4', 'exp(y[1]) + y[2] - 1']
+    xn, it_n = raizes.newton_sistema(funcs, [1.0, -1.7], 1e-12, 50)
+    xb, it_b = raizes.newton_sistema(funcs, [1.0, -1.7], 1e-12, 50, metodo='broyden')
+    assert np.allclose(xn, [1.0041687384746, -1.7296372870497], atol=1e-10)
+    assert np.allclose(xb, xn, atol=1e-10)
+    assert it_n < 50 and it_b < 50
+    x_sing, _ = raizes.newton_sistema(['y[1] + y[2]', '2*y[1] + 2*y[2]'], [1.0, 1.0], 1e-12, 10)
+    assert x_sing is None
+
+
+def test_halley_e_steffensen_contagem_de_avaliacoes():
+    """Verifica Halley e Steffensen e a contagem de avaliações.
+
+    - Função: f(x) = cos(x) - x, chute x0 = 1
+    - Halley simbólico: uma avaliação fundida por iteração
+    - Steffensen: duas avaliações por iteração, sem derivadas
+    - Halley com callable usa diferenças finitas (três avaliações por iteração)
+    """
+    alvo = 0.7390851332151607
+    r, it, nav = raizes.halley('cos(x) - x', 1.0, 1e-12, 50)
+    assert abs(r - alvo) < 1e-12 and nav == it
+    it_newton = raizes.newton('cos(x) - x', 1.0, 1e-12, 50, derivada='simbolica')[1]
+    assert it <= it_newton
+    r, it, nav = raizes.steffensen('cos(x) - x', 1.0, 1e-12, 50)
+    assert abs(r - alvo) < 1e-12 and nav <= 2 * it
+    r, it, nav = raizes.halley(lambda x: math.cos(x) - x, 1.0, 1e-10, 50)
+    assert abs(r - alvo) < 1e-8 and nav == 3 * it
+
+
+def test_ponto_fixo_com_e_sem_aitken():
+    """Verifica o método do ponto fixo para g(x) = cos(x).
+
+    - Sem aceleração a convergência é linear (muitas iterações)
+    - Com Aitken Δ² o mesmo ponto fixo é obtido em poucas iterações
+    - Iteração divergente (g(x) = exp(x) a partir de 1) retorna ``None``
+    """
+    alvo = 0.7390851332151607
+    r, it = raizes.ponto_fixo('cos(x)', 1.0, 1e-12, 500)
+    ra, ita = raizes.ponto_fixo('cos(x)', 1.0, 1e-12, 500, aceleracao='aitken')
+    assert abs(r - alvo) < 1e-10 and abs(ra - alvo) < 1e-12
+    assert ita < 10 < it
+    assert raizes.ponto_fixo('exp(x)', 1.0, 1e-12, 100)[0] is None
+
+
+def test_ponto_fixo_vetorizado():
+    """Ponto fixo sobre vários chutes: todos convergem para o mesmo ponto."""
+    x0 = np.linspace(-1.0, 1.0, 7)
+    pts, its, ok = raizes.ponto_fixo_vetorizado('cos(x)', x0, 1e-12, 50, aceleracao='aitken')
+    assert ok.all()
+    assert np.allclose(pts, 0.7390851332151607, atol=1e-12)
+
+
+def test_muller_raiz_complexa_a_partir_de_chutes_reais():
+    """Verifica que Müller alcança raízes complexas com chutes reais.
+
+    - f(x) = exp(x) + 1 não tem raízes reais; raiz i*pi
+    """
+    raiz, iters = raizes.muller('exp(x) + 1', 0.0, 0.5, 1.0, 1e-12, 100)
+    assert abs(raiz - 1j * math.pi) < 1e-10
+
+
+def test_muller_deflacao_todas_as_raizes():
+    """Verifica a deflação: f(x) = x**3 - 2*x - 5 tem uma raiz real e um par complexo."""
+    rs = raizes.muller_deflacao('x**3 - 2*x - 5', 3, 1e-12, 100)
+    assert rs.size == 3
+    assert np.allclose(rs**3 - 2 * rs - 5, 0, atol=1e-9)
+    esperadas = np.roots([1, 0, -2, -5])
+    assert all(np.min(np.abs(esperadas - z)) < 1e-9 for z in rs)
+    assert len({round(z.imag, 6) for z in rs}) == 3
+
+
+def test_muller_deflacao_convergencia_na_ultima_iteracao():
+    """Raiz que converge exatamente em max_iter não interrompe a deflação."""
+    raiz, it = raizes.muller('x**2 - 2', -0.5, 0.0, 0.5, 1e-12, 100)
+    rs = raizes.muller_deflacao('x**2 - 2', 1, 1e-12, it)
+    assert rs.size == 1 and abs(rs[0] - raiz) < 1e-10
+    assert raizes.muller_deflacao('x**2 - 2', 1, 1e-12, it - 1).size == 0
+
+
+def test_historico_convergencia_ordem_empirica(tmp_path):
+    """Verifica o histórico de convergência e a ordem empírica estimada.
+
+    - Newton (derivada simbólica) em x**2 - 2: ordem ~ 2
+    - Secante: ordem ~ 1.618; Bisseção: ordem ~ 1
+    - A tabela/figura são geradas apenas depois das iterações
+    """
+    h = raizes.HistoricoConvergencia()
+    raiz, iters = raizes.newton('x**2 - 2', 3.0, 1e-14, 50, derivada='simbolica', historico=h)
+    assert h.n == iters and h.metodo == 'Newton'
+    assert abs(h.x[0] - 3.0) < 1e-15 and abs(h.fx[0] - 7.0) < 1e-15
+    assert abs(h.ordem_convergencia() - 2.0) < 0.2
+
+    hs = raizes.HistoricoConvergencia()
+    raizes.secante('x**2 - 2', 3.0, 2.5, 1e-14, 50, historico=hs)
+    assert abs(hs.ordem_convergencia() - 1.618) < 0.1
+
+    hb = raizes.HistoricoConvergencia()
+    raizes.bissecao('x**2 - 2', 0.0, 3.0, 1e-10, 100, historico=hb)
+    assert abs(hb.ordem_convergencia() - 1.0) < 1e-9
+    assert 'Ordem empírica' in str(hb)
+    hb.plotar(arquivo=tmp_path / 'conv.png')
+    assert (tmp_path / 'conv.png').exists()
+
+
+def test_plotar_funcao_arquivo_agg(monkeypatch, tmp_path):
+    """Garante que `plotar_funcao(..., arquivo=...)` salva a figura sem chamar `plt.show()`.
+
+    - Função com pontos fora do domínio (log(x) em [-1, 3]) é avaliada sem erro (nan)
+    """
+    called = {"show": False}
+    monkeypatch.setattr('matplotlib.pyplot.show', lambda: called.__setitem__('show', True))
+    destino = tmp_path / 'f.png'
+    raizes.plotar_funcao('log(x)', a=-1, b=3, raiz=1.0, arquivo=destino)
+    assert destino.exists() and destino.stat().st_size > 0
+    assert called['show'] is False
+
+
+def test_interpolacao_inversa_varios_alvos():
+    """Interpolação inversa em tabela de y = exp(x), crescente e decrescente.
+
+    - Muitos alvos de uma vez, comparados com log(alvo)
+    - Alvos fora da tabela retornam nan (ou extrapolam, se pedido)
+    """
+    x = np.linspace(0.0, 2.0, 201)
+    y = np.exp(x)
+    alvos = np.linspace(1.0, np.exp(2.0), 5000)
+    xs = raizes.interpolacao_inversa(x, y, alvos, grau=3)
+    assert np.allclose(xs, np.log(alvos), atol=1e-8)
+    assert abs(raizes.interpolacao_inversa(x[::-1], -y[::-1], -2.0) - np.log(2.0)) < 1e-6
+    assert np.isnan(raizes.interpolacao_inversa(x, y, 0.5))
+    assert abs(raizes.interpolacao_inversa(x, y, 0.99, extrapolar=True) - np.log(0.99)) < 1e-5
+    with pytest.raises(ValueError):
+        raizes.interpolacao_inversa(x, np.sin(5 * x), 0.1)
+
+
+def test_tabela_diferencas_divididas_vetorizada_confere():
+    """A tabela vetorizada coincide com a tabela de `interpolacoes` em ordens baixas."""
+    x = [0.0, 0.5, 1.5, 2.0, 3.0]
+    y = [1.0, 2.0, 0.5, -1.0, 4.0]
+    completa = interpolacoes.tabela_diferencas_divididas(x, y)
+    parcial = interpolacoes.tabela_diferencas_divididas_vetorizada(x, y, max_ordem=2)
+    assert len(parcial) == 3
+    for j in range(3):
+        assert np.allclose(parcial[j], completa[j])
+
+
+def test_raizes_sinal_arquivo_blocos(tmp_path):
+    """Cruzamentos por zero de sin(x) lidos de arquivo em blocos pequenos.
+
+    - Arquivos `.npy` e binário bruto (float32) dão o mesmo resultado
+    - Trocas de sinal entre blocos e amostras nulas não são perdidas nem duplicadas
+    """
+    dx = 0.01
+    x = np.arange(100001) * dx + 0.005          # evita amostras exatamente nulas
+    sinal = np.sin(x)
+    np.save(tmp_path / "sinal.npy", sinal)
+    sinal.astype(np.float32).tofile(tmp_path / "sinal.bin")
+    esperadas = np.pi * np.arange(1, int(x[-1] / np.pi) + 1)
+
+    r = raizes.raizes_sinal_arquivo(tmp_path / "sinal.npy", x0=0.005, dx=dx, tamanho_bloco=777)
+    assert r.shape == esperadas.shape
+    assert np.allclose(r, esperadas, atol=dx**2)
+    r32 = raizes.raizes_sinal_arquivo(str(tmp_path / "sinal.bin"), x0=0.005, dx=dx,
+                                      dtype='float32', tamanho_bloco=1000)
+    assert np.allclose(r32, esperadas, atol=dx**2)
+
+    # troca de sinal exatamente na fronteira e amostra nula no início de um bloco
+    np.save(tmp_path / "curto.npy", np.array([1.0, 1.0, -1.0, -1.0, 0.0, 2.0]))
+    r = raizes.raizes_sinal_arquivo(tmp_path / "curto.npy", tamanho_bloco=2)
+    assert np.allclose(r, [1.5, 4.0])
+
+
+def test_funcoes_com_prefixo_math():
+    """Funções `math.` sem equivalente SymPy (log10, hypot, ...) continuam resolvidas.
+
+    - Bisseção, Newton e secante encontram a raiz de log10(x) - 1 (x = 10)
+    - Versão vetorizada também avalia `math.hypot`
+    """
+    raiz, _ = raizes.bissecao('math.log10(x) - 1', 1, 20, 1e-8, 100)
+    assert abs(raiz - 10.0) < 1e-6
+    raiz, _ = raizes.newton('math.log10(x) - 1', 5.0, 1e-10, 50)
+    assert abs(raiz - 10.0) < 1e-8
+    raiz, _ = raizes.secante('math.log2(x) - 3', 5.0, 6.0, 1e-10, 50)
+    assert abs(raiz - 8.0) < 1e-8
+    fv = raizes.compilar_funcao('math.hypot(x, 1)', vetorizada=True)
+    assert np.allclose(fv(np.array([0.0, 1.0])), [1.0, math.sqrt(2.0)])
+
+
+def test_compilacao_restrita_e_potencia():
+    """A compilação não executa código arbitrário e `^` é recusado como em `raizes.f`."""
+    with pytest.raises(ValueError):
+        raizes.compilar_funcao("__import__('os').getpid() + x")
+    with pytest.raises(ValueError):
+        expressoes.expressao_sympy("open('x') + x")
+    with pytest.raises((NameError, TypeError)):  # fallback com eval restrito: sem builtins
+        raizes.compilar_funcao("open('x') + x")(1.0)
+    with pytest.raises(ValueError):
+        raizes.f(2.0, 'x^2 - 4')
+    with pytest.raises(ValueError):
+        raizes.compilar_funcao('x^2 - 4')
+    raiz, _ = raizes.newton('x^2 - 4', 1.0, 1e-10, 50)
+    assert raiz is None
+
+
+def test_newton_simbolico_recorre_a_diferencas_finitas():
+    """Sem derivada simbólica (hypot), `derivada='simbolica'` usa diferenças finitas."""
+    with pytest.raises(ValueError):
+        expressoes.compilar_derivadas('hypot(x, 1) - 2')
+    raiz, it = raizes.newton('hypot(x, 1) - 2', 1.5, 1e-10, 50, derivada='simbolica')
+    assert abs(raiz - math.sqrt(3.0)) < 1e-9 and it > 0
+
+
+def test_halley_sem_derivada_simbolica():
+    """Halley com `math.hypot` usa diferenças finitas em vez de propagar o erro."""
+    raiz, it, n_aval = raizes.halley('math.hypot(x,1) - 2', 1.5, 1e-10, 50)
+    assert abs(raiz - math.sqrt(3.0)) < 1e-9
+    assert n_aval == 3 * it
+
+
+def test_halley_verbose_imprime_f_no_novo_iterado(capsys):
+    """Cada linha do modo verbose mostra f avaliada no x impresso, como em Newton."""
+    for func in ('x**2 - 2', lambda x: x * x - 2):
+        raizes.halley(func, 1.0, 1e-12, 20, verbose=True)
+        linhas = [l for l in capsys.readouterr().out.splitlines() if l.startswith('[Halley]')]
+        assert linhas
+        for linha in linhas:
+            x = float(linha.split('x = ')[1].split(',')[0])
+            fx = float(linha.split('f(x) = ')[1])
+            assert abs(fx - (x * x - 2)) < 1e-5
+
+
+def test_newton_sistema_jacobiano_por_diferencas():
+    """Componentes sem derivada simbólica (hypot) usam o jacobiano por diferenças."""
+    x, it = raizes.newton_sistema(['hypot(y[1], y[2]) - 2', 'y[1] - y[2]'], [1, 1], 1e-10, 50)
+    assert np.allclose(x, [math.sqrt(2.0), math.sqrt(2.0)], atol=1e-8)
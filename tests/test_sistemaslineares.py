@@ -199,3 +199,337 @@ def test_montar_sistema_valores_eof(monkeypatch):
         raise EOFError
     monkeypatch.setattr('builtins.input', raise_eof)
     assert sl.montar_sistema_valores() is None
+
+
+def test_eliminacao_vetorizada_igual_ao_passo_a_passo(capsys):
+    """O caminho vetorizado (verbose=False) reproduz o passo a passo (verbose=True).
+
+    - Mesmas matrizes triangulares, vetores b e soluções, com e sem pivotamento
+    - Sistema maior (200x200) resolvido corretamente pelo caminho vetorizado
+    """
+    rng = np.random.default_rng(0)
+    A = rng.standard_normal((7, 7)) + 7 * np.eye(7)
+    b = rng.standard_normal(7)
+    for metodo in (sl.eliminacao_gauss_sem_pivotamento, sl.eliminacao_gauss_com_pivotamento):
+        rapido = metodo(A, b)
+        passo = metodo(A, b, verbose=True)
+        for r, p in zip(rapido[:3], passo[:3]):
+            assert np.array_equal(r, p)
+    capsys.readouterr()
+
+    A = rng.standard_normal((200, 200))
+    b = rng.standard_normal(200)
+    x, Atri, _, flag = sl.eliminacao_gauss_com_pivotamento(A, b)
+    assert not flag
+    assert np.allclose(np.tril(Atri, -1), 0.0, atol=1e-12)
+    assert np.allclose(x, np.linalg.solve(A, b))
+
+
+def test_fatoracao_lu_varios_lados_direitos():
+    """`FatoracaoLU` fatora uma vez e resolve vários lados direitos.
+
+    - Compatível com `lu_com_pivot` (P A = L U)
+    - `solve` aceita vetor, matriz (n, k) e o sistema transposto
+    - Matriz singular levanta `ZeroDivisionError`
+    """
+    rng = np.random.default_rng(1)
+    A = rng.standard_normal((30, 30))
+    fat = sl.FatoracaoLU(A)
+    assert np.allclose(fat.P @ A, fat.L @ fat.U)
+    P, L, U = sl.lu_com_pivot(A, None)
+    assert np.allclose(fat.L, L) and np.allclose(fat.U, U) and np.array_equal(fat.P, P)
+
+    B = rng.standard_normal((30, 100))
+    assert np.allclose(fat.solve(B), np.linalg.solve(A, B))
+    assert np.allclose(fat.solve(B[:, 0]), np.linalg.solve(A, B[:, 0]))
+    assert np.allclose(fat.solve(B, transposta=True), np.linalg.solve(A.T, B))
+
+    with pytest.raises(ZeroDivisionError):
+        sl.FatoracaoLU([[1.0, 2.0], [2.0, 4.0]])
+    with pytest.raises(ValueError):
+        fat.solve(np.ones(3))
+
+
+def test_fatoracao_lu_blocada_independe_do_bloco():
+    """A LU blocada dá a mesma fatoração para qualquer tamanho de bloco.
+
+    - Blocos que não dividem n (1, 7, 64) e bloco >= n (não blocada)
+    - Bloco não positivo é rejeitado
+    """
+    rng = np.random.default_rng(2)
+    A = rng.standard_normal((101, 101))
+    referencia = sl.FatoracaoLU(A, bloco=A.shape[0])
+    for bloco in (1, 7, 64):
+        fat = sl.FatoracaoLU(A, bloco=bloco)
+        assert np.array_equal(fat.perm, referencia.perm)
+        assert np.allclose(fat.lu, referencia.lu, atol=1e-10)
+        assert np.allclose(A[fat.perm], fat.L @ fat.U)
+    with pytest.raises(ValueError):
+        sl.FatoracaoLU(A, bloco=0)
+
+
+def test_thomas_tridiagonal():
+    """Algoritmo de Thomas no sistema de diferenças finitas -u'' = f.
+
+    - Compara com a solução densa, para um e vários lados direitos
+    - Diagonais de tamanhos incompatíveis e pivô nulo são rejeitados
+    """
+    n = 50
+    inferior = -np.ones(n - 1)
+    diagonal = 2.0 * np.ones(n)
+    superior = -np.ones(n - 1)
+    A = np.diag(diagonal) + np.diag(inferior, -1) + np.diag(superior, 1)
+    d = np.random.default_rng(3).standard_normal((n, 4))
+    assert np.allclose(sl.thomas(inferior, diagonal, superior, d), np.linalg.solve(A, d))
+    assert np.allclose(sl.thomas(inferior, diagonal, superior, d[:, 0]), np.linalg.solve(A, d[:, 0]))
+    with pytest.raises(ValueError):
+        sl.thomas(inferior[:-1], diagonal, superior, d)
+    with pytest.raises(ZeroDivisionError):
+        sl.thomas([1.0], [0.0, 1.0], [1.0], [1.0, 1.0])
+
+
+def test_fatoracao_banda_com_pivotamento():
+    """LU de banda em formato compacto (LAPACK) comparada com a solução densa.
+
+    - Banda não simétrica (kl=2, ku=1) que exige trocas de linha
+    - Conversão densa -> banda preserva todos os elementos da banda
+    """
+    rng = np.random.default_rng(4)
+    n, kl, ku = 40, 2, 1
+    A = np.triu(np.tril(rng.standard_normal((n, n)), ku), -kl)
+    ab = sl.matriz_para_banda(A, kl, ku)
+    assert ab.shape == (kl + ku + 1, n)
+    assert ab[ku + 3 - 1, 1] == A[3, 1]
+    fat = sl.FatoracaoBanda(ab, kl, ku)
+    assert np.any(fat.piv != np.arange(n))
+    B = rng.standard_normal((n, 3))
+    assert np.allclose(fat.solve(B), np.linalg.solve(A, B))
+    assert np.allclose(fat.solve(B[:, 1]), np.linalg.solve(A, B[:, 1]))
+    with pytest.raises(ValueError):
+        sl.FatoracaoBanda(ab, kl + 1, ku)
+
+
+def test_matriz_para_banda_larguras_maiores_que_a_matriz():
+    """kl ou ku maiores que n - 1 apenas acrescentam linhas nulas à banda."""
+    ab = sl.matriz_para_banda(np.eye(2), 3, 0)
+    assert ab.shape == (4, 2)
+    assert np.array_equal(ab, [[1.0, 1.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0]])
+    A = np.array([[4.0, 1.0], [2.0, 3.0]])
+    ab = sl.matriz_para_banda(A, 1, 3)
+    assert ab.shape == (5, 2)
+    assert ab[2, 1] == A[0, 1] and ab[3, 0] == A[0, 0] and ab[4, 0] == A[1, 0]
+    b = np.array([1.0, 2.0])
+    assert np.allclose(sl.FatoracaoBanda(ab, 1, 3).solve(b), np.linalg.solve(A, b))
+
+
+def _laplaciano_1d(n, deslocamento=0.5):
+    """Matriz tridiagonal (2 + deslocamento, -1) em CSR, montada por coordenadas."""
+    i = np.arange(n)
+    linhas = np.concatenate([i, i[1:], i[:-1]])
+    colunas = np.concatenate([i, i[:-1], i[1:]])
+    valores = np.concatenate([np.full(n, 2.0 + deslocamento), -np.ones(n - 1), -np.ones(n - 1)])
+    return sl.MatrizCSR.de_coordenadas(linhas, colunas, valores, (n, n))
+
+
+def test_matriz_csr_formato_e_produto():
+    """`MatrizCSR`: montagem por coordenadas (somando repetições), produto e diagonal."""
+    A = np.array([[4.0, 0.0, 1.0], [0.0, 3.0, 0.0], [2.0, 0.0, 5.0]])
+    M = sl.MatrizCSR.de_densa(A)
+    assert M.nnz == 5
+    assert np.array_equal(M.indptr, [0, 2, 3, 5])
+    x = np.array([1.0, -2.0, 0.5])
+    assert np.allclose(M @ x, A @ x)
+    assert np.allclose(M.diagonal(), np.diag(A))
+    R = sl.MatrizCSR.de_coordenadas([0, 0, 1], [1, 1, 0], [1.0, 2.0, 5.0], (2, 2))
+    assert np.allclose(R.todensa(), [[0.0, 3.0], [5.0, 0.0]])
+    with pytest.raises(ValueError):
+        sl.MatrizCSR([1.0], [3], [0, 1], (1, 2))
+
+
+def test_matriz_csr_coordenadas_invalidas_e_matriz_vazia():
+    """Colunas fora da matriz são rejeitadas; matriz vazia produz vetores float."""
+    with pytest.raises(ValueError):
+        sl.MatrizCSR.de_coordenadas([1], [-1], [1.0], (3, 3))
+    with pytest.raises(ValueError):
+        sl.MatrizCSR.de_coordenadas([0], [3], [1.0], (3, 3))
+    with pytest.raises(ValueError):
+        sl.MatrizCSR.de_coordenadas([3], [0], [1.0], (3, 3))
+    V = sl.MatrizCSR.de_coordenadas([], [], [], (3, 2))
+    assert V.data.dtype == float and V.nnz == 0
+    assert V.matvec(np.ones(2)).dtype == float and np.array_equal(V @ np.ones(2), np.zeros(3))
+    assert V.rmatvec(np.ones(3)).dtype == float
+
+
+def test_jacobi_gauss_seidel_sor_esparsos():
+    """Jacobi, Gauss-Seidel e SOR convergem em sistema esparso diagonalmente dominante.
+
+    - Histórico de resíduos decrescente; Gauss-Seidel precisa de menos iterações que Jacobi
+    - Aceitam matriz densa; sem convergência retornam `None`
+    """
+    n = 200
+    A = _laplaciano_1d(n)
+    assert sl.diagonal_dominante(A)
+    b = np.ones(n)
+    esperado = np.linalg.solve(A.todensa(), b)
+    xj, it_j, hist_j = sl.jacobi(A, b, tol=1e-10)
+    xg, it_g, hist_g = sl.gauss_seidel(A, b, tol=1e-10)
+    xs, it_s, _ = sl.sor(A, b, omega=1.2, tol=1e-10)
+    for x in (xj, xg, xs):
+        assert np.allclose(x, esperado, atol=1e-8)
+    assert it_g < it_j and len(hist_j) == it_j
+    assert np.all(np.diff(hist_j) < 0)
+
+    xd, _, _ = sl.jacobi(A.todensa(), b, tol=1e-10)
+    assert np.allclose(xd, esperado, atol=1e-8)
+
+    nao_dominante = np.array([[1.0, 3.0], [2.0, 1.0]])
+    assert not sl.diagonal_dominante(nao_dominante)
+    x, it, _ = sl.jacobi(nao_dominante, [1.0, 1.0], max_iter=20)
+    assert x is None and it == 20
+    with pytest.raises(ValueError):
+        sl.sor(A, b, omega=2.5)
+
+
+def _poisson_2d(m):
+    """Laplaciano 2D (5 pontos) em uma malha m x m, em CSR."""
+    n = m * m
+    k = np.arange(n)
+    i, j = k // m, k % m
+    linhas, colunas, valores = [k], [k], [np.full(n, 4.0)]
+    for vizinho, valido in ((k - 1, j > 0), (k + 1, j < m - 1), (k - m, i > 0), (k + m, i < m - 1)):
+        linhas.append(k[valido])
+        colunas.append(vizinho[valido])
+        valores.append(-np.ones(valido.sum()))
+    return sl.MatrizCSR.de_coordenadas(np.concatenate(linhas), np.concatenate(colunas),
+                                       np.concatenate(valores), (n, n))
+
+
+def test_gradiente_conjugado_precondicionado():
+    """CG e CG precondicionado (Jacobi, IC(0)) no problema de Poisson 2D.
+
+    - Resultado igual ao da solução densa, para CSR, matriz densa e operador-função
+    - IC(0) reduz o número de iterações em relação ao CG sem precondicionamento
+    """
+    A = _poisson_2d(20)
+    b = np.random.default_rng(5).standard_normal(A.shape[0])
+    esperado = np.linalg.solve(A.todensa(), b)
+
+    x, it_cg, hist = sl.gradiente_conjugado(A, b, tol=1e-10)
+    assert np.allclose(x, esperado, atol=1e-8)
+    assert len(hist) == it_cg + 1
+    x, _, _ = sl.gradiente_conjugado(A, b, tol=1e-10, precondicionador='jacobi')
+    assert np.allclose(x, esperado, atol=1e-8)
+    x, it_ic, _ = sl.gradiente_conjugado(A, b, tol=1e-10, precondicionador='ic0')
+    assert np.allclose(x, esperado, atol=1e-8)
+    assert it_ic < it_cg
+
+    x, _, _ = sl.gradiente_conjugado(A.todensa(), b, tol=1e-10)
+    assert np.allclose(x, esperado, atol=1e-8)
+    x, _, _ = sl.gradiente_conjugado(A.matvec, b, tol=1e-10)
+    assert np.allclose(x, esperado, atol=1e-8)
+
+
+def test_gradiente_conjugado_falhas():
+    """Matriz indefinida interrompe o CG; precondicionador desconhecido é rejeitado."""
+    x, _, _ = sl.gradiente_conjugado(np.diag([1.0, -1.0]), [1.0, 1.0])
+    assert x is None
+    with pytest.raises(ValueError):
+        sl.gradiente_conjugado(np.eye(2), [1.0, 1.0], precondicionador='ilu')
+    with pytest.raises(ValueError):
+        sl.gradiente_conjugado(lambda v: v, [1.0, 1.0], precondicionador='jacobi')
+
+
+def _conveccao_difusao(m, velocidade=20.0):
+    """Convecção-difusão 2D com upwind (não simétrica) e a sua parte difusiva, em CSR."""
+    difusao = _poisson_2d(m)
+    n = m * m
+    k = np.arange(n)
+    esquerda = k % m > 0
+    conveccao = sl.MatrizCSR.de_coordenadas(
+        np.concatenate([k, k[esquerda]]), np.concatenate([k, k[esquerda] - 1]),
+        np.concatenate([np.full(n, velocidade / m), np.full(esquerda.sum(), -velocidade / m)]), (n, n))
+    A = sl.MatrizCSR.de_densa(difusao.todensa() + conveccao.todensa())
+    return A, difusao
+
+
+def test_gmres_nao_simetrico():
+    """GMRES com reinícios em convecção-difusão não simétrica.
+
+    - Converge para a solução densa com e sem reinício curto, para CSR, densa e função
+    - Precondicionador LU da parte difusiva reduz as iterações; LU da própria A converge em 1
+    """
+    A, difusao = _conveccao_difusao(12)
+    b = np.random.default_rng(6).standard_normal(A.shape[0])
+    esperado = np.linalg.solve(A.todensa(), b)
+
+    x, it, hist = sl.gmres(A, b, tol=1e-10, reinicio=200)
+    assert np.allclose(x, esperado, atol=1e-7)
+    assert hist[0] == 1.0 and hist[-1] < 1e-10 and len(hist) == it + 1
+    x, it_curto, _ = sl.gmres(A, b, tol=1e-10, reinicio=10, max_iter=2000)
+    assert np.allclose(x, esperado, atol=1e-7)
+    assert it_curto >= it
+    x, _, _ = sl.gmres(A.todensa(), b, tol=1e-10, reinicio=200)
+    assert np.allclose(x, esperado, atol=1e-7)
+    x, _, _ = sl.gmres(A.matvec, b, tol=1e-10, reinicio=200)
+    assert np.allclose(x, esperado, atol=1e-7)
+
+    x, it_lu, _ = sl.gmres(A, b, tol=1e-10, precondicionador=sl.precondicionador_lu(difusao))
+    assert np.allclose(x, esperado, atol=1e-7)
+    assert it_lu < it
+    x, it_exato, _ = sl.gmres(A, b, tol=1e-10, precondicionador='lu')
+    assert it_exato == 1 and np.allclose(x, esperado, atol=1e-8)
+
+    x, _, _ = sl.gmres(A, b, tol=1e-14, reinicio=5, max_iter=10)
+    assert x is None
+
+
+def _operador_laplaciano_2d(m, deslocamento=0.0):
+    """Laplaciano 2D (5 pontos) como `OperadorLinear`, aplicado direto na malha."""
+    def matvec(v):
+        u = v.reshape(m, m)
+        r = (4.0 + deslocamento) * u
+        r[1:, :] -= u[:-1, :]
+        r[:-1, :] -= u[1:, :]
+        r[:, 1:] -= u[:, :-1]
+        r[:, :-1] -= u[:, 1:]
+        return r.ravel()
+    return sl.OperadorLinear((m * m, m * m), matvec, rmatvec=matvec,
+                             diagonal=np.full(m * m, 4.0 + deslocamento))
+
+
+def test_operador_linear_nos_metodos_iterativos():
+    """`OperadorLinear` (sem matriz montada) aceito pelos métodos iterativos e pelo resíduo.
+
+    - Mesmo produto que a matriz CSR equivalente; transposta via `rmatvec`
+    - Jacobi (com a diagonal do operador), CG precondicionado e GMRES convergem
+    - Gauss-Seidel e operadores sem diagonal/`rmatvec` são rejeitados com `ValueError`
+    """
+    m = 15
+    op = _operador_laplaciano_2d(m, deslocamento=1.0)
+    A = sl.MatrizCSR.de_densa(_poisson_2d(m).todensa() + np.eye(m * m))
+    v = np.random.default_rng(7).standard_normal(m * m)
+    assert np.allclose(op @ v, A @ v)
+    assert np.allclose(op.T @ v, A.rmatvec(v))
+    b = np.ones(m * m)
+    esperado = np.linalg.solve(A.todensa(), b)
+
+    x, _, _ = sl.jacobi(op, b, tol=1e-10)
+    assert np.allclose(x, esperado, atol=1e-8)
+    x, _, _ = sl.gradiente_conjugado(op, b, tol=1e-10, precondicionador='jacobi')
+    assert np.allclose(x, esperado, atol=1e-8)
+    x, _, _ = sl.gmres(op, b, tol=1e-10)
+    assert np.allclose(x, esperado, atol=1e-8)
+    assert np.linalg.norm(sl.calcular_residuo(op, x, b)) < 1e-8
+    assert np.allclose(sl.calcular_residuo(A, x, b), sl.calcular_residuo(op, x, b))
+
+    with pytest.raises(ValueError):
+        sl.gauss_seidel(op, b)
+    sem_extras = sl.OperadorLinear(op.shape, op.matvec)
+    with pytest.raises(ValueError):
+        sl.jacobi(sem_extras, b)
+    with pytest.raises(ValueError):
+        sem_extras.T
+    with pytest.raises(ValueError):
+        sl.calcular_residuo(op, np.ones(3), b)
+    dens = sl.OperadorLinear.de_matriz(A.todensa())
+    assert np.allclose(dens.rmatvec(v), A.todensa().T @ v)